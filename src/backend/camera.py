@@ -0,0 +1,84 @@
+import re
+import shutil
+import subprocess
+import cv2
+
+from utils.config import as_config
+
+# Modos probados cuando no hay v4l2-ctl para listar lo que ofrece el dispositivo
+PROBE_FPS = (120, 90, 60, 30)
+
+def fourcc_to_str(value):
+    v = int(value)
+    return "".join(chr((v >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00") or "?"
+
+def device_path(source):
+    return f"/dev/video{source}" if isinstance(source, int) else str(source)
+
+def list_v4l2_modes(source):
+    """Modos (fourcc, ancho, alto, fps) que reporta el driver vía v4l2-ctl. [] si no se puede."""
+    if not shutil.which("v4l2-ctl"): return []
+    try:
+        out = subprocess.run(["v4l2-ctl", "-d", device_path(source), "--list-formats-ext"],
+                             capture_output=True, text=True, timeout=3).stdout
+    except Exception:
+        return []
+
+    modes = []
+    fourcc = None; size = None
+    for line in out.splitlines():
+        m = re.search(r"\[\d+\]:\s*'(\w{4})'", line)
+        if m: fourcc = m.group(1); size = None; continue
+        m = re.search(r"Size:\s*\w+\s+(\d+)x(\d+)", line)
+        if m: size = (int(m.group(1)), int(m.group(2))); continue
+        m = re.search(r"\(([\d.]+)\s*fps\)", line)
+        if m and fourcc and size:
+            modes.append((fourcc, size[0], size[1], float(m.group(1))))
+    return modes
+
+def pick_best_mode(modes, width, height):
+    """El de más fps; a igualdad, la resolución más cercana a la pedida."""
+    if not modes: return None
+    return max(modes, key=lambda m: (m[3], -abs(m[1] * m[2] - width * height)))
+
+def _apply(cap, fourcc, width, height, fps, buffersize):
+    # En V4L2 el orden importa: primero el formato, luego resolución y fps
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    cap.set(cv2.CAP_PROP_FPS, fps)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, buffersize)
+
+def negotiated_mode(cap):
+    """Lo que el driver realmente aceptó (puede diferir de lo pedido)."""
+    return (fourcc_to_str(cap.get(cv2.CAP_PROP_FOURCC)),
+            int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            float(cap.get(cv2.CAP_PROP_FPS)), int(cap.get(cv2.CAP_PROP_BUFFERSIZE)))
+
+def open_camera(source, config):
+    """Abre la cámara por V4L2 y negocia formato, resolución, fps y cola de buffers según config."""
+    cap = cv2.VideoCapture(source, cv2.CAP_V4L2)
+    if not cap.isOpened(): return cap
+
+    cfg = as_config(config)
+    fourcc = cfg.cam_fourcc[:4].ljust(4)
+    width, height, fps, buffersize = cfg.cam_width, cfg.cam_height, cfg.cam_fps, cfg.cam_buffersize
+
+    if cfg.cam_auto_mode:
+        best = pick_best_mode(list_v4l2_modes(source), width, height)
+        if best:
+            fourcc, width, height, fps = best
+            print(f"[CAMERA] Auto: modo más rápido reportado {fourcc} {width}x{height} @ {fps:g} fps")
+        else:
+            # Sin lista del driver: probamos de mayor a menor y nos quedamos con el primero aceptado
+            for cand in PROBE_FPS:
+                _apply(cap, fourcc, width, height, cand, buffersize)
+                if cap.get(cv2.CAP_PROP_FPS) >= cand - 0.5:
+                    fps = cand; break
+
+    _apply(cap, fourcc, width, height, fps, buffersize)
+
+    got = negotiated_mode(cap)
+    print(f"[CAMERA] Pedido: {fourcc} {width}x{height} @ {fps:g} fps, buffers={buffersize}")
+    print(f"[CAMERA] Negociado: {got[0]} {got[1]}x{got[2]} @ {got[3]:g} fps, buffers={got[4]}", flush=True)
+    return cap
@@ -0,0 +1,112 @@
+"""
+Recarga en caliente de config1.json mientras se vuela.
+
+ConfigWatcher.poll() no bloquea: con inotify (vía ctypes, sin dependencias) lee los
+eventos pendientes del directorio de la config; sin inotify compara mtime/tamaño. El motor
+lo llama desde una tarea del runtime, así que los cambios se aplican en su propio hilo.
+
+Se vigila el directorio y no el archivo: save_config reemplaza el archivo con os.replace
+(IN_MOVED_TO) y los editores suelen hacer lo mismo, lo que invalidaría un watch sobre el
+archivo.
+"""
+import os
+import json
+import struct
+import ctypes
+import ctypes.util
+
+from utils.config import normalize, ConfigError, DEFAULT_CONFIG
+
+# Claves que RustEngine.update_config recibe (en este orden)
+ENGINE_KEYS = ('radius', 'curve', 'deadzone', 't_snap_axis', 'snap', 'outer')
+# Claves que sólo se leen al arrancar: un cambio queda guardado para el próximo vuelo
+RESTART_KEYS = ('t_mode', 't_record', 't_record_full', 't_push_pose', 't_service', 't_service_socket',
+                'rt_tracker_hz', 'hud_fps', 'hk_exit', 'hk_recenter')
+
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+_EVENT = struct.Struct('iIII')
+
+def engine_args(config):
+    return tuple(float(config.get(k, DEFAULT_CONFIG[k])) for k in ENGINE_KEYS)
+
+def _libc():
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1; libc.inotify_add_watch
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+class ConfigWatcher:
+    def __init__(self, path, current):
+        """current: config con la que arrancó el proceso (base para calcular cambios)."""
+        self.path = os.path.abspath(str(path))
+        self.dir, self.name = os.path.split(self.path)
+        self.current = dict(current)
+        self.fd = None
+        self._stamp = self._file_stamp()
+        self._pending = False
+        libc = _libc()
+        if libc is not None:
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd >= 0 and libc.inotify_add_watch(fd, self.dir.encode(), IN_CLOSE_WRITE | IN_MOVED_TO) >= 0:
+                self.fd = fd
+            elif fd >= 0:
+                os.close(fd)
+        print(f"[CONFIG] Recarga en caliente de {self.path} ({'inotify' if self.fd is not None else 'polling'})")
+
+    def _file_stamp(self):
+        try:
+            st = os.stat(self.path)
+            return st.st_mtime_ns, st.st_size
+        except OSError:
+            return None
+
+    def _touched(self):
+        if self.fd is None:
+            stamp = self._file_stamp()
+            changed, self._stamp = stamp != self._stamp, stamp
+            return changed
+        touched = False
+        while True:
+            try: data = os.read(self.fd, 4096)
+            except BlockingIOError: break
+            off = 0
+            while off + _EVENT.size <= len(data):
+                _, _, _, length = _EVENT.unpack_from(data, off)
+                name = data[off + _EVENT.size:off + _EVENT.size + length].split(b'\0', 1)[0]
+                if name.decode(errors='replace') == self.name: touched = True
+                off += _EVENT.size + length
+        return touched
+
+    def poll(self):
+        """
+        Devuelve (config nueva, claves cambiadas) si el archivo cambió y es válido; si no,
+        None. Un JSON a medio escribir o inválido se descarta y se reintenta en el próximo
+        aviso (o en el próximo poll, si ya había uno pendiente).
+        """
+        if self._touched(): self._pending = True
+        if not self._pending: return None
+        try:
+            with open(self.path) as f: new = json.load(f)
+        except (OSError, ValueError):
+            return None
+        self._pending = False
+        try:
+            merged = {**self.current, **normalize(new, self.name)}
+        except ConfigError as e:
+            print(f"[CONFIG] Recarga rechazada: {e}")
+            return None
+        changed = {k: v for k, v in merged.items() if self.current.get(k) != v}
+        if not changed: return None
+        self.current = merged
+        return merged, changed
+
+    def close(self):
+        if self.fd is not None:
+            try: os.close(self.fd)
+            except OSError: pass
+            self.fd = None
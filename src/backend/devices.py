@@ -0,0 +1,208 @@
+"""
+Descubrimiento de mouse y teclado sin abrir los dispositivos.
+
+- Las capacidades se leen de sysfs (/sys/class/input/eventN/device/capabilities/*), así
+  que escanear no abre ni deja abiertos los /dev/input/event*.
+- El mouse y el teclado elegidos se guardan por identidad estable (vendor/product/phys,
+  con el nombre como respaldo) en config/devices.json: el próximo arranque los reencuentra
+  aunque cambie el número de eventN.
+- HotplugMonitor avisa de conexiones/desconexiones (pyudev si está instalado; si no,
+  polling de /dev/input).
+"""
+import os
+import glob
+import json
+import time
+import struct
+import threading
+from collections import namedtuple
+from evdev import ecodes
+
+from utils.utils import DEVICES_FILE
+
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
+
+SYSFS_INPUT = '/sys/class/input'
+# Los bitmaps de sysfs son palabras 'unsigned long' en hex, la más significativa primero
+_LONG_BITS = struct.calcsize('l') * 8
+# Prioridad de marcas conocidas para el mouse (Gaming)
+GAMING_BRANDS = ("razer", "logitech", "corsair", "steelseries", "zowie", "benq")
+IGNORED_NAMES = ("virtual", "rust", "uinput")
+
+InputInfo = namedtuple('InputInfo', 'path name phys vendor product ev key rel')
+
+def _read(path, default=''):
+    try:
+        with open(path) as f: return f.read().strip()
+    except OSError:
+        return default
+
+def _bitmap(text):
+    """'120013 0 fffffffe' -> int con el bit N encendido si el código N está soportado."""
+    value = 0
+    for word in text.split():
+        value = (value << _LONG_BITS) | int(word, 16)
+    return value
+
+def _has(bits, code):
+    return bool(bits >> code & 1)
+
+def read_info(event_path, sysfs=SYSFS_INPUT):
+    """InputInfo de /dev/input/eventN leyendo sólo sysfs; None si no existe."""
+    node = os.path.join(sysfs, os.path.basename(event_path), 'device')
+    if not os.path.isdir(node): return None
+    caps = os.path.join(node, 'capabilities')
+    return InputInfo(
+        path=event_path,
+        name=_read(os.path.join(node, 'name')),
+        phys=_read(os.path.join(node, 'phys')),
+        vendor=_read(os.path.join(node, 'id', 'vendor')),
+        product=_read(os.path.join(node, 'id', 'product')),
+        ev=_bitmap(_read(os.path.join(caps, 'ev'), '0')),
+        key=_bitmap(_read(os.path.join(caps, 'key'), '0')),
+        rel=_bitmap(_read(os.path.join(caps, 'rel'), '0')),
+    )
+
+def scan(sysfs=SYSFS_INPUT):
+    infos = []
+    for node in sorted(glob.glob(os.path.join(sysfs, 'event*')), key=lambda p: int(p.rsplit('event', 1)[1] or 0)):
+        info = read_info('/dev/input/' + os.path.basename(node), sysfs)
+        if info: infos.append(info)
+    return infos
+
+def _ignored(info):
+    n = info.name.lower()
+    return any(word in n for word in IGNORED_NAMES)
+
+def is_mouse(info):
+    return (not _ignored(info) and _has(info.ev, ecodes.EV_REL) and _has(info.rel, ecodes.REL_X)
+            and _has(info.ev, ecodes.EV_KEY) and _has(info.key, ecodes.BTN_LEFT))
+
+def is_keyboard(info):
+    # Si el nombre contiene "mouse", probablemente es la interfaz RGB del teclado: la ignoramos
+    return (not _ignored(info) and _has(info.ev, ecodes.EV_KEY) and _has(info.key, ecodes.KEY_P)
+            and "mouse" not in info.name.lower())
+
+def mouse_score(info):
+    n = info.name.lower()
+    score = 0
+    if any(brand in n for brand in GAMING_BRANDS): score += 10
+    if "keyboard" in n or "alloy" in n: score -= 5  # Bajamos puntos a interfaces de teclado
+    return score
+
+def identity(info):
+    return {'name': info.name, 'vendor': info.vendor, 'product': info.product, 'phys': info.phys}
+
+def find_match(infos, ident, accept):
+    """
+    Dispositivo con la identidad guardada: mismo vendor/product y misma clase (accept);
+    entre varios, el del mismo phys (mismo puerto) y después el del mismo nombre.
+    """
+    if not ident: return None
+    best, best_rank = None, -1
+    for info in infos:
+        if info.vendor != ident.get('vendor') or info.product != ident.get('product') or not accept(info):
+            continue
+        rank = 2 * (info.phys == ident.get('phys')) + (info.name == ident.get('name'))
+        if rank > best_rank: best, best_rank = info, rank
+    return best
+
+def load_cache(path=DEVICES_FILE):
+    try:
+        with open(path) as f: return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(mouse, keyboard, path=DEVICES_FILE):
+    data = {'mouse': identity(mouse) if mouse else None, 'keyboard': identity(keyboard) if keyboard else None}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f: json.dump(data, f, indent=4)
+    except OSError as e:
+        print(f"[DEVICES] No se pudo guardar la caché de dispositivos: {e}")
+
+def find_devices(sysfs=SYSFS_INPUT, cache_path=DEVICES_FILE):
+    """(InputInfo del mouse, InputInfo del teclado); cualquiera puede ser None."""
+    infos = scan(sysfs)
+    cache = load_cache(cache_path)
+    mouse = find_match(infos, cache.get('mouse'), is_mouse)
+    keyboard = find_match(infos, cache.get('keyboard'), is_keyboard)
+    if mouse and keyboard:
+        print(f"  [OK] Caché: mouse {mouse.name} -> {mouse.path}, teclado {keyboard.name} -> {keyboard.path}")
+        return mouse, keyboard
+
+    if not mouse:
+        mice = sorted((i for i in infos if is_mouse(i)), key=mouse_score, reverse=True)
+        if mice:
+            mouse = mice[0]
+            print(f"  [OK] Mouse Seleccionado: {mouse.name} -> {mouse.path} (Score: {mouse_score(mouse)})")
+    if not keyboard:
+        keyboard = next((i for i in infos if is_keyboard(i)), None)
+        if keyboard: print(f"  [OK] Teclado Real: {keyboard.name} -> {keyboard.path}")
+    if mouse: save_cache(mouse, keyboard, cache_path)
+    return mouse, keyboard
+
+class HotplugMonitor:
+    """
+    Llama on_add(InputInfo) / on_remove(path) desde su propio hilo cuando aparece o
+    desaparece un /dev/input/eventN. Con pyudev el aviso llega cuando udev ya aplicó sus
+    reglas (permisos incluidos); sin pyudev se compara /dev/input cada poll_s segundos.
+    """
+    def __init__(self, on_add, on_remove, poll_s=0.25, sysfs=SYSFS_INPUT):
+        self.on_add = on_add
+        self.on_remove = on_remove
+        self.poll_s = poll_s
+        self.sysfs = sysfs
+        self.running = False
+        self.observer = None
+        self.thread = None
+
+    def start(self):
+        self.running = True
+        if pyudev is not None:
+            try:
+                monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+                monitor.filter_by('input')
+                self.observer = pyudev.MonitorObserver(monitor, callback=self._udev_event, name='hotplug')
+                self.observer.start()
+                print("[DEVICES] Hotplug: udev")
+                return
+            except Exception as e:
+                print(f"[DEVICES] udev no disponible ({e}): hotplug por polling")
+        self.thread = threading.Thread(target=self._poll, daemon=True)
+        self.thread.start()
+
+    def _udev_event(self, device):
+        path = device.device_node
+        if not path or not os.path.basename(path).startswith('event'): return
+        self._dispatch(device.action, path)
+
+    def _poll(self):
+        known = set(glob.glob('/dev/input/event*'))
+        while self.running:
+            time.sleep(self.poll_s)
+            current = set(glob.glob('/dev/input/event*'))
+            for path in sorted(known - current): self._dispatch('remove', path)
+            for path in sorted(current - known): self._dispatch('add', path)
+            known = current
+
+    def _dispatch(self, action, path):
+        if not self.running: return
+        try:
+            if action == 'add':
+                info = read_info(path, self.sysfs)
+                if info: self.on_add(info)
+            elif action == 'remove':
+                self.on_remove(path)
+        except Exception as e:
+            print(f"[DEVICES] Error en callback de hotplug ({action} {path}): {e}")
+
+    def stop(self):
+        self.running = False
+        if self.observer:
+            try: self.observer.stop()
+            except: pass
+            self.observer = None
@@ -0,0 +1,113 @@
+import select
+import threading
+from evdev import InputDevice, ecodes
+
+# Grupos de modificadores: basta con cualquiera de las dos teclas (izquierda o derecha)
+MODIFIERS = {
+    'alt':   (ecodes.KEY_LEFTALT, ecodes.KEY_RIGHTALT),
+    'ctrl':  (ecodes.KEY_LEFTCTRL, ecodes.KEY_RIGHTCTRL),
+    'shift': (ecodes.KEY_LEFTSHIFT, ecodes.KEY_RIGHTSHIFT),
+    'win':   (ecodes.KEY_LEFTMETA, ecodes.KEY_RIGHTMETA),
+}
+MODIFIERS['meta'] = MODIFIERS['super'] = MODIFIERS['windows'] = MODIFIERS['win']
+MODIFIER_CODES = {c for group in MODIFIERS.values() for c in group}
+
+# Nombres cómodos -> keycode evdev ('<' es la tecla ISO junto al shift izquierdo)
+KEY_ALIASES = {
+    '<': ecodes.KEY_102ND, '>': ecodes.KEY_102ND,
+    'esc': ecodes.KEY_ESC, 'enter': ecodes.KEY_ENTER, 'space': ecodes.KEY_SPACE,
+}
+
+def parse_key(token):
+    token = token.strip().lower()
+    if token in KEY_ALIASES: return KEY_ALIASES[token]
+    if token.isdigit(): return int(token)  # keycode evdev directo (86 = 102ND, 43 = BACKSLASH)
+    code = ecodes.ecodes.get('KEY_' + token.upper())
+    if code is None: raise ValueError(f"Tecla desconocida: '{token}'")
+    return code
+
+def parse_binding(spec):
+    """'alt+p' o alternativas 'alt+<, win+<' -> [(modificadores, keycode), ...]"""
+    chords = []
+    for alt in str(spec).split(','):
+        parts = [p for p in alt.strip().lower().split('+') if p]
+        if not parts: continue
+        mods = []
+        for p in parts[:-1]:
+            if p not in MODIFIERS: raise ValueError(f"Modificador desconocido: '{p}'")
+            mods.append(MODIFIERS[p])
+        chords.append((tuple(mods), parse_key(parts[-1])))
+    return chords
+
+def chord_pressed(chords, is_pressed):
+    """True si alguna alternativa está presionada; is_pressed(keycode) consulta una tecla."""
+    return any(is_pressed(key) and all(any(is_pressed(m) for m in group) for group in mods)
+               for mods, key in chords)
+
+class HotkeyListener:
+    """
+    Lee el teclado evdev real en su propio hilo (sin grab: el teclado sigue funcionando
+    normal) y dispara callbacks apenas la tecla principal del atajo baja con sus
+    modificadores presionados.
+    """
+    def __init__(self, kb_path, bindings, callbacks):
+        self.kb_path = kb_path
+        self.callbacks = callbacks
+        self.chords = {name: parse_binding(spec) for name, spec in bindings.items() if name in callbacks}
+        self.pressed = set()
+        self.running = False
+        self.alive = False
+        self.dev = None
+        self.thread = None
+
+    def start(self):
+        try:
+            self.dev = InputDevice(self.kb_path)
+        except OSError as e:
+            print(f"[HOTKEYS] No se pudo abrir {self.kb_path}: {e}")
+            return False
+        # Teclas ya presionadas al abrir (p. ej. ALT sostenido durante el hotplug): sin esto el
+        # atajo no funcionaría hasta soltarlas y volver a presionarlas
+        try: self.pressed = set(self.dev.active_keys())
+        except OSError: self.pressed = set()
+        self.running = True
+        self.alive = True
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+        return True
+
+    def _matches(self, code):
+        for name, chords in self.chords.items():
+            for mods, key in chords:
+                if key == code and all(any(m in self.pressed for m in group) for group in mods):
+                    yield name; break
+
+    def _loop(self):
+        try:
+            while self.running:
+                # select con timeout para poder detener el hilo limpio
+                r, _, _ = select.select([self.dev.fd], [], [], 0.2)
+                if not r: continue
+                for ev in self.dev.read():
+                    if ev.type != ecodes.EV_KEY: continue
+                    if ev.value == 1:
+                        self.pressed.add(ev.code)
+                        if ev.code in MODIFIER_CODES: continue
+                        for name in list(self._matches(ev.code)):
+                            try: self.callbacks[name]()
+                            except Exception as e: print(f"[HOTKEYS] Error en '{name}': {e}")
+                    elif ev.value == 0:
+                        self.pressed.discard(ev.code)
+        except OSError as e:
+            # Teclado desconectado: el motor vuelve al polling
+            print(f"[HOTKEYS] Teclado perdido: {e}")
+        finally:
+            self.alive = False
+
+    def stop(self):
+        self.running = False
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=1.0)
+        if self.dev:
+            try: self.dev.close()
+            except: pass
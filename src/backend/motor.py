@@ -1,171 +1,150 @@
 import time
-import keyboard
-import rust_motor 
-from evdev import InputDevice, list_devices, ecodes
 import sys
 import traceback
-import pyautogui
 import os
+import threading
 
-from backend.tracker import HeadTracker
-from frontend.hud import JoystickHUD
+from backend.native import RustEngine
+from backend import devices
+from backend.config_watch import ConfigWatcher, ENGINE_KEYS, RESTART_KEYS, engine_args
+from utils.utils import CONFIG_FILE
+from utils.config import as_config
+from backend.hotkeys import HotkeyListener, parse_binding, chord_pressed
+from backend.runtime import MotorRuntime
+from frontend.hud_process import HudProcess
+from utils.startup import mark
+# Importaciones pesadas diferidas: backend.tracker (cv2 + mediapipe) en run(), pyautogui en
+# __init__ y keyboard sólo si hace falta el polling. Así el proceso del HUD (spawn re-importa
+# motor_app) no carga MediaPipe.
 
 class JoystickBackend:
-    def __init__(self, config):
+    def __init__(self, config, tracker=None, devices=None):
+        """
+        tracker: HeadTracker ya cargado (worker caliente). No se detiene en cleanup().
+        devices: (mouse_path, kb_path) de un escaneo previo; se reescanea si ya no existen.
+        """
         self.config = config
+        # Snapshot completo con el que arranca el vuelo: las RESTART_KEYS sólo se leen de aquí
+        self.cfg = as_config(config)
+        self.external_tracker = tracker
+        self.devices = devices
+        import pyautogui
         self.screen_w, self.screen_h = pyautogui.size()
         
         print(f"[MOTOR] Preparando RustEngine asíncrono...", flush=True)
-        self.engine = rust_motor.RustEngine()
+        if RustEngine is None:
+            raise RuntimeError("rust_motor no está compilado: el motor de vuelo necesita RustEngine")
+        self.engine = RustEngine()
         
-        self.engine.update_config(
-            float(config['radius']), 
-            float(config['curve']), 
-            float(config['deadzone']),
-            float(config.get('t_snap_axis', 0.1)), 
-            float(config.get('snap', 0.05)), 
-            float(config.get('outer', 0.0))
-        )
+        self.engine.update_config(*engine_args(config))
         
         self.tracker = None
         self.hud = None 
+        self.hotkeys = None
+        self.runtime = None
+        self._tracker_thread = None
+        self._closing = False
+        self.hotplug = None
+        self.config_watch = None
+        self._mouse_id = None
+        self._kb_id = None
+        # (ruta, reintentar_desde, límite) mientras se espera a que Rust abra el mouse reconectado
+        self._mouse_pending = None
+        # Plazo para que Rust abra el mouse al arrancar; si no lo logra, el vuelo no sigue
+        self._mouse_deadline = None
+        # Atajos configurados ya parseados para el polling (se arman en el primer poll)
+        self._poll_chords = None
+        self.exit_event = threading.Event()
 
     def find_devices(self):
-        print("\n--- BUSCANDO HARDWARE (HEURÍSTICA V2) ---", flush=True)
-        mouse_path = None
-        kb_path = None
-        
-        try:
-            device_paths = list_devices()
-        except Exception as e:
-            print(f"❌ Error al listar dispositivos: {e}")
-            return None, None
-
-        # Prioridad de marcas conocidas para el mouse (Gaming)
-        gaming_brands = ["razer", "logitech", "corsair", "steelseries", "zowie", "benq"]
-
-        found_mice = []
-
-        for path in device_paths:
-            try:
-                dev = InputDevice(path)
-                n = dev.name.lower()
-                
-                if "virtual" in n or "rust" in n or "uinput" in n:
-                    continue
-                
-                caps = dev.capabilities()
-
-                # 1. Identificar Teclado REAL (Debe tener teclas estándar y NO ser mouse)
-                if not kb_path:
-                    if ecodes.EV_KEY in caps and ecodes.KEY_P in caps[ecodes.EV_KEY]:
-                        # Si el nombre contiene "mouse", probablemente es la interfaz RGB del teclado, la ignoramos
-                        if "mouse" not in n:
-                            kb_path = path
-                            print(f"  [OK] Teclado Real: {dev.name} -> {path}")
-
-                # 2. Identificar Mouses potenciales
-                if ecodes.EV_REL in caps and ecodes.REL_X in caps[ecodes.EV_REL]:
-                    if ecodes.EV_KEY in caps and ecodes.BTN_LEFT in caps[ecodes.EV_KEY]:
-                        # Puntuamos el mouse: si es de marca gaming, va primero
-                        score = 0
-                        if any(brand in n for brand in gaming_brands): score += 10
-                        if "keyboard" in n or "alloy" in n: score -= 5 # Bajamos puntos a interfaces de teclado
-                        
-                        found_mice.append({
-                            'path': path,
-                            'name': dev.name,
-                            'score': score
-                        })
-
-            except:
-                continue
-
-        # Seleccionamos el mejor mouse basado en el score
-        if found_mice:
-            # Ordenar por score descendente
-            found_mice.sort(key=lambda x: x['score'], reverse=True)
-            best_mouse = found_mice[0]
-            mouse_path = best_mouse['path']
-            print(f"  [OK] Mouse Seleccionado: {best_mouse['name']} -> {mouse_path} (Score: {best_mouse['score']})")
-            
+        """Escaneo por sysfs (sin abrir dispositivos) con caché por identidad en config/devices.json."""
+        print("\n--- BUSCANDO HARDWARE (SYSFS) ---", flush=True)
+        mouse, kb = devices.find_devices()
+        self._mouse_id = devices.identity(mouse) if mouse else None
+        self._kb_id = devices.identity(kb) if kb else None
+        if mouse and not kb:
             # Si el teclado falló, usamos el mouse como respaldo para los eventos
-            if not kb_path:
-                kb_path = mouse_path
-                print(f"  [!] Usando mouse como fuente de teclado (Fallback)")
-
-        return mouse_path, kb_path
+            print(f"  [!] Usando mouse como fuente de teclado (Fallback)")
+            return mouse.path, mouse.path
+        return (mouse.path if mouse else None), (kb.path if kb else None)
 
     def run(self):
         if os.name == 'posix':
             os.system("stty -echo")
 
-        # Buscamos el mouse (kb_path ya no es necesario aquí)
-        mouse_path, _ = self.find_devices()
+        if self.devices and all(p and os.path.exists(p) for p in self.devices):
+            mouse_path, kb_path = self.devices
+            print(f"[MOTOR] Dispositivos en caché: mouse {mouse_path}, teclado {kb_path}", flush=True)
+            mouse, kb = devices.read_info(mouse_path), devices.read_info(kb_path)
+            self._mouse_id = devices.identity(mouse) if mouse else None
+            self._kb_id = devices.identity(kb) if kb else None
+        else:
+            mouse_path, kb_path = self.find_devices()
+            self.devices = (mouse_path, kb_path)
         
         if not mouse_path:
             print("❌ ERROR: No se encontró un Mouse compatible.")
             return "EXIT"
 
-        # Inicialización de HUD y Tracker
-        try: self.hud = JoystickHUD(self.config['radius'])
-        except: pass
-        self.tracker = HeadTracker(source=0, config=self.config, show_debug=False)
+        # Atajos por eventos del teclado evdev. Si el "teclado" es el propio mouse
+        # (Rust lo captura con grab) no veríamos sus eventos: usamos polling.
+        self._start_hotkeys(kb_path, mouse_path)
+
+        # Inicialización por etapas: HUD (otro proceso) -> Rust (vuelo listo) -> Tracker (en
+        # segundo plano: cargar MediaPipe y abrir la cámara tarda segundos y el stick ya funciona)
+        try: self.hud = HudProcess(self.cfg.radius, self.cfg.hud_fps)
+        except Exception as e: print(f"[MOTOR] HUD desactivado: {e}", flush=True)
 
         print(f"\n>>> INICIANDO HILO DE ALTO RENDIMIENTO (RUST) <<<", flush=True)
         try:
             # Iniciamos Rust (asegúrate de que la firma de start en engine.rs coincida)
             self.engine.start(str(mouse_path), float(self.screen_w), float(self.screen_h))
             print("    [HILO RUST LANZADO EXITOSAMENTE]", flush=True)
+            self._mouse_deadline = time.perf_counter() + 1.0
         except Exception as e:
             print(f"❌ FATAL: Rust rechazó iniciar: {e}")
             return "EXIT"
+        mark("motor_flight_ready")
+
+        # Hotplug: un mouse/teclado reconectado se re-engancha sin reiniciar el motor
+        self.hotplug = devices.HotplugMonitor(self._on_device_added, self._on_device_removed)
+        self.hotplug.start()
+
+        # El tracker empuja cada pose directo a Rust: el bucle de control ya no está en medio
+        push_pose = self.cfg.t_push_pose
+        if self.external_tracker:
+            self._adopt_tracker(self.external_tracker, push_pose)
+        else:
+            self._tracker_thread = threading.Thread(target=self._start_tracker, args=(push_pose,), daemon=True)
+            self._tracker_thread.start()
+
+        print(f"    [{self.cfg.hk_exit.upper()}] Configurar | [{self.cfg.hk_recenter.split(',')[0].strip().upper()}] Recentrar", flush=True)
+
+        # Cada preocupación corre como su propia tarea, a su propia frecuencia:
+        # un HUD lento ya no frena el reenvío del tracker ni los atajos.
+        self.runtime = MotorRuntime()
+        self._last_seq = -1
+        self._last_recenter = 0.0
+        if self.exit_event.is_set(): self.runtime.stop("RESTART")
+        self.runtime.every('liveness', 20, self._check_engine)
+        if not push_pose:
+            self.runtime.every('tracker', self.cfg.rt_tracker_hz, self._forward_pose)
+        if self.hud:
+            self.runtime.every('hud', self.cfg.hud_fps, self._draw_hud)
+        # Polling de respaldo: sólo actúa si no hay listener evdev (o se desconectó)
+        self.runtime.every('hotkeys', 50, self._poll_hotkeys)
+        # Recarga en caliente: editar config1.json (o guardar desde otra GUI) ajusta el vuelo sin salir
+        if self.cfg.live_reload:
+            self.config_watch = ConfigWatcher(CONFIG_FILE, self.config)
+            self.runtime.every('config', 10, self._poll_config)
 
-        print("    [ALT+P] Configurar | [ALT+<] Recentrar", flush=True)
-        
         try:
-            while True:
-                # --- 1. ATAJOS (Gestionados por Python) ---
-                
-                # Salida: ALT + P
-                if keyboard.is_pressed('alt') and keyboard.is_pressed('p'):
-                    print("[MOTOR] Solicitando salida...", flush=True)
-                    self.engine.request_exit()
-                    time.sleep(0.2)
-                    return "RESTART"
-                
-                # Recentrar: (ALT o WIN) + <
-                # Usamos scancode 86 (teclado ISO/Español) y 43 (teclado US) como enteros
-                try:
-                    is_alt_win = keyboard.is_pressed('alt') or keyboard.is_pressed('windows')
-                    # Probamos la tecla física directa
-                    is_recenter_key = keyboard.is_pressed('<') or keyboard.is_pressed(86) or keyboard.is_pressed(43)
-                    
-                    if is_alt_win and is_recenter_key:
-                        self.engine.recenter()
-                        if self.tracker: 
-                            self.tracker.recenter()
-                        print("[MOTOR] Recentrado.", flush=True)
-                        time.sleep(0.2)
-                except:
-                    pass # Evitar que un error de mapeo de tecla rompa el bucle
-
-                # Verificar si Rust sigue vivo
-                if not self.engine.is_running(): 
-                    return "RESTART"
-                
-                # --- 2. TRACKER -> RUST ---
-                hy, hp = 0.0, 0.0
-                if self.tracker and self.tracker.running:
-                    hy, hp = self.tracker.get_axes()
-                    self.engine.update_tracker(float(hy), float(hp))
-
-                # --- 3. RUST -> HUD ---
-                if self.hud:
-                    lx, ly, lt, lr, snap, dead = self.engine.get_hud_data()
-                    self.hud.update(lx, ly, lt, lr, hy, hp, dead, snap)
-                
-                time.sleep(0.01)
+            result = self.runtime.run()
+            if result == "RESTART" and self.exit_event.is_set():
+                print("[MOTOR] Solicitando salida...", flush=True)
+                self.engine.request_exit()
+                time.sleep(0.2)
+            return result or "EXIT"
 
         except KeyboardInterrupt:
             print("\n[MOTOR] Interrupción (Ctrl+C)", flush=True)
@@ -175,15 +154,196 @@ class JoystickBackend:
             traceback.print_exc()
             return "EXIT"
         finally:
+            print("[MOTOR] Tareas del runtime:\n" + self.runtime.report(), flush=True)
             self.cleanup()
 
+    def _start_hotkeys(self, kb_path, mouse_path):
+        if not kb_path or kb_path == mouse_path: return
+        if self.hotkeys: self.hotkeys.stop()
+        self.hotkeys = HotkeyListener(
+            kb_path,
+            {'exit': self.cfg.hk_exit, 'recenter': self.cfg.hk_recenter},
+            {'exit': self._request_exit, 'recenter': self._recenter}
+        )
+        if not self.hotkeys.start(): self.hotkeys = None
+
+    def _on_device_added(self, info):
+        """Hilo del HotplugMonitor: sólo reacciona a los dispositivos que ya habíamos elegido."""
+        if self._closing: return
+        mouse_path, kb_path = self.devices
+        if devices.find_match([info], self._mouse_id, devices.is_mouse):
+            if info.path == mouse_path and self.engine.mouse_attached(): return
+            print(f"[MOTOR] Mouse reconectado: {info.name} -> {info.path}", flush=True)
+            self.devices = (info.path, info.path if kb_path == mouse_path else kb_path)
+            self._attach_mouse(info.path)
+        elif kb_path != mouse_path and devices.find_match([info], self._kb_id, devices.is_keyboard):
+            if info.path == kb_path and self.hotkeys and self.hotkeys.alive: return
+            print(f"[MOTOR] Teclado reconectado: {info.name} -> {info.path}", flush=True)
+            self.devices = (mouse_path, info.path)
+            self._start_hotkeys(info.path, mouse_path)
+
+    def _on_device_removed(self, path):
+        if path == self.devices[0]:
+            print("[MOTOR] Mouse desconectado: esperando reconexión...", flush=True)
+
+    def _attach_mouse(self, path):
+        # Con polling el nodo puede aparecer antes de que udev ajuste permisos: reintentamos unos segundos
+        now = time.perf_counter()
+        self._mouse_deadline = None
+        self._mouse_pending = (path, now + 0.25, now + 3.0)
+        self.engine.attach_mouse(path)
+
+    def _start_tracker(self, push_pose):
+        try:
+            from backend.tracker_service import open_tracker
+            tracker = open_tracker(self.config, show_debug=False)
+        except Exception as e:
+            print(f"[MOTOR] Tracker no disponible: {e}", flush=True)
+            return
+        if self._closing:
+            tracker.stop()
+            return
+        self._adopt_tracker(tracker, push_pose)
+
+    def _adopt_tracker(self, tracker, push_pose):
+        if tracker is self.external_tracker:
+            # Tracker caliente: trae la config de la GUI; en vuelo sin ventana de debug
+            tracker.update_config(self.config)
+            tracker.set_debug(False)
+        if push_pose and tracker.running:
+            tracker.set_sink(self.engine)
+        self.tracker = tracker
+        mark("motor_tracker")
+
+    def _request_exit(self):
+        """Llamado desde el hilo de atajos o desde el polling."""
+        self.exit_event.set()
+        if self.runtime: self.runtime.stop("RESTART")
+
+    def _check_engine(self):
+        # Rust murió: reiniciamos. Un mouse desconectado ya no lo mata (espera la reconexión).
+        if not self.engine.is_running():
+            self.runtime.stop("RESTART")
+        # Rust abre el mouse en su hilo: si al arrancar no lo consiguió (permisos, ocupado) el
+        # stick quedaría muerto sin aviso
+        if self._mouse_deadline:
+            if self.engine.mouse_attached():
+                self._mouse_deadline = None
+            elif time.perf_counter() > self._mouse_deadline:
+                print(f"❌ ERROR: Rust no pudo abrir el mouse {self.devices[0]} (¿permisos de /dev/input?)", flush=True)
+                self._mouse_deadline = None
+                self.runtime.stop("EXIT")
+                return
+        pending = self._mouse_pending
+        if pending:
+            path, retry_at, give_up = pending
+            now = time.perf_counter()
+            if self.engine.mouse_attached():
+                print(f"[MOTOR] Mouse re-enganchado en {path}", flush=True)
+                self._mouse_pending = None
+            elif now > give_up:
+                print(f"[MOTOR] No se pudo abrir {path}; se esperará otra conexión.", flush=True)
+                self._mouse_pending = None
+            elif now > retry_at:
+                self._mouse_pending = (path, now + 0.25, give_up)
+                self.engine.attach_mouse(path)
+        # Si el HUD se cae, el vuelo sigue sin él
+        if self.hud and not self.hud.alive:
+            print("[MOTOR] El proceso del HUD terminó; se continúa sin HUD.", flush=True)
+            self.hud.close()
+            self.hud = None
+
+    def _poll_config(self):
+        update = self.config_watch.poll()
+        if not update: return
+        new, changed = update
+        self.config.update(new)
+        # Los 6 parámetros del stick entran juntos bajo un solo lock de escritura en Rust
+        if any(k in changed for k in ENGINE_KEYS):
+            self.engine.update_config(*engine_args(self.config))
+        tracker_keys = {k: v for k, v in changed.items() if k.startswith('t_') and k not in RESTART_KEYS}
+        if tracker_keys and self.tracker:
+            self.tracker.update_config(tracker_keys)
+        later = [k for k in changed if k in RESTART_KEYS or k.startswith('cam_')]
+        print(f"[CONFIG] Aplicado en vuelo: {', '.join(k for k in changed if k not in later) or '-'}", flush=True)
+        if later: print(f"[CONFIG] Requieren reiniciar el vuelo: {', '.join(later)}", flush=True)
+
+    def _forward_pose(self):
+        # Sin sink directo: sólo empujamos a Rust si llegó un frame nuevo con cara
+        if not (self.tracker and self.tracker.running): return
+        pose = self.tracker.get_snapshot()
+        if pose.seq == self._last_seq: return
+        self._last_seq = pose.seq
+        if pose.face: self.engine.update_tracker(float(pose.yaw), float(pose.pitch))
+
+    def _draw_hud(self):
+        """Sólo publica el estado en memoria compartida; el proceso del HUD redibuja a su ritmo."""
+        if not self.hud: return
+        hy, hp = 0.0, 0.0
+        if self.tracker and self.tracker.running:
+            pose = self.tracker.get_snapshot()
+            hy, hp = pose.yaw, pose.pitch
+        lx, ly, lt, lr, snap, dead = self.engine.get_hud_data()
+        self.hud.update(lx, ly, lt, lr, hy, hp, dead, snap)
+
+    def _recenter(self):
+        self.engine.recenter()
+        if self.tracker: 
+            self.tracker.recenter()
+        print("[MOTOR] Recentrado.", flush=True)
+
+    def _poll_hotkeys(self):
+        """Respaldo sin evdev: consulta el estado de teclas con la librería 'keyboard'."""
+        if self.hotkeys and self.hotkeys.alive: return
+        import keyboard
+        if self._poll_chords is None:
+            try:
+                self._poll_chords = {'exit': parse_binding(self.cfg.hk_exit),
+                                     'recenter': parse_binding(self.cfg.hk_recenter)}
+            except ValueError as e:
+                print(f"[HOTKEYS] Atajo inválido, polling desactivado: {e}", flush=True)
+                self._poll_chords = {}
+        if not self._poll_chords: return
+
+        # En Linux 'keyboard' identifica las teclas por el mismo keycode evdev que parse_binding
+        try:
+            if chord_pressed(self._poll_chords['exit'], keyboard.is_pressed):
+                self._request_exit()
+                return
+            # Antirrebote sin dormir: un sleep aquí congelaría todas las tareas del runtime
+            if chord_pressed(self._poll_chords['recenter'], keyboard.is_pressed) \
+                    and time.perf_counter() - self._last_recenter > 0.2:
+                self._last_recenter = time.perf_counter()
+                self._recenter()
+        except:
+            pass # Evitar que un error de mapeo de tecla rompa el bucle
+
     def cleanup(self):
+        # run() limpia en su finally y quien lo llamó puede volver a hacerlo: sólo la primera vez cuenta
+        if self._closing: return
+        self._closing = True
         if os.name == 'posix':
             os.system("stty echo")
+        if self.hotplug:
+            self.hotplug.stop()
+            self.hotplug = None
+        if self.config_watch:
+            self.config_watch.close()
+            self.config_watch = None
+        if self.hotkeys:
+            self.hotkeys.stop()
+            self.hotkeys = None
+        if self.tracker:
+            self.tracker.set_sink(None)
         if self.engine:
             self.engine.stop()
-        if self.tracker: 
+        # Si el tracker aún está arrancando, lo esperamos un poco: se detendrá solo al ver _closing
+        if self._tracker_thread and self._tracker_thread.is_alive():
+            self._tracker_thread.join(timeout=5.0)
+        if self.tracker and self.tracker is not self.external_tracker: 
             self.tracker.stop()
+        self.tracker = None
         if self.hud:
             try: self.hud.close()
-            except: pass
\ No newline at end of file
+            except: pass
+            self.hud = None
\ No newline at end of file
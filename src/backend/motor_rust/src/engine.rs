@@ -7,6 +7,7 @@ use std::path::PathBuf;
 use evdev::{Device, EventType, RelativeAxisCode, InputEvent, AbsoluteAxisCode, SynchronizationCode};
 use crate::state::SharedState;
 use crate::device::create_virtual_joystick;
+use crate::physics::stick_response;
 
 #[pyclass]
 pub struct RustEngine {
@@ -32,10 +33,10 @@ impl RustEngine {
         running_clone.store(true, Ordering::SeqCst);
 
         let handle = thread::spawn(move || {
-            let mut mouse_dev = Device::open(PathBuf::from(&mouse_path)).expect("Fail mouse");
-            let _ = mouse_dev.grab();
-            mouse_dev.set_nonblocking(true).ok();
-            
+            // Sin mouse el hilo no muere: sigue emitiendo (stick quieto + cabeza) y espera attach_mouse
+            let mut mouse_dev = open_mouse(&mouse_path);
+            if let Ok(mut s) = state_clone.write() { s.mouse_ok = mouse_dev.is_some(); }
+
             let mut joy_out = create_virtual_joystick().expect("Fail uinput");
             let mut v_x = screen_w / 2.0;
             let mut v_y = screen_h / 2.0;
@@ -46,42 +47,53 @@ impl RustEngine {
 
             while running_clone.load(Ordering::SeqCst) {
                 // A. REVISAR PETICIONES DE PYTHON (Lock rápido)
-                let (must_recenter, must_exit) = {
+                let (must_recenter, must_exit, new_mouse) = {
                     let mut s = state_clone.write().unwrap();
                     let r = s.recenter_req; s.recenter_req = false;
-                    (r, s.exit_req)
+                    (r, s.exit_req, s.mouse_req.take())
                 };
 
                 if must_exit { break; }
                 if must_recenter { v_x = center_x; v_y = center_y; rudder = 0.0; }
+                if let Some(path) = new_mouse {
+                    if let Some(mut old) = mouse_dev.take() { let _ = old.ungrab(); }
+                    mouse_dev = open_mouse(&path);
+                    let ok = mouse_dev.is_some();
+                    if let Ok(mut s) = state_clone.write() { s.mouse_ok = ok; }
+                }
 
                 // B. LEER MOUSE
-                if let Ok(events) = mouse_dev.fetch_events() {
-                    for ev in events {
-                        if ev.event_type() == EventType::RELATIVE {
-                            let c = ev.code(); let val = ev.value() as f32;
-                            if c == RelativeAxisCode::REL_X.0 { v_x = (v_x + val).clamp(0.0, screen_w); }
-                            else if c == RelativeAxisCode::REL_Y.0 { v_y = (v_y + val).clamp(0.0, screen_h); }
-                            else if c == RelativeAxisCode::REL_WHEEL.0 { throttle = (throttle + val * 0.05).clamp(-1.0, 1.0); }
-                            else if c == RelativeAxisCode::REL_HWHEEL.0 { rudder = (rudder + val * 0.20).clamp(-1.0, 1.0); }
+                let mut lost = false;
+                if let Some(dev) = mouse_dev.as_mut() {
+                    match dev.fetch_events() {
+                        Ok(events) => {
+                            for ev in events {
+                                if ev.event_type() == EventType::RELATIVE {
+                                    let c = ev.code(); let val = ev.value() as f32;
+                                    if c == RelativeAxisCode::REL_X.0 { v_x = (v_x + val).clamp(0.0, screen_w); }
+                                    else if c == RelativeAxisCode::REL_Y.0 { v_y = (v_y + val).clamp(0.0, screen_h); }
+                                    else if c == RelativeAxisCode::REL_WHEEL.0 { throttle = (throttle + val * 0.05).clamp(-1.0, 1.0); }
+                                    else if c == RelativeAxisCode::REL_HWHEEL.0 { rudder = (rudder + val * 0.20).clamp(-1.0, 1.0); }
+                                }
+                            }
                         }
+                        // ENODEV (19): el mouse se desconectó. WouldBlock es lo normal sin eventos.
+                        Err(e) => lost = e.raw_os_error() == Some(19),
                     }
                 }
+                if lost {
+                    eprintln!("[RUST] Mouse desconectado: esperando reconexión");
+                    mouse_dev = None;
+                    if let Ok(mut s) = state_clone.write() { s.mouse_ok = false; }
+                }
 
                 // C. CÁLCULO FÍSICO
-                let (radius, curve, deadzone, hy, hp) = {
+                let (radius, curve, deadzone, outer, hy, hp) = {
                     let s = state_clone.read().unwrap();
-                    (s.radius, s.curve, s.deadzone, s.head_yaw, s.head_pitch)
+                    (s.radius, s.curve, s.deadzone, s.outer, s.head_yaw, s.head_pitch)
                 };
                 let dx = v_x - center_x; let dy = v_y - center_y;
-                let rx = dx / radius; let ry = dy / radius;
-                let mag = rx.hypot(ry);
-                let in_d = mag < deadzone;
-                let mut fx = 0.0; let mut fy = 0.0;
-                if !in_d {
-                    fx = rx.abs().min(1.0).powf(curve).copysign(rx);
-                    fy = ry.abs().min(1.0).powf(curve).copysign(ry);
-                }
+                let (fx, fy, in_d, _) = stick_response(dx, dy, radius, curve, deadzone, outer);
 
                 // D. EMITIR
                 fn raw(v: f32) -> i32 { (v * 32767.0) as i32 }
@@ -102,7 +114,7 @@ impl RustEngine {
                 }
                 thread::sleep(Duration::from_micros(900));
             }
-            let _ = mouse_dev.ungrab();
+            if let Some(mut dev) = mouse_dev { let _ = dev.ungrab(); }
             running_clone.store(false, Ordering::SeqCst);
         });
         self.thread_handle = Some(handle);
@@ -140,4 +152,24 @@ impl RustEngine {
     fn request_exit(&mut self) {
         if let Ok(mut s) = self.state.write() { s.exit_req = true; }
     }
+
+    /// Cambia el mouse en caliente (reconexión): el hilo lo abre en su próxima vuelta.
+    fn attach_mouse(&mut self, path: String) {
+        if let Ok(mut s) = self.state.write() { s.mouse_req = Some(path); }
+    }
+
+    fn mouse_attached(&self) -> bool {
+        self.state.read().map(|s| s.mouse_ok).unwrap_or(false)
+    }
+}
+
+fn open_mouse(path: &str) -> Option<Device> {
+    match Device::open(PathBuf::from(path)) {
+        Ok(mut dev) => {
+            let _ = dev.grab();
+            dev.set_nonblocking(true).ok();
+            Some(dev)
+        }
+        Err(e) => { eprintln!("[RUST] No se pudo abrir el mouse {}: {}", path, e); None }
+    }
 }
\ No newline at end of file
@@ -1,4 +1,26 @@
+use std::borrow::Cow;
 use pyo3::prelude::*;
+use pyo3::buffer::PyBuffer;
+
+/// Modelo de respuesta del stick: offset en píxeles -> (x, y, en_deadzone, pegado_a_eje).
+/// Es la única implementación: la usan el hilo del motor, calculate y calculate_batch.
+/// El magnetismo a los ejes no forma parte del modelo: pegado_a_eje es siempre false.
+#[inline]
+pub fn stick_response(dx: f32, dy: f32, radius: f32, curve: f32, deadzone: f32, outer: f32) -> (f32, f32, bool, bool) {
+    // El recorte duro no cambia la salida (ya se satura en 1.0), sólo acota rx/ry
+    let hard = radius + outer;
+    let rx = dx.abs().min(hard).copysign(dx) / radius;
+    let ry = dy.abs().min(hard).copysign(dy) / radius;
+
+    let mag = rx.hypot(ry);
+    let in_d = mag < deadzone;
+    let mut fx = 0.0; let mut fy = 0.0;
+    if !in_d {
+        fx = rx.abs().min(1.0).powf(curve).copysign(rx);
+        fy = ry.abs().min(1.0).powf(curve).copysign(ry);
+    }
+    (fx, fy, in_d, false)
+}
 
 #[pyclass]
 #[derive(Clone)]
@@ -20,16 +42,31 @@ impl RustPhysics {
     }
 
     pub fn calculate(&self, dx: f32, dy: f32) -> (f32, f32, bool, bool) {
-        let hard = self.radius + self.outer;
-        let rx = dx.abs().min(hard).copysign(dx) / self.radius;
-        let ry = dy.abs().min(hard).copysign(dy) / self.radius;
-        let mag = rx.hypot(ry);
-        let in_d = mag < self.deadzone;
-        let mut fx = 0.0; let mut fy = 0.0;
-        if !in_d {
-            fx = rx.abs().min(1.0).powf(self.curve).copysign(rx);
-            fy = ry.abs().min(1.0).powf(self.curve).copysign(ry);
+        stick_response(dx, dy, self.radius, self.curve, self.deadzone, self.outer)
+    }
+
+    /// Evalúa muchos offsets en una sola llamada (previsualizaciones y análisis).
+    /// dx, dy: cualquier objeto con buffer protocol de float32 (arrays de NumPy), sin pasar
+    /// por listas. Devuelve 4 bytes (x, y en f32 nativo; deadzone, snapped en bool de 1 byte)
+    /// listos para np.frombuffer: el crate no depende de numpy. Suelta el GIL mientras calcula.
+    pub fn calculate_batch(&self, py: Python<'_>, dx: &Bound<'_, PyAny>, dy: &Bound<'_, PyAny>)
+                           -> PyResult<(Cow<'static, [u8]>, Cow<'static, [u8]>, Cow<'static, [u8]>, Cow<'static, [u8]>)> {
+        let dx = PyBuffer::<f32>::get(dx)?.to_vec(py)?;
+        let dy = PyBuffer::<f32>::get(dy)?.to_vec(py)?;
+        if dx.len() != dy.len() {
+            return Err(pyo3::exceptions::PyValueError::new_err("dx y dy deben tener el mismo largo"));
         }
-        (fx.clamp(-1.0, 1.0), fy.clamp(-1.0, 1.0), in_d, false)
+        let p = self.clone();
+        Ok(py.allow_threads(move || {
+            let n = dx.len();
+            let (mut ox, mut oy) = (Vec::with_capacity(n * 4), Vec::with_capacity(n * 4));
+            let (mut od, mut os) = (Vec::with_capacity(n), Vec::with_capacity(n));
+            for (x, y) in dx.iter().zip(dy.iter()) {
+                let (fx, fy, d, s) = stick_response(*x, *y, p.radius, p.curve, p.deadzone, p.outer);
+                ox.extend_from_slice(&fx.to_ne_bytes()); oy.extend_from_slice(&fy.to_ne_bytes());
+                od.push(d as u8); os.push(s as u8);
+            }
+            (Cow::Owned(ox), Cow::Owned(oy), Cow::Owned(od), Cow::Owned(os))
+        }))
     }
-}
\ No newline at end of file
+}
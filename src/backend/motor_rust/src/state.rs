@@ -16,6 +16,9 @@ pub struct SharedState {
     pub in_deadzone: bool,
     pub recenter_req: bool,
     pub exit_req: bool,
+    // Reconexión: ruta pedida desde Python y si el hilo tiene un mouse abierto
+    pub mouse_req: Option<String>,
+    pub mouse_ok: bool,
 }
 
 impl SharedState {
@@ -28,6 +31,8 @@ impl SharedState {
             is_snapped: false, in_deadzone: false,
             recenter_req: false,
             exit_req: false,
+            mouse_req: None,
+            mouse_ok: false,
         }
     }
 }
\ No newline at end of file
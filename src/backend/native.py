@@ -0,0 +1,18 @@
+"""
+Punto único de importación de la extensión Rust. Si rust_motor no carga, RustFilter y
+RustPhysics caen a la implementación NumPy de referencia (backend.reference); el motor
+de vuelo (RustEngine) no tiene equivalente en Python y queda en None.
+"""
+try:
+    import rust_motor
+    from rust_motor import RustFilter, RustPhysics, RustEngine
+    HAS_RUST = True
+except ImportError as e:
+    # La referencia (NumPy) sólo se importa si hace falta
+    from backend.reference import OneEuroFilter, StickPhysics
+    rust_motor = None
+    RustFilter = OneEuroFilter
+    RustPhysics = StickPhysics
+    RustEngine = None
+    HAS_RUST = False
+    print(f"[NATIVE] rust_motor no disponible ({e}): usando implementación de referencia NumPy")
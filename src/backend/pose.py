@@ -0,0 +1,5 @@
+from collections import namedtuple
+
+# Pose publicada: inmutable, se reemplaza entera en cada frame (lectura atómica, sin locks).
+# Vive aparte de backend.tracker para que los clientes del servicio no importen cv2/mediapipe.
+PoseSnapshot = namedtuple('PoseSnapshot', 'yaw pitch stamp seq face')
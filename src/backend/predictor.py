@@ -0,0 +1,54 @@
+"""
+Predicción de la pose para compensar la latencia de captura + inferencia + One-Euro.
+
+Filtro alfa-beta (modelo de velocidad constante) por canal, alimentado con los tiempos
+de cada frame: estima la velocidad de yaw/pitch ya filtrados y extrapola la última
+medición 'horizon' segundos hacia adelante (partir de la posición estimada añadiría su
+propio retraso). El desplazamiento extrapolado se limita a max_delta
+para que un giro brusco o un frame ruidoso no se conviertan en un sobrepaso grande.
+
+Evaluación offline sobre grabaciones: benchmarks/bench_prediction.py.
+"""
+
+class AlphaBetaPredictor:
+    def __init__(self, alpha=0.5, beta=0.1, max_gap=0.25):
+        """
+        alpha: peso de la medición en la posición (1 = sigue la medición tal cual).
+        beta: peso del residuo en la velocidad (más alto = reacciona antes, más ruido).
+        max_gap: sin frames durante este tiempo (cara perdida) el estado se reinicia.
+        """
+        self.alpha = float(alpha)
+        self.beta = float(beta)
+        self.max_gap = float(max_gap)
+        self.reset()
+
+    def reset(self):
+        self.t_prev = None
+        self.z = [0.0, 0.0]
+        self.x = [0.0, 0.0]
+        self.v = [0.0, 0.0]
+
+    def update(self, t, yaw, pitch):
+        dt = None if self.t_prev is None else t - self.t_prev
+        if dt is None or dt > self.max_gap:
+            self.z = [yaw, pitch]; self.x = [yaw, pitch]; self.v = [0.0, 0.0]; self.t_prev = t
+            return
+        if dt <= 0.0: return
+        self.z = [yaw, pitch]
+        a, b = self.alpha, self.beta
+        for i, z in enumerate((yaw, pitch)):
+            x_pred = self.x[i] + self.v[i] * dt
+            r = z - x_pred
+            self.x[i] = x_pred + a * r
+            self.v[i] += (b / dt) * r
+        self.t_prev = t
+
+    def predict(self, horizon, max_delta):
+        """(yaw, pitch) extrapolados 'horizon' segundos, con |desplazamiento| <= max_delta."""
+        out = []
+        for z, v in zip(self.z, self.v):
+            d = v * horizon
+            if d > max_delta: d = max_delta
+            elif d < -max_delta: d = -max_delta
+            out.append(z + d)
+        return out[0], out[1]
@@ -0,0 +1,150 @@
+import os
+import json
+import time
+import threading
+import numpy as np
+
+from backend.tracker import HeadTracker, Point
+
+# Subconjunto que usa el tracker: mentón (referencia) y ojos (escala)
+POSE_POINTS = (152, 33, 263)
+N_FULL = 478
+FORMAT_VERSION = 1
+
+def record_dtype(n_points):
+    """Registro fijo y empaquetado: se puede anexar en crudo y abrir con np.memmap."""
+    return np.dtype([('t', '<f8'), ('face', 'u1'), ('img_w', '<u2'), ('img_h', '<u2'),
+                     ('pts', '<f4', (n_points, 3))])
+
+class LandmarkRecorder:
+    """
+    Graba por frame: timestamp de captura, si hubo cara, tamaño del frame y los landmarks
+    (ya re-proyectados y espejados, tal como los consume la pose).
+    Layout de la sesión:
+        <dir>/meta.json   -> versión, puntos grabados, dtype
+        <dir>/frames.bin  -> registros record_dtype() anexados, sin cabecera
+    """
+    def __init__(self, path, full=False):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.points = None if full else POSE_POINTS
+        n = N_FULL if full else len(POSE_POINTS)
+        self.dtype = record_dtype(n)
+        self._rec = np.zeros(1, dtype=self.dtype)
+        self._lock = threading.Lock()
+        self.count = 0
+
+        meta = {
+            'version': FORMAT_VERSION,
+            'points': 'all' if full else list(POSE_POINTS),
+            'n_points': n,
+            'dtype': self.dtype.descr,
+            'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        with open(os.path.join(path, 'meta.json'), 'w') as f:
+            json.dump(meta, f, indent=4)
+        self._f = open(os.path.join(path, 'frames.bin'), 'ab', buffering=1 << 16)
+
+    def append(self, stamp, lm, img_w, img_h):
+        """lm: FrameLandmarks (o None si no hubo cara en el frame)."""
+        with self._lock:
+            if self._f is None: return
+            rec = self._rec[0]
+            rec['t'] = stamp
+            rec['img_w'] = img_w; rec['img_h'] = img_h
+            pts = rec['pts']
+            if lm is None:
+                rec['face'] = 0
+                pts[:] = 0.0
+            else:
+                rec['face'] = 1
+                idx = self.points if self.points is not None else range(min(len(lm.lm), len(pts)))
+                for row, i in enumerate(idx):
+                    pts[row] = lm.xyz(i)
+            self._f.write(self._rec.data)
+            self.count += 1
+
+    def close(self):
+        with self._lock:
+            if self._f:
+                self._f.close()
+                self._f = None
+
+def write_session(path, t, pts, face=None, img_size=(640, 480)):
+    """
+    Escribe una sesión completa de una vez (sesiones sintéticas, conversiones) con el mismo
+    layout que LandmarkRecorder. t: (N,) segundos; pts: (N, len(POSE_POINTS), 2 o 3) en el
+    orden de POSE_POINTS; face: (N,) bool (por defecto todos con cara). Devuelve N.
+    """
+    LandmarkRecorder(path).close()  # meta.json
+    t = np.asarray(t, dtype=np.float64)
+    pts = np.asarray(pts, dtype=np.float32)
+    recs = np.zeros(len(t), dtype=record_dtype(len(POSE_POINTS)))
+    recs['t'] = t
+    recs['face'] = True if face is None else face
+    recs['img_w'], recs['img_h'] = img_size
+    recs['pts'][:, :, :pts.shape[2]] = pts
+    with open(os.path.join(path, 'frames.bin'), 'wb') as f:
+        recs.tofile(f)
+    return len(recs)
+
+class LandmarkReplay:
+    """Sesión grabada abierta con memmap: no se carga a RAM, se pagina bajo demanda."""
+    def __init__(self, path):
+        with open(os.path.join(path, 'meta.json')) as f:
+            self.meta = json.load(f)
+        if self.meta.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Versión de grabación no soportada: {self.meta.get('version')}")
+        self.dtype = record_dtype(self.meta['n_points'])
+        data_path = os.path.join(path, 'frames.bin')
+        n = os.path.getsize(data_path) // self.dtype.itemsize
+        self.records = np.memmap(data_path, dtype=self.dtype, mode='r', shape=(n,)) if n else \
+            np.zeros(0, dtype=self.dtype)
+
+        # Columna de cada landmark que usa la pose dentro de 'pts'
+        points = self.meta['points']
+        self.columns = [i if points == 'all' else points.index(i) for i in POSE_POINTS]
+
+    def __len__(self):
+        return len(self.records)
+
+def replay(path, config=None, tracker=None, chunk=65536):
+    """
+    Pasa una sesión grabada por la etapa referencia/drag/filtros de HeadTracker,
+    sin MediaPipe ni cámara. Devuelve arrays t, face, yaw, pitch.
+    """
+    rep = LandmarkReplay(path)
+    if tracker is None:
+        tracker = HeadTracker(source=None, config=dict(config or {}), model=False)
+    n = len(rep)
+    out_yaw = np.zeros(n, dtype=np.float32)
+    out_pitch = np.zeros(n, dtype=np.float32)
+    if n == 0:
+        return {'t': np.zeros(0), 'face': np.zeros(0, dtype=bool), 'yaw': out_yaw, 'pitch': out_pitch}
+
+    # Tiempos relativos pequeños: el filtro Rust trabaja en f32
+    tracker.start_time = float(rep.records['t'][0])
+    c_t, c_l, c_r = rep.columns
+    yaw = pitch = 0.0
+
+    for a in range(0, n, chunk):
+        # Pasamos cada bloque a listas de Python: iterar el memmap escalar a escalar es lento
+        block = rep.records[a:a + chunk]
+        ts = block['t'].tolist(); faces = block['face'].tolist()
+        ws = block['img_w'].tolist(); hs = block['img_h'].tolist()
+        pts = block['pts'][:, [c_t, c_l, c_r], :2].tolist()
+        for k in range(len(ts)):
+            if faces[k]:
+                (tx, ty), (lx, ly), (rx, ry) = pts[k]
+                lm = {152: Point(tx, ty), 33: Point(lx, ly), 263: Point(rx, ry)}
+                tracker._process_landmarks(lm, ws[k], hs[k], ts[k])
+                yaw, pitch = tracker.yaw, tracker.pitch
+            out_yaw[a + k] = yaw
+            out_pitch[a + k] = pitch
+
+    return {
+        't': np.asarray(rep.records['t']),
+        'face': np.asarray(rep.records['face']).astype(bool),
+        'yaw': out_yaw,
+        'pitch': out_pitch,
+    }
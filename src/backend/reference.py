@@ -0,0 +1,111 @@
+"""
+Implementación de referencia en Python/NumPy de lo que calcula rust_motor:
+- OneEuroFilter: mismo filtro que RustFilter (filter.rs).
+- StickPhysics: mismo modelo que RustPhysics / stick_response (physics.rs).
+
+Sirve como especificación legible, como respaldo cuando la extensión no carga
+(ver backend.native) y para comprobar paridad (benchmarks/bench_reference.py).
+"""
+import math
+import numpy as np
+
+TWO_PI = 2.0 * math.pi
+
+class OneEuroFilter:
+    """Filtro One-Euro escalar. Misma firma que rust_motor.RustFilter(min_cutoff, beta, d_cutoff)."""
+    def __init__(self, min_cutoff, beta, d_cutoff):
+        self.min_cutoff = float(min_cutoff)
+        self.beta = float(beta)
+        self.d_cutoff = float(d_cutoff)
+        self.x_prev = None
+        self.dx_prev = 0.0
+        self.t_prev = None
+
+    def filter(self, t, x):
+        if self.t_prev is None:
+            self.x_prev = x; self.t_prev = t
+            return x
+        t_e = t - self.t_prev
+        if t_e <= 0.0: return self.x_prev
+        r = TWO_PI * self.d_cutoff * t_e; a_d = r / (r + 1.0)
+        dx = (x - self.x_prev) / t_e
+        dx_hat = a_d * dx + (1.0 - a_d) * self.dx_prev
+        cutoff = self.min_cutoff + self.beta * abs(dx_hat)
+        r2 = TWO_PI * cutoff * t_e; a = r2 / (r2 + 1.0)
+        x_hat = a * x + (1.0 - a) * self.x_prev
+        self.x_prev = x_hat; self.dx_prev = dx_hat; self.t_prev = t
+        return x_hat
+
+class OneEuroBank:
+    """
+    N filtros One-Euro independientes que comparten reloj (p. ej. yaw y pitch, o muchas
+    sesiones a la vez). filter() avanza un paso vectorizado sobre los canales.
+    """
+    def __init__(self, channels, min_cutoff, beta, d_cutoff):
+        self.min_cutoff = np.broadcast_to(np.asarray(min_cutoff, dtype=np.float64), (channels,)).copy()
+        self.beta = np.broadcast_to(np.asarray(beta, dtype=np.float64), (channels,)).copy()
+        self.d_cutoff = np.broadcast_to(np.asarray(d_cutoff, dtype=np.float64), (channels,)).copy()
+        self.x_prev = np.zeros(channels)
+        self.dx_prev = np.zeros(channels)
+        self.t_prev = None
+
+    def filter(self, t, x):
+        x = np.asarray(x, dtype=np.float64)
+        if self.t_prev is None:
+            self.x_prev[:] = x; self.t_prev = t
+            return x.copy()
+        t_e = t - self.t_prev
+        if t_e <= 0.0: return self.x_prev.copy()
+        r = TWO_PI * self.d_cutoff * t_e; a_d = r / (r + 1.0)
+        dx = (x - self.x_prev) / t_e
+        dx_hat = a_d * dx + (1.0 - a_d) * self.dx_prev
+        cutoff = self.min_cutoff + self.beta * np.abs(dx_hat)
+        r2 = TWO_PI * cutoff * t_e; a = r2 / (r2 + 1.0)
+        x_hat = a * x + (1.0 - a) * self.x_prev
+        self.x_prev = x_hat; self.dx_prev = dx_hat; self.t_prev = t
+        return x_hat.copy()
+
+    def filter_series(self, ts, xs):
+        """ts: (T,), xs: (T, canales) -> (T, canales). La recursión en el tiempo es inevitable."""
+        xs = np.asarray(xs, dtype=np.float64)
+        out = np.empty_like(xs)
+        for i, t in enumerate(ts):
+            out[i] = self.filter(float(t), xs[i])
+        return out
+
+class StickPhysics:
+    """Modelo de respuesta del stick. Misma firma que rust_motor.RustPhysics."""
+    def __init__(self, radius, curve, deadzone, snap_axis, snap_threshold, outer):
+        self.update_config(radius, curve, deadzone, snap_axis, snap_threshold, outer)
+
+    def update_config(self, r, c, d, sa, st, o):
+        self.radius = float(r); self.curve = float(c); self.deadzone = float(d)
+        self.snap_axis = float(sa); self.snap_threshold = float(st); self.outer = float(o)
+
+    def calculate(self, dx, dy):
+        hard = self.radius + self.outer
+        rx = math.copysign(min(abs(dx), hard), dx) / self.radius
+        ry = math.copysign(min(abs(dy), hard), dy) / self.radius
+
+        in_d = math.hypot(rx, ry) < self.deadzone
+        fx = fy = 0.0
+        if not in_d:
+            fx = math.copysign(min(abs(rx), 1.0) ** self.curve, rx)
+            fy = math.copysign(min(abs(ry), 1.0) ** self.curve, ry)
+        return fx, fy, in_d, False
+
+    def calculate_batch(self, dx, dy):
+        """Versión vectorizada (float32 como en Rust). Devuelve arrays (x, y, deadzone, snapped)."""
+        dx, dy = np.broadcast_arrays(np.asarray(dx, dtype=np.float32), np.asarray(dy, dtype=np.float32))
+        radius = np.float32(self.radius)
+        hard = np.float32(self.radius + self.outer)
+        rx = np.copysign(np.minimum(np.abs(dx), hard), dx) / radius
+        ry = np.copysign(np.minimum(np.abs(dy), hard), dy) / radius
+
+        in_d = np.hypot(rx, ry) < np.float32(self.deadzone)
+        curve = np.float32(self.curve)
+        fx = np.copysign(np.minimum(np.abs(rx), np.float32(1.0)) ** curve, rx)
+        fy = np.copysign(np.minimum(np.abs(ry), np.float32(1.0)) ** curve, ry)
+        fx = np.where(in_d, np.float32(0.0), fx).astype(np.float32)
+        fy = np.where(in_d, np.float32(0.0), fy).astype(np.float32)
+        return fx, fy, in_d, np.zeros(fx.shape, dtype=bool)
@@ -0,0 +1,36 @@
+import numpy as np
+
+def _column(values, dtype):
+    # RustPhysics.calculate_batch devuelve bytes crudos; la referencia NumPy, arrays
+    if isinstance(values, (bytes, bytearray, memoryview)): return np.frombuffer(values, dtype=dtype)
+    return np.asarray(values, dtype=dtype)
+
+def evaluate(physics, dx, dy):
+    """
+    Evalúa el modelo de respuesta del stick sobre arrays de offsets (píxeles).
+    Devuelve (x, y, deadzone, snapped) con la forma de np.broadcast(dx, dy).
+    """
+    dx, dy = np.broadcast_arrays(np.asarray(dx, dtype=np.float32), np.asarray(dy, dtype=np.float32))
+    shape = dx.shape
+    if hasattr(physics, 'calculate_batch'):
+        # Arrays contiguos: Rust los lee por buffer protocol, sin listas intermedias
+        fx, fy, dead, snap = physics.calculate_batch(np.ascontiguousarray(dx.ravel()), np.ascontiguousarray(dy.ravel()))
+    else:
+        # Binding antiguo sin API por lotes: un punto por llamada
+        out = [physics.calculate(float(x), float(y)) for x, y in zip(dx.ravel(), dy.ravel())]
+        fx, fy, dead, snap = zip(*out) if out else ((), (), (), ())
+    return (_column(fx, np.float32).reshape(shape), _column(fy, np.float32).reshape(shape),
+            _column(dead, bool).reshape(shape), _column(snap, bool).reshape(shape))
+
+def response_curve(physics, radius, outer, n=128):
+    """Curva 1D real sobre el eje X: offsets 0..radius+outer -> salida (incluye deadzone, snap y saturación)."""
+    dx = np.linspace(0.0, float(radius) + float(outer), n, dtype=np.float32)
+    fx, _, dead, snap = evaluate(physics, dx, 0.0)
+    return dx, fx, dead, snap
+
+def response_grid(physics, extent, n=64):
+    """Mapa 2D: rejilla n x n de offsets en [-extent, extent] -> (magnitud de salida, deadzone, snapped)."""
+    axis = np.linspace(-float(extent), float(extent), n, dtype=np.float32)
+    dx, dy = np.meshgrid(axis, axis)
+    fx, fy, dead, snap = evaluate(physics, dx, dy)
+    return np.minimum(np.hypot(fx, fy), 1.0), dead, snap
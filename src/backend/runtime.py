@@ -0,0 +1,96 @@
+import asyncio
+
+class RateTask:
+    """
+    Tarea periódica con deadlines absolutos: el período no deriva con el tiempo de
+    ejecución de fn. Si un tick llega tarde se cuenta como overrun y se re-ancla
+    (no se disparan ráfagas para "recuperar" ticks perdidos).
+    """
+    def __init__(self, name, hz, fn):
+        self.name = name
+        self.hz = float(hz)
+        self.period = 1.0 / float(hz)
+        self.fn = fn
+        self.runs = 0
+        self.overruns = 0
+        self.max_late = 0.0
+        self.busy = 0.0
+        self.started = None
+        self.elapsed = 0.0
+
+    async def run(self, stop):
+        loop = asyncio.get_running_loop()
+        deadline = self.started = loop.time()
+        try:
+            while not stop.is_set():
+                t0 = loop.time()
+                result = self.fn()
+                if asyncio.iscoroutine(result): await result
+                self.runs += 1
+                now = loop.time()
+                self.busy += now - t0
+
+                deadline += self.period
+                if now > deadline:
+                    self.overruns += 1
+                    self.max_late = max(self.max_late, now - deadline)
+                    deadline = now
+                await asyncio.sleep(deadline - now)
+        finally:
+            # El runtime siempre cancela las tareas al terminar: el tiempo se cierra aquí
+            self.elapsed = loop.time() - self.started
+
+    def report(self):
+        elapsed = max(self.elapsed, 1e-9)
+        return (f" {self.name:<10} {self.hz:>6.0f} Hz  ticks={self.runs:<7} overruns={self.overruns:<5} "
+                f"peor retraso={self.max_late * 1000:6.2f} ms  carga={100 * self.busy / elapsed:5.1f}%")
+
+class MotorRuntime:
+    """Ejecuta cada preocupación del motor como su propia tarea asyncio, con su propia frecuencia."""
+    def __init__(self):
+        self.tasks = []
+        self.result = None
+        self._loop = None
+        self._stop = None
+
+    def every(self, name, hz, fn):
+        task = RateTask(name, hz, fn)
+        self.tasks.append(task)
+        return task
+
+    def stop(self, result=None):
+        """Termina el runtime; se puede llamar desde cualquier hilo (p. ej. HotkeyListener)."""
+        if self._loop is None:
+            self.result = result
+            return
+        self._loop.call_soon_threadsafe(self._finish, result)
+
+    def _finish(self, result):
+        if self.result is None: self.result = result
+        self._stop.set()
+
+    def run(self):
+        """Bloquea hasta stop(); devuelve el resultado pasado a stop()."""
+        return asyncio.run(self._main())
+
+    async def _main(self):
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        if self.result is not None: self._stop.set()
+
+        running = [asyncio.create_task(t.run(self._stop), name=t.name) for t in self.tasks]
+        waiter = asyncio.create_task(self._stop.wait())
+        try:
+            done, _ = await asyncio.wait(running + [waiter], return_when=asyncio.FIRST_COMPLETED)
+            for t in done:
+                # Una tarea que revienta detiene el runtime y propaga su excepción
+                if t is not waiter and t.exception(): raise t.exception()
+        finally:
+            self._stop.set()
+            for t in running + [waiter]: t.cancel()
+            await asyncio.gather(*running, waiter, return_exceptions=True)
+            self._loop = None
+        return self.result
+
+    def report(self):
+        return "\n".join(t.report() for t in self.tasks)
@@ -0,0 +1,142 @@
+import os
+import time
+from abc import ABC, abstractmethod
+import numpy as np
+import cv2
+
+from backend.camera import open_camera
+from utils.config import as_config
+
+IMAGE_EXTS = ('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff')
+GST_ELEMENTS = ('videotestsrc', 'v4l2src', 'filesrc', 'uridecodebin', 'appsrc', 'rtspsrc', 'udpsrc')
+
+class FrameSource(ABC):
+    """
+    Fuente de frames con la misma interfaz mínima que cv2.VideoCapture
+    (read(image), isOpened(), release()) más:
+      - stamp:     instante de captura del último frame (segundos, reloj de time.time()).
+      - realtime:  True = respeta el ritmo del medio; False = tan rápido como se consuma.
+      - exhausted: True cuando una fuente finita terminó.
+    """
+    realtime = True
+    fps = 30.0
+
+    def __init__(self, realtime=True, loop=False):
+        self.realtime = realtime
+        self.loop = loop
+        self.exhausted = False
+        self.stamp = 0.0
+        self.index = 0
+        self._t0 = None
+
+    def _pace(self):
+        """Marca de tiempo del frame actual; en tiempo real duerme hasta que 'toque'."""
+        if self._t0 is None: self._t0 = time.time()
+        due = self._t0 + self.index / self.fps
+        if self.realtime:
+            delay = due - time.time()
+            if delay > 0: time.sleep(delay)
+            self.stamp = time.time()
+        else:
+            # Modo rápido: tiempo del medio, determinista entre corridas
+            self.stamp = due
+        self.index += 1
+
+    @abstractmethod
+    def read(self, image=None):
+        """(ok, frame) como cv2.VideoCapture.read; actualiza stamp."""
+    def isOpened(self): return False
+    def release(self): pass
+
+class CameraSource(FrameSource):
+    """Cámara V4L2 (el propio driver marca el ritmo)."""
+    def __init__(self, source=0, config=None):
+        super().__init__(realtime=True)
+        self.cap = open_camera(source, config)
+
+    def read(self, image=None):
+        ok, frame = self.cap.read(image) if image is not None else self.cap.read()
+        self.stamp = time.time()
+        return ok, frame
+
+    def isOpened(self): return self.cap.isOpened()
+    def release(self): self.cap.release()
+
+class VideoFileSource(FrameSource):
+    """Archivo de video decodificado con OpenCV."""
+    def __init__(self, path, realtime=True, loop=False, api=cv2.CAP_ANY):
+        super().__init__(realtime, loop)
+        self.path = str(path)
+        self.cap = cv2.VideoCapture(self.path, api)
+        fps = self.cap.get(cv2.CAP_PROP_FPS) if self.cap.isOpened() else 0
+        self.fps = fps if fps and fps > 0 else 30.0
+
+    def read(self, image=None):
+        ok, frame = self.cap.read(image) if image is not None else self.cap.read()
+        if not ok and self.loop and self.index > 0:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, frame = self.cap.read(image) if image is not None else self.cap.read()
+        if not ok:
+            self.exhausted = True
+            return False, None
+        self._pace()
+        return True, frame
+
+    def isOpened(self): return self.cap.isOpened()
+    def release(self): self.cap.release()
+
+class GStreamerSource(VideoFileSource):
+    """Pipeline GStreamer (requiere OpenCV compilado con GStreamer). Ej: 'videotestsrc pattern=ball'."""
+    def __init__(self, pipeline, realtime=True, loop=False):
+        pipeline = pipeline[4:] if pipeline.startswith('gst:') else pipeline
+        if 'appsink' not in pipeline:
+            pipeline += ' ! videoconvert ! video/x-raw,format=BGR ! appsink drop=false sync=false'
+        super().__init__(pipeline, realtime, loop, api=cv2.CAP_GSTREAMER)
+
+class ImageSequenceSource(FrameSource):
+    """Directorio de imágenes, leídas en orden alfabético a 'fps' cuadros por segundo."""
+    def __init__(self, directory, fps=30.0, realtime=True, loop=False):
+        super().__init__(realtime, loop)
+        self.fps = float(fps)
+        self.files = sorted(os.path.join(directory, f) for f in os.listdir(directory)
+                            if f.lower().endswith(IMAGE_EXTS))
+        self._pos = 0
+
+    def read(self, image=None):
+        if self._pos >= len(self.files):
+            if not (self.loop and self.files):
+                self.exhausted = True
+                return False, None
+            self._pos = 0
+        frame = cv2.imread(self.files[self._pos])
+        self._pos += 1
+        if frame is None: return False, None
+        if image is not None and image.shape == frame.shape:
+            # Reutilizamos el buffer del pool del tracker
+            np.copyto(image, frame); frame = image
+        self._pace()
+        return True, frame
+
+    def isOpened(self): return bool(self.files)
+
+def open_source(source, config=None, realtime=True, loop=False):
+    """
+    Resuelve 'source' a una FrameSource:
+      int / '0' / '/dev/videoN'  -> cámara V4L2
+      'gst:...' o pipeline '!'   -> GStreamer
+      directorio                 -> secuencia de imágenes
+      otro path                  -> archivo de video
+    """
+    config = as_config(config)
+    if isinstance(source, FrameSource): return source
+    if isinstance(source, int) or (isinstance(source, str) and source.isdigit()):
+        return CameraSource(int(source), config)
+
+    source = str(source)
+    if source.startswith('/dev/video'):
+        return CameraSource(source, config)
+    if source.startswith('gst:') or ' ! ' in source or source.split(' ', 1)[0] in GST_ELEMENTS:
+        return GStreamerSource(source, realtime, loop)
+    if os.path.isdir(source):
+        return ImageSequenceSource(source, config.src_fps, realtime, loop)
+    return VideoFileSource(source, realtime, loop)
@@ -0,0 +1,66 @@
+import threading
+import numpy as np
+
+class RollingWindow:
+    """Ventana circular preasignada de duraciones (ms). Añadir no asigna memoria."""
+    def __init__(self, size=512):
+        self._buf = np.zeros(size, dtype=np.float64)
+        self._i = 0
+        self._n = 0
+
+    def add(self, ms):
+        self._buf[self._i] = ms
+        self._i = (self._i + 1) % len(self._buf)
+        if self._n < len(self._buf): self._n += 1
+
+    def clear(self):
+        self._i = 0; self._n = 0
+
+    def summary(self):
+        if self._n == 0:
+            return {'n': 0, 'mean': 0.0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+        vals = self._buf[:self._n]
+        p50, p95, p99 = np.percentile(vals, (50, 95, 99))
+        return {'n': self._n, 'mean': float(vals.mean()), 'p50': float(p50),
+                'p95': float(p95), 'p99': float(p99), 'max': float(vals.max())}
+
+class PipelineStats:
+    """
+    Tiempos por etapa (percentiles móviles) y contadores del pipeline del tracker.
+    Las duraciones se reportan en segundos (time.perf_counter) y se guardan en ms.
+    """
+    STAGES = ('capture', 'convert', 'detect', 'pose', 'filter', 'latency')
+    COUNTERS = ('frames', 'no_face', 'errors')
+
+    def __init__(self, window=2048):
+        self._lock = threading.Lock()
+        self._stages = {s: RollingWindow(window) for s in self.STAGES}
+        self._counters = dict.fromkeys(self.COUNTERS, 0)
+
+    def add(self, stage, seconds):
+        with self._lock:
+            self._stages[stage].add(seconds * 1000.0)
+
+    def count(self, name, n=1):
+        with self._lock:
+            self._counters[name] += n
+
+    def reset(self):
+        with self._lock:
+            for w in self._stages.values(): w.clear()
+            self._counters = dict.fromkeys(self.COUNTERS, 0)
+
+    def snapshot(self):
+        with self._lock:
+            out = dict(self._counters)
+            out['stages'] = {name: w.summary() for name, w in self._stages.items()}
+        return out
+
+def format_stats(stats):
+    """Tabla legible de get_stats() para consola."""
+    lines = [" ETAPA        N     p50(ms)  p95(ms)  p99(ms)  max(ms)"]
+    for name, s in stats['stages'].items():
+        lines.append(f" {name:<9} {s['n']:>5} {s['p50']:>10.2f} {s['p95']:>8.2f} {s['p99']:>8.2f} {s['max']:>8.2f}")
+    counters = ", ".join(f"{k}={v}" for k, v in stats.items() if k != 'stages')
+    lines.append(f" {counters}")
+    return "\n".join(lines)
@@ -4,17 +4,16 @@ import time
 import os
 import numpy as np
 import math
-import rust_motor # <--- IMPORTAMOS RUST
+from collections import namedtuple, OrderedDict
+from backend.native import RustFilter  # Rust si está compilado, si no la referencia NumPy
+from backend.sources import open_source
+from backend.stats import PipelineStats
+from backend.pose import PoseSnapshot
+from backend.predictor import AlphaBetaPredictor
 
 # --- IMPORTS DE UTILIDADES ---
-try:
-    from utils.paths import MODEL_PATH
-    from utils.config_manager import load_config
-except ImportError:
-    try:
-        from utils.utils import MODEL_PATH
-    except: pass
-    def load_config(): return {}
+from utils.utils import MODEL_PATH
+from utils.config import load_config, Config, DEFAULT_CONFIG
 
 HAS_MEDIAPIPE = False
 try:
@@ -26,23 +25,126 @@ except ImportError: pass
 
 # NOTA: HE BORRADO LA CLASE OneEuroFilter DE PYTHON. YA NO ES NECESARIA.
 
+# Contorno de la cara (FACE_OVAL de MediaPipe): basta para calcular la caja del ROI
+FACE_OVAL_IDX = (10, 338, 297, 332, 284, 251, 389, 356, 454, 323, 361, 288, 397, 365, 379, 378,
+                 400, 377, 152, 148, 176, 149, 150, 136, 172, 58, 132, 93, 234, 127, 162, 21,
+                 54, 103, 67, 109)
+
+Point = namedtuple('Point', 'x y')
+
+class FrameLandmarks:
+    """
+    Landmarks de la imagen de inferencia re-proyectados (perezosamente) al frame completo.
+    roi: recorte usado (x0, y0, x1, y1) en píxeles o None. mirror: espejo horizontal en
+    coordenadas de landmark, así nunca hace falta voltear el frame con cv2.flip.
+    """
+    __slots__ = ('lm', 'ox', 'oy', 'sx', 'sy')
+
+    def __init__(self, lm, roi, img_w, img_h, mirror=False):
+        x0, y0, x1, y1 = roi if roi is not None else (0, 0, img_w, img_h)
+        self.lm = lm
+        self.ox, self.oy = x0 / img_w, y0 / img_h
+        self.sx, self.sy = (x1 - x0) / img_w, (y1 - y0) / img_h
+        if mirror:
+            self.ox, self.sx = 1.0 - self.ox, -self.sx
+
+    def __getitem__(self, i):
+        p = self.lm[i]
+        return Point(self.ox + p.x * self.sx, self.oy + p.y * self.sy)
+
+    def xyz(self, i):
+        p = self.lm[i]
+        return (self.ox + p.x * self.sx, self.oy + p.y * self.sy, p.z * abs(self.sx))
+
+class FrameSlot:
+    """
+    Buffer de un solo hueco: el último frame capturado siempre gana.
+    Los frames viven en un pool preasignado (escritura, hueco, lectura) que se recicla,
+    así la captura no asigna memoria nueva en régimen estable.
+    """
+    POOL_SIZE = 3
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._frame = None
+        self._stamp = 0.0
+        self._closed = False
+        self._pool = []
+        self._free = []
+        self.captured = 0
+        self.dropped = 0
+
+    def allocate(self, shape, dtype=np.uint8):
+        """(Re)crea el pool para un tamaño de frame dado."""
+        with self._cond:
+            self._pool = [np.empty(shape, dtype=dtype) for _ in range(self.POOL_SIZE)]
+            self._free = list(self._pool)
+
+    def acquire(self):
+        """Buffer libre para que la captura escriba encima, o None si aún no hay pool."""
+        with self._cond:
+            return self._free.pop() if self._free else None
+
+    def release(self, frame):
+        """Devuelve un buffer al pool (los buffers ajenos al pool se ignoran)."""
+        if frame is None: return
+        with self._cond:
+            if any(frame is b for b in self._pool) and not any(frame is b for b in self._free):
+                self._free.append(frame)
+
+    def put(self, frame, stamp, block=False):
+        with self._cond:
+            while block and self._frame is not None and not self._closed:
+                self._cond.wait(0.1)
+            # Si la inferencia no alcanzó a consumir el anterior, lo descartamos
+            if self._frame is not None:
+                self.dropped += 1
+                if any(self._frame is b for b in self._pool): self._free.append(self._frame)
+            self._frame = frame
+            self._stamp = stamp
+            self.captured += 1
+            self._cond.notify()
+
+    def take(self, timeout=0.1):
+        """Devuelve (frame, stamp) del más reciente o None si no llegó nada. Luego: release(frame)."""
+        with self._cond:
+            if self._frame is None and not self._closed:
+                self._cond.wait(timeout)
+            if self._frame is None: return None
+            frame, stamp = self._frame, self._stamp
+            self._frame = None
+            self._cond.notify_all()
+            return frame, stamp
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
 class HeadTracker:
-    def __init__(self, source=0, config=None, show_debug=False):
-        self.yaw = 0.0
-        self.pitch = 0.0
+    def __init__(self, source=0, config=None, show_debug=False, realtime=True, model=True):
+        """
+        source: índice de cámara, video, directorio de imágenes, pipeline GStreamer o
+        FrameSource (ver backend.sources). None = sin captura (sólo el landmarker).
+        realtime: False procesa fuentes grabadas tan rápido como se pueda, sin descartar frames.
+        model: False = sin MediaPipe (replay de landmarks grabados, ver backend.recording).
+        """
+        self._snapshot = PoseSnapshot(0.0, 0.0, 0.0, 0, False)
+        self._sink = None
         self.running = False
         self.cap = None
         self.show_debug = show_debug 
+        self._debug_open = False
         
         self.config = config if config else load_config()
-
-        default_keys = {
-            't_sens_x': 10.0, 't_sens_y': 10.0, 't_smooth': 0.5, 
-            't_deadzone': 0.02, 't_snap_axis': 0.20, 't_snap_outer': 0.10,
-            't_center_drag': 0.01 
-        }
-        for k, v in default_keys.items():
+        for k, v in DEFAULT_CONFIG.items():
             if k not in self.config: self.config[k] = v
+        # Snapshot inmutable que leen los hilos de captura/inferencia; update_config lo reemplaza
+        self.cfg = Config(self.config)
 
         # Referencia dinámica
         self.ref_x = 0.5
@@ -51,15 +153,36 @@ class HeadTracker:
         
         self.landmarker = None
         self.thread = None
+        self.capture_thread = None
+        self.slot = FrameSlot()
+        self.stats = PipelineStats()
+        self._debug_pt = None
+        # ROI: caja (x0, y0, x1, y1) en píxeles de la última detección. None = escaneo completo
+        self._roi = None
+        self._pending = OrderedDict()
+        self._buffers = {}
         
         # --- FILTROS RUST ---
-        beta = float(self.config.get('t_smooth', 0.5))
+        beta = self.cfg.t_smooth
         # Instanciamos el filtro compilado en Rust (C++)
-        self.filter_yaw = rust_motor.RustFilter(0.05, beta, 1.0)
-        self.filter_pitch = rust_motor.RustFilter(0.05, beta, 1.0)
+        self.filter_yaw = RustFilter(0.05, beta, 1.0)
+        self.filter_pitch = RustFilter(0.05, beta, 1.0)
+        # Predicción opcional (t_predict): adelanta la pose filtrada para compensar la latencia
+        self.predictor = AlphaBetaPredictor()
         
         self.start_time = time.time()
         self.last_timestamp_ms = 0
+        self.live_stream = False
+        self.recorder = None
+
+        if not model: return
+
+        # Grabación opcional de la sesión (t_record = carpeta raíz)
+        if self.cfg.t_record and source is not None:
+            from backend.recording import LandmarkRecorder
+            session = os.path.join(self.cfg.t_record, time.strftime('%Y%m%d_%H%M%S'))
+            self.recorder = LandmarkRecorder(session, full=self.cfg.t_record_full)
+            print(f"[TRACKER] Grabando landmarks en {session}")
 
         if not HAS_MEDIAPIPE: 
             print("[TRACKER] Error: MediaPipe no instalado.")
@@ -68,12 +191,20 @@ class HeadTracker:
             print(f"[TRACKER] Error: Modelo no encontrado en {MODEL_PATH}")
             return
 
+        # VIDEO: bloqueante y determinista (replay). LIVE_STREAM: asíncrono con callback.
+        self.live_stream = self.cfg.t_mode == 'live_stream'
+        if self.live_stream:
+            mode_kwargs = dict(running_mode=mp.tasks.vision.RunningMode.LIVE_STREAM,
+                               result_callback=self._on_result)
+        else:
+            mode_kwargs = dict(running_mode=mp.tasks.vision.RunningMode.VIDEO)
+
         options = mp.tasks.vision.FaceLandmarkerOptions(
             base_options=mp.tasks.BaseOptions(model_asset_path=str(MODEL_PATH)),
-            running_mode=mp.tasks.vision.RunningMode.VIDEO, 
             num_faces=1,
             output_face_blendshapes=False,
-            output_facial_transformation_matrixes=False
+            output_facial_transformation_matrixes=False,
+            **mode_kwargs
         )
         
         try:
@@ -83,105 +214,308 @@ class HeadTracker:
             return
 
         try:
-            self.cap = cv2.VideoCapture(source, cv2.CAP_V4L2)
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+            if source is None: return
+            self.cap = open_source(source, self.cfg, realtime=realtime)
             if not self.cap.isOpened():
                 self.running = False; return 
         except Exception:
             self.running = False; return
 
         self.running = True
+        # Dos hilos: captura (siempre drena V4L2) e inferencia (toma el último frame)
+        self.capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
         self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.capture_thread.start()
         self.thread.start()
 
     def update_config(self, new_config):
+        """Valida antes de tocar nada (ConfigError si no) y publica el snapshot nuevo de una vez."""
         if not new_config: return
+        cfg = self.cfg.replace(new_config)
         self.config.update(new_config)
+        self.cfg = cfg
         
-        # Actualizamos el parámetro Beta directamente en el objeto Rust
-        new_beta = float(self.config.get('t_smooth', 0.5))
-        self.filter_yaw.beta = new_beta
-        self.filter_pitch.beta = new_beta
+        # Actualizamos el parámetro Beta directamente en el objeto Rust (sólo si cambió)
+        if 't_smooth' not in new_config: return
+        self.filter_yaw.beta = cfg.t_smooth
+        self.filter_pitch.beta = cfg.t_smooth
     
-    def _loop(self):
+    @property
+    def frames_dropped(self):
+        return self.slot.dropped
+
+    def _capture_loop(self):
+        """Lee la cámara lo más rápido posible y sobreescribe el slot."""
         while self.running and self.cap.isOpened():
-            if not self.running: break
             try:
-                success, frame = self.cap.read()
-                if not success:
+                if not self._capture_once():
+                    if self.cap.exhausted: break
                     time.sleep(0.1); continue
-                
-                frame = cv2.flip(frame, 1)
-                img_h, img_w, _ = frame.shape
-                
-                # Conversión a MediaPipe
-                mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=frame)
-                
-                now = time.time()
-                timestamp_ms = int((now - self.start_time) * 1000)
-                if timestamp_ms <= self.last_timestamp_ms: timestamp_ms = self.last_timestamp_ms + 1
-                self.last_timestamp_ms = timestamp_ms
-
-                if self.landmarker:
-                    detection = self.landmarker.detect_for_video(mp_image, timestamp_ms)
-                    if detection.face_landmarks:
-                        lm = detection.face_landmarks[0]
-                        target_pt = lm[152]; eye_l = lm[33]; eye_r = lm[263]
-
-                        dx = (eye_r.x - eye_l.x) * img_w
-                        dy = (eye_r.y - eye_l.y) * img_h
-                        face_width_px = math.hypot(dx, dy)
-                        if face_width_px < 1.0: face_width_px = 1.0
-
-                        # CENTRO DINÁMICO (Esto sigue en Python porque es lógica simple)
-                        if self.needs_recenter:
-                            self.ref_x = target_pt.x
-                            self.ref_y = target_pt.y
-                            self.needs_recenter = False
-                        else:
-                            dist_from_center = math.hypot(target_pt.x - self.ref_x, target_pt.y - self.ref_y)
-                            if dist_from_center < 0.15:
-                                drag_factor = float(self.config.get('t_center_drag', 0.005))
-                                self.ref_x += (target_pt.x - self.ref_x) * drag_factor
-                                self.ref_y += (target_pt.y - self.ref_y) * drag_factor
-
-                        delta_x = (target_pt.x - self.ref_x) * img_w
-                        delta_y = (target_pt.y - self.ref_y) * img_h
-                        
-                        raw_yaw = delta_x / face_width_px
-                        raw_pitch = delta_y / face_width_px
-
-                        t_relativo = float(now - self.start_time)
-
-                        self.yaw = self.filter_yaw.filter(
-                            t_relativo, 
-                            float(raw_yaw * self.config.get('t_sens_x', 10.0))
-                        )
-                        
-                        self.pitch = self.filter_pitch.filter(
-                            t_relativo, 
-                            float(raw_pitch * self.config.get('t_sens_y', 10.0))
-                        )
-                        
-                        if self.show_debug: 
-                            self._draw_debug(frame, target_pt, self.ref_x, self.ref_y, img_w, img_h)
-
-                if self.show_debug:
-                    cv2.imshow("TRACKER DEBUG (Rust Filter)", frame)
-                    if cv2.waitKey(1) & 0xFF == ord('q'): 
-                        self.running = False; break
+            except Exception as e:
+                self.stats.count('errors')
+                print(f"[TRACKER CAPTURE ERROR] {e}")
+                time.sleep(0.1)
+
+        self.slot.close()
+        if self.cap: self.cap.release()
+
+    def _capture_once(self):
+        """Lee un frame dentro de un buffer del pool y lo publica en el slot."""
+        buf = self.slot.acquire()
+        t0 = time.perf_counter()
+        success, frame = self.cap.read(buf) if buf is not None else self.cap.read()
+        self.stats.add('capture', time.perf_counter() - t0)
+        if not success:
+            self.slot.release(buf)
+            return False
+        # Marcamos el instante de captura (lo fija la fuente), no el de inferencia
+        now = self.cap.stamp
+        if frame is not buf:
+            # Primer frame o cambio de resolución: (re)creamos el pool con ese tamaño
+            self.slot.release(buf)
+            self.slot.allocate(frame.shape, frame.dtype)
+        # Fuentes grabadas sin tiempo real: esperamos al consumidor en vez de descartar
+        self.slot.put(frame, now, block=not self.cap.realtime)
+        return True
+
+    def _buffer(self, name, shape):
+        """Buffer de trabajo preasignado; sólo se recrea si cambia el tamaño."""
+        buf = self._buffers.get(name)
+        if buf is None or buf.shape != shape:
+            buf = self._buffers[name] = np.empty(shape, dtype=np.uint8)
+        return buf
+
+    def _loop(self):
+        while self.running:
+            try:
+                item = self.slot.take(timeout=0.1)
+                if item is None:
+                    if self.slot.closed: break
+                    continue
+                frame, now = item
+                try:
+                    self._process_frame(frame, now)
+                    self.stats.count('frames')
+                finally:
+                    self.slot.release(frame)
 
             except Exception as e:
+                self.stats.count('errors')
                 print(f"[TRACKER ERROR] {e}")
-            
-            time.sleep(0.01)
 
-        if self.cap: self.cap.release()
         if self.landmarker: 
             try: self.landmarker.close() 
             except: pass
-        if self.show_debug: cv2.destroyAllWindows()
+        if self.recorder: self.recorder.close()
+        if self._debug_open: cv2.destroyAllWindows()
+
+    def _process_frame(self, frame, now):
+        """Un frame BGR de cámara (sin voltear) -> inferencia -> pose. Sin asignaciones en régimen estable."""
+        img_h, img_w = frame.shape[:2]
+        t0 = time.perf_counter()
+        
+        # ROI: recortamos alrededor de la cara anterior y reducimos a tamaño fijo
+        roi = self._roi if self.cfg.t_roi else None
+        if roi is not None:
+            x0, y0, x1, y1 = roi
+            size = self.cfg.t_roi_size
+            src = cv2.resize(frame[y0:y1, x0:x1], (size, size), dst=self._buffer('roi', (size, size, 3)),
+                             interpolation=cv2.INTER_AREA)
+            rgb = self._buffer('roi_rgb', (size, size, 3))
+        else:
+            src = frame
+            rgb = self._buffer('rgb', frame.shape)
+
+        # OpenCV entrega BGR; MediaPipe espera SRGB. Convertimos sobre un buffer fijo.
+        cv2.cvtColor(src, cv2.COLOR_BGR2RGB, dst=rgb)
+        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
+        t1 = time.perf_counter()
+        self.stats.add('convert', t1 - t0)
+        
+        timestamp_ms = int((now - self.start_time) * 1000)
+        if timestamp_ms <= self.last_timestamp_ms: timestamp_ms = self.last_timestamp_ms + 1
+        self.last_timestamp_ms = timestamp_ms
+
+        if self.landmarker:
+            if self.live_stream:
+                # El callback necesita saber qué recorte generó cada timestamp
+                self._pending[timestamp_ms] = (roi, img_w, img_h, t1)
+                while len(self._pending) > 32: self._pending.popitem(last=False)
+                # No bloquea: MediaPipe descarta frames si va atrasado
+                self.landmarker.detect_async(mp_image, timestamp_ms)
+            else:
+                detection = self.landmarker.detect_for_video(mp_image, timestamp_ms)
+                self.stats.add('detect', time.perf_counter() - t1)
+                self._handle_detection(detection, roi, img_w, img_h, now)
+
+        if self.show_debug:
+            # Sólo la ventana de debug paga el volteo (el espejo real se hace en landmarks)
+            view = cv2.flip(frame, 1)
+            if self._debug_pt is not None:
+                self._draw_debug(view, self._debug_pt, self.ref_x, self.ref_y, img_w, img_h)
+            if roi is not None:
+                cv2.rectangle(view, (img_w - roi[2], roi[1]), (img_w - roi[0], roi[3]), (255, 0, 255), 1)
+            cv2.imshow("TRACKER DEBUG (Rust Filter)", view)
+            self._debug_open = True
+            if cv2.waitKey(1) & 0xFF == ord('q'): 
+                self.running = False
+        elif self._debug_open:
+            # Debug apagado en caliente (set_debug): la ventana se cierra desde este mismo hilo
+            cv2.destroyAllWindows()
+            cv2.waitKey(1)
+            self._debug_open = False
+
+    def _on_result(self, result, output_image, timestamp_ms):
+        """Callback de LIVE_STREAM: corre en el hilo interno de MediaPipe."""
+        try:
+            if not self.running: return
+            roi, img_w, img_h, t_sent = self._pending.pop(
+                timestamp_ms, (None, output_image.width, output_image.height, None))
+            # En LIVE_STREAM 'detect' mide envío -> callback (incluye la cola interna)
+            if t_sent is not None: self.stats.add('detect', time.perf_counter() - t_sent)
+            stamp = self.start_time + timestamp_ms / 1000.0
+            self._handle_detection(result, roi, img_w, img_h, stamp)
+        except Exception as e:
+            self.stats.count('errors')
+            print(f"[TRACKER ERROR] {e}")
+
+    def _handle_detection(self, detection, roi, img_w, img_h, now):
+        if not detection.face_landmarks:
+            # Cara perdida: el próximo frame vuelve a escanear la imagen completa
+            self._roi = None
+            self.stats.count('no_face')
+            self._publish_no_face(now)
+            if self.recorder: self.recorder.append(now, None, img_w, img_h)
+            return
+        lm = detection.face_landmarks[0]
+        if self.cfg.t_roi:
+            # La caja del ROI vive en coordenadas de cámara (sin espejo)
+            self._roi = self._face_box(FrameLandmarks(lm, roi, img_w, img_h), img_w, img_h)
+        view = FrameLandmarks(lm, roi, img_w, img_h, mirror=True)
+        if self.recorder: self.recorder.append(now, view, img_w, img_h)
+        self._process_landmarks(view, img_w, img_h, now)
+
+    def _face_box(self, lm, img_w, img_h):
+        """Caja cuadrada (en píxeles) alrededor del contorno de la cara, con margen."""
+        xs = [lm[i].x for i in FACE_OVAL_IDX]
+        ys = [lm[i].y for i in FACE_OVAL_IDX]
+        cx = (min(xs) + max(xs)) * 0.5 * img_w
+        cy = (min(ys) + max(ys)) * 0.5 * img_h
+        side = max((max(xs) - min(xs)) * img_w, (max(ys) - min(ys)) * img_h)
+        side *= 1.0 + 2.0 * self.cfg.t_roi_margin
+        half = max(side, 32.0) * 0.5
+
+        x0 = max(0, int(cx - half)); y0 = max(0, int(cy - half))
+        x1 = min(img_w, int(cx + half)); y1 = min(img_h, int(cy + half))
+        if x1 - x0 < 16 or y1 - y0 < 16: return None
+        return (x0, y0, x1, y1)
+
+    def _process_landmarks(self, lm, img_w, img_h, now):
+        """Referencia dinámica + filtros Rust a partir de los landmarks del frame."""
+        t0 = time.perf_counter()
+        cfg = self.cfg  # un solo snapshot por frame, aunque update_config lo cambie a mitad
+        target_pt = lm[152]; eye_l = lm[33]; eye_r = lm[263]
+
+        dx = (eye_r.x - eye_l.x) * img_w
+        dy = (eye_r.y - eye_l.y) * img_h
+        face_width_px = math.hypot(dx, dy)
+        if face_width_px < 1.0: face_width_px = 1.0
+
+        # CENTRO DINÁMICO (Esto sigue en Python porque es lógica simple)
+        if self.needs_recenter:
+            self.ref_x = target_pt.x
+            self.ref_y = target_pt.y
+            self.needs_recenter = False
+            self.predictor.reset()  # el salto de referencia no es velocidad de la cabeza
+        else:
+            dist_from_center = math.hypot(target_pt.x - self.ref_x, target_pt.y - self.ref_y)
+            if dist_from_center < 0.15:
+                drag_factor = cfg.t_center_drag
+                self.ref_x += (target_pt.x - self.ref_x) * drag_factor
+                self.ref_y += (target_pt.y - self.ref_y) * drag_factor
+
+        delta_x = (target_pt.x - self.ref_x) * img_w
+        delta_y = (target_pt.y - self.ref_y) * img_h
+        
+        raw_yaw = delta_x / face_width_px
+        raw_pitch = delta_y / face_width_px
+
+        t_relativo = float(now - self.start_time)
+        t1 = time.perf_counter()
+        self.stats.add('pose', t1 - t0)
+
+        yaw = self.filter_yaw.filter(t_relativo, float(raw_yaw * cfg.t_sens_x))
+        pitch = self.filter_pitch.filter(t_relativo, float(raw_pitch * cfg.t_sens_y))
+        if cfg.t_predict:
+            self.predictor.update(t_relativo, yaw, pitch)
+            yaw, pitch = self.predictor.predict(cfg.t_predict_horizon_ms * 0.001, cfg.t_predict_max)
+        self.stats.add('filter', time.perf_counter() - t1)
+
+        self._debug_pt = target_pt
+        self._publish_pose(yaw, pitch, now)
+
+    def _publish_pose(self, yaw, pitch, stamp):
+        # Un solo escritor por modo (hilo de inferencia o callback de MediaPipe):
+        # construimos el snapshot completo y sólo entonces cambiamos la referencia.
+        prev = self._snapshot
+        snap = self._snapshot = PoseSnapshot(yaw, pitch, stamp, prev.seq + 1, True)
+        sink = self._sink
+        if sink is not None:
+            try: sink(snap)
+            except Exception as e:
+                self.stats.count('errors')
+                print(f"[TRACKER SINK ERROR] {e}")
+        # Latencia extremo a extremo: captura -> pose filtrada. Sólo en vivo: sin tiempo real
+        # la fuente marca los frames con el tiempo del medio, no con el instante de captura
+        cap = self.cap
+        if self.running and cap is not None and cap.realtime: self.stats.add('latency', time.time() - stamp)
+
+    def _publish_no_face(self, stamp):
+        prev = self._snapshot
+        self._snapshot = PoseSnapshot(prev.yaw, prev.pitch, stamp, prev.seq + 1, False)
+
+    def set_sink(self, sink):
+        """
+        Destino al que se empuja cada pose filtrada apenas se calcula (desde el hilo del tracker).
+        sink: RustEngine (se llama a update_tracker(yaw, pitch)), cualquier callable(PoseSnapshot),
+        o None para desconectar.
+        """
+        if sink is not None and hasattr(sink, 'update_tracker'):
+            engine = sink
+            sink = lambda s: engine.update_tracker(float(s.yaw), float(s.pitch))
+        self._sink = sink
+
+    @property
+    def yaw(self):
+        return self._snapshot.yaw
+
+    @property
+    def pitch(self):
+        return self._snapshot.pitch
+
+    def get_snapshot(self):
+        """
+        PoseSnapshot(yaw, pitch, stamp, seq, face) coherente: yaw y pitch son del mismo frame.
+        stamp = instante de captura (time.time()), seq crece con cada frame procesado y
+        face indica si ese frame tuvo cara. Nunca bloquea al hilo de inferencia.
+        """
+        return self._snapshot
+
+    def get_stats(self):
+        """
+        Percentiles móviles (p50/p95/p99, en ms) por etapa: capture, convert, detect, pose,
+        filter y latency (captura -> pose), más contadores frames / no_face / errors /
+        captured / dropped.
+        """
+        out = self.stats.snapshot()
+        out['captured'] = self.slot.captured
+        out['dropped'] = self.slot.dropped
+        return out
+
+    def reset_stats(self):
+        self.stats.reset()
+        self.slot.captured = 0
+        self.slot.dropped = 0
 
     def _draw_debug(self, frame, point, cx, cy, w, h):
         nx, ny = int(point.x * w), int(point.y * h)
@@ -192,13 +526,24 @@ class HeadTracker:
 
     def get_axes(self):
         if not self.running: return 0.0, 0.0
-        # Reutilizamos la lógica del tracker
-        return self.yaw, self.pitch
+        snap = self._snapshot
+        return snap.yaw, snap.pitch
 
     def recenter(self):
         self.needs_recenter = True
 
+    def wait(self, timeout=None):
+        """Bloquea hasta que una fuente finita (video, secuencia) termine de procesarse."""
+        for t in (self.capture_thread, self.thread):
+            if t: t.join(timeout)
+
+    def set_debug(self, enabled):
+        """Activa/desactiva la ventana de debug sin reiniciar el tracker (worker caliente)."""
+        self.show_debug = bool(enabled)
+
     def stop(self):
         self.running = False
-        if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=2.0)
\ No newline at end of file
+        self.slot.close()
+        for t in (self.capture_thread, self.thread):
+            if t and t.is_alive():
+                t.join(timeout=2.0)
\ No newline at end of file
@@ -0,0 +1,305 @@
+"""
+Servicio de head tracking de larga vida: un solo proceso es dueño de la cámara y del
+landmarker; la GUI y el motor son clientes.
+
+- Poses: anillo en memoria compartida (SnapshotRing), sin syscalls por lectura.
+- Comandos: socket Unix local, una línea JSON por petición y por respuesta:
+    {"cmd": "hello"}                  -> {"ok": true, "shm": "<nombre del anillo>", "running": bool}
+    {"cmd": "config", "config": {..}} -> aplica HeadTracker.update_config
+    {"cmd": "recenter"} | {"cmd": "debug", "enabled": true} | {"cmd": "stats"}
+
+Uso (o automáticamente desde main.py con t_service activo):
+    python src/tracker_app.py
+"""
+import os
+import json
+import time
+import socket
+import struct
+import threading
+import socketserver
+from multiprocessing import shared_memory
+
+from backend.pose import PoseSnapshot
+from utils.shm import attach_shared_memory
+
+RING_SLOTS = 16
+# Cabecera: último seq publicado | latido del servicio (time.time())
+_HEADER = struct.Struct('<Qd')
+# Hueco: seq | yaw | pitch | stamp | face
+_SLOT = struct.Struct('<Qdddb7x')
+RING_SIZE = _HEADER.size + RING_SLOTS * _SLOT.size
+# Sin latido en este tiempo el servicio se da por muerto
+SERVICE_TIMEOUT_S = 2.0
+
+def default_socket_path():
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or '/tmp'
+    return os.path.join(runtime_dir, 'aero_tracker.sock')
+
+def socket_path(config):
+    return str(config.get('t_service_socket') or default_socket_path())
+
+class SnapshotRing:
+    """
+    Anillo de PoseSnapshot en memoria compartida. Un escritor (el servicio); lectores sin
+    bloqueo. Cada hueco guarda su propio seq, que se invalida (0) mientras se reescribe: una
+    lectura es válida si el seq del hueco coincide antes y después de leer el cuerpo.
+    """
+    def __init__(self, name=None):
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=RING_SIZE)
+            self.shm.buf[:RING_SIZE] = bytes(RING_SIZE)
+            self.owner = True
+        else:
+            self.shm = attach_shared_memory(name)
+            self.owner = False
+        self.name = self.shm.name
+        self._lock = threading.Lock()
+
+    def _slot_offset(self, seq):
+        return _HEADER.size + (seq % RING_SLOTS) * _SLOT.size
+
+    def write(self, snap):
+        """Publica un snapshot (se ignoran los que no son más nuevos que el último)."""
+        with self._lock:
+            buf = self.shm.buf
+            head, _ = _HEADER.unpack_from(buf, 0)
+            if snap.seq <= head: return
+            off = self._slot_offset(snap.seq)
+            # Cuerpo con seq inválido y el seq al final: nunca hay un hueco "válido" a medias
+            _SLOT.pack_into(buf, off, 0, snap.yaw, snap.pitch, snap.stamp, bool(snap.face))
+            struct.pack_into('<Q', buf, off, snap.seq)
+            _HEADER.pack_into(buf, 0, snap.seq, time.time())
+
+    def beat(self):
+        with self._lock:
+            head, _ = _HEADER.unpack_from(self.shm.buf, 0)
+            _HEADER.pack_into(self.shm.buf, 0, head, time.time())
+
+    def _read_slot(self, seq):
+        buf = self.shm.buf
+        off = self._slot_offset(seq)
+        s1, yaw, pitch, stamp, face = _SLOT.unpack_from(buf, off)
+        if s1 != seq or struct.unpack_from('<Q', buf, off)[0] != seq: return None
+        return PoseSnapshot(yaw, pitch, stamp, seq, bool(face))
+
+    def latest(self, retries=4):
+        """Último PoseSnapshot publicado, o None si aún no hay ninguno."""
+        for _ in range(retries):
+            head, _ = _HEADER.unpack_from(self.shm.buf, 0)
+            if head == 0: return None
+            snap = self._read_slot(head)
+            if snap is not None: return snap
+        return None
+
+    def read_since(self, seq):
+        """Snapshots con seq > seq que aún siguen en el anillo (los más viejos se pierden)."""
+        head, _ = _HEADER.unpack_from(self.shm.buf, 0)
+        first = max(seq + 1, head - RING_SLOTS + 1, 1)
+        out = []
+        for s in range(first, head + 1):
+            snap = self._read_slot(s)
+            if snap is not None: out.append(snap)
+        return out
+
+    @property
+    def heartbeat(self):
+        return _HEADER.unpack_from(self.shm.buf, 0)[1]
+
+    def close(self):
+        try: self.shm.close()
+        except: pass
+        if self.owner:
+            try: self.shm.unlink()
+            except: pass
+
+class TrackerService:
+    """Proceso dueño de la cámara: HeadTracker local + anillo + socket de comandos."""
+    PUMP_HZ = 50
+
+    def __init__(self, config, show_debug=False):
+        from backend.tracker import HeadTracker
+        self.path = socket_path(config)
+        self.tracker = HeadTracker(source=0, config=config, show_debug=show_debug)
+        self.ring = SnapshotRing()
+        self.lock = threading.Lock()
+        self.running = True
+        # Las poses con cara se publican apenas se calculan; el bombeo cubre frames sin cara y el latido
+        self.tracker.set_sink(self.ring.write)
+        self.pump = threading.Thread(target=self._pump, daemon=True)
+        self.pump.start()
+
+        if os.path.exists(self.path): os.unlink(self.path)
+        service = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    try: reply = service.handle(json.loads(line))
+                    except Exception as e: reply = {'ok': False, 'error': str(e)}
+                    self.wfile.write((json.dumps(reply) + "\n").encode())
+
+        self.server = socketserver.ThreadingUnixStreamServer(self.path, Handler)
+        self.server.daemon_threads = True
+        print(f"[SERVICE] Tracker en {self.path} (anillo {self.ring.name})", flush=True)
+
+    def _pump(self):
+        while self.running:
+            # El latido es el del tracker, no el del proceso: si el tracker murió (cámara
+            # perdida) los clientes deben verlo caído y reconstruirlo
+            if self.tracker.running:
+                self.ring.write(self.tracker.get_snapshot())
+                self.ring.beat()
+            time.sleep(1.0 / self.PUMP_HZ)
+
+    def handle(self, msg):
+        cmd = msg.get('cmd')
+        with self.lock:
+            if cmd == 'hello':
+                return {'ok': True, 'shm': self.ring.name, 'running': self.tracker.running}
+            if cmd == 'config':
+                self.tracker.update_config(msg.get('config') or {})
+                return {'ok': True}
+            if cmd == 'recenter':
+                self.tracker.recenter()
+                return {'ok': True}
+            if cmd == 'debug':
+                self.tracker.set_debug(msg.get('enabled', False))
+                return {'ok': True}
+            if cmd == 'stats':
+                return {'ok': True, 'stats': self.tracker.get_stats()}
+        return {'ok': False, 'error': f"comando desconocido: {cmd}"}
+
+    def serve(self):
+        try: self.server.serve_forever(poll_interval=0.2)
+        finally: self.close()
+
+    def close(self):
+        self.running = False
+        self.server.server_close()
+        try: os.unlink(self.path)
+        except OSError: pass
+        self.tracker.set_sink(None)
+        self.tracker.stop()
+        self.ring.close()
+
+class TrackerClient:
+    """
+    Misma interfaz que HeadTracker (get_snapshot, get_axes, update_config, recenter,
+    set_debug, set_sink, get_stats, stop), respaldada por el servicio.
+    stop() sólo desconecta: la cámara y el modelo siguen abiertos en el servicio.
+    """
+    FOLLOW_S = 0.001
+
+    def __init__(self, path, timeout=1.0):
+        self.path = path
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(path)
+        self.rfile = self.sock.makefile('rb')
+        self._lock = threading.Lock()
+        hello = self._call({'cmd': 'hello'})
+        if not hello.get('running'):
+            self.sock.close()
+            raise RuntimeError("el tracker del servicio no está corriendo")
+        self.ring = SnapshotRing(hello['shm'])
+        self._sink = None
+        self._follower = None
+        self._closed = False
+        self.show_debug = False
+
+    def _call(self, msg):
+        with self._lock:
+            self.sock.sendall((json.dumps(msg) + "\n").encode())
+            reply = json.loads(self.rfile.readline())
+        if not reply.get('ok'): raise RuntimeError(reply.get('error', 'error del servicio'))
+        return reply
+
+    def _try(self, msg):
+        try: return self._call(msg)
+        except (OSError, ValueError, RuntimeError) as e:
+            print(f"[TRACKER CLIENT] {msg.get('cmd')} falló: {e}")
+            return None
+
+    @property
+    def running(self):
+        return not self._closed and time.time() - self.ring.heartbeat < SERVICE_TIMEOUT_S
+
+    def get_snapshot(self):
+        snap = self.ring.latest()
+        return snap if snap is not None else PoseSnapshot(0.0, 0.0, 0.0, 0, False)
+
+    @property
+    def yaw(self): return self.get_snapshot().yaw
+
+    @property
+    def pitch(self): return self.get_snapshot().pitch
+
+    def get_axes(self):
+        snap = self.get_snapshot()
+        return snap.yaw, snap.pitch
+
+    def update_config(self, new_config):
+        if new_config: self._try({'cmd': 'config', 'config': dict(new_config)})
+
+    def recenter(self):
+        self._try({'cmd': 'recenter'})
+
+    def set_debug(self, enabled):
+        self.show_debug = bool(enabled)
+        self._try({'cmd': 'debug', 'enabled': self.show_debug})
+
+    def get_stats(self):
+        reply = self._try({'cmd': 'stats'})
+        return reply['stats'] if reply else None
+
+    def set_sink(self, sink):
+        """Como HeadTracker.set_sink: un hilo sigue el anillo y empuja cada pose con cara."""
+        if sink is not None and hasattr(sink, 'update_tracker'):
+            engine = sink
+            sink = lambda snap: engine.update_tracker(float(snap.yaw), float(snap.pitch))
+        self._sink = sink
+        if sink is not None and not (self._follower and self._follower.is_alive()):
+            self._follower = threading.Thread(target=self._follow, daemon=True)
+            self._follower.start()
+
+    def _follow(self):
+        last = self.get_snapshot().seq
+        while not self._closed and self._sink is not None:
+            for snap in self.ring.read_since(last):
+                last = snap.seq
+                sink = self._sink
+                if snap.face and sink is not None:
+                    try: sink(snap)
+                    except Exception as e: print(f"[TRACKER CLIENT] Error en sink: {e}")
+            time.sleep(self.FOLLOW_S)
+
+    def stop(self):
+        self._closed = True
+        self._sink = None
+        # El seguidor lee el anillo: debe terminar antes de cerrar la memoria compartida
+        follower = self._follower
+        if follower and follower is not threading.current_thread():
+            follower.join(timeout=1.0)
+        self._follower = None
+        try: self.sock.close()
+        except: pass
+        self.ring.close()
+
+def open_tracker(config, show_debug=False):
+    """
+    Con t_service activo intenta conectarse al servicio (sin reabrir cámara ni modelo);
+    si no responde, crea un HeadTracker local como siempre.
+    """
+    if config.get('t_service'):
+        path = socket_path(config)
+        try:
+            client = TrackerClient(path)
+            client.update_config(config)
+            client.set_debug(show_debug)
+            print(f"[TRACKER] Conectado al servicio en {path}")
+            return client
+        except (OSError, ValueError, RuntimeError) as e:
+            print(f"[TRACKER] Servicio no disponible ({e}): tracker local")
+    from backend.tracker import HeadTracker
+    return HeadTracker(source=0, config=config, show_debug=show_debug)
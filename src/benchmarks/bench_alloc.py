@@ -0,0 +1,106 @@
+"""
+Benchmark: asignaciones de memoria por frame en el camino caliente del HeadTracker
+(captura en el pool -> conversión de color -> inferencia -> pose), medido con tracemalloc
+sobre un video sintético.
+
+Uso:
+    python src/benchmarks/bench_alloc.py --frames 300 --max-bytes-per-frame 64
+"""
+import sys
+import os
+import time
+import argparse
+import tempfile
+import tracemalloc
+import numpy as np
+import cv2
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.tracker import HeadTracker
+from backend.sources import VideoFileSource
+from utils.config import load_config
+
+def make_synthetic_video(path, frames=120, w=640, h=480, fps=30):
+    """Video con ruido y un óvalo 'cara' que se desplaza."""
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*'MJPG'), fps, (w, h))
+    rng = np.random.default_rng(0)
+    for i in range(frames):
+        img = rng.integers(0, 40, size=(h, w, 3), dtype=np.uint8)
+        cx = int(w / 2 + 80 * np.sin(i / 15.0))
+        cv2.ellipse(img, (cx, h // 2), (70, 95), 0, 0, 360, (140, 170, 210), -1)
+        writer.write(img)
+    writer.release()
+
+def step(tracker):
+    """Un frame por el camino caliente; False si la captura no dejó frame nuevo (como en _loop)."""
+    tracker._capture_once()
+    item = tracker.slot.take(timeout=0)
+    if item is None: return False
+    frame, now = item
+    try:
+        tracker._process_frame(frame, now)
+    finally:
+        tracker.slot.release(frame)
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description="Asignaciones por frame del tracker")
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--warmup', type=int, default=30)
+    parser.add_argument('--roi', action='store_true', help="Medir con inferencia ROI")
+    parser.add_argument('--max-bytes-per-frame', type=float, default=64.0)
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    video = os.path.join(tmp.name, "synthetic.avi")
+    make_synthetic_video(video)
+
+    config = load_config()
+    config['t_mode'] = 'video'
+    config['t_roi'] = args.roi
+    # Sin hilos: el camino de frames lo manejamos aquí, sobre el video en bucle
+    tracker = HeadTracker(source=None, config=config, show_debug=False)
+    if tracker.landmarker is None:
+        print("[BENCH] MediaPipe no disponible.")
+        sys.exit(2)
+    tracker.cap = VideoFileSource(video, realtime=False, loop=True)
+
+    for _ in range(args.warmup): step(tracker)
+
+    tracemalloc.start()
+    base_current, _ = tracemalloc.get_traced_memory()
+    snap_a = tracemalloc.take_snapshot()
+    t0 = time.perf_counter()
+    done = sum(step(tracker) for _ in range(args.frames))
+    elapsed = time.perf_counter() - t0
+    snap_b = tracemalloc.take_snapshot()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    diff = snap_b.compare_to(snap_a, 'lineno')
+    net = sum(d.size_diff for d in diff)
+    if not done:
+        print("[BENCH] La captura no entregó ningún frame.")
+        sys.exit(2)
+    per_frame_peak = (peak - base_current) / done
+
+    print(f"[BENCH] frames={done} (sin frame nuevo: {args.frames - done}) roi={args.roi} fps={done / elapsed:.1f}")
+    print(f"[BENCH] neto retenido: {net} B ({net / done:.1f} B/frame)")
+    print(f"[BENCH] pico sobre la base: {peak - base_current} B ({per_frame_peak:.1f} B/frame)")
+    for d in diff[:5]:
+        print(f"    {d}")
+
+    tracker.cap.release()
+    if tracker.landmarker: tracker.landmarker.close()
+    tmp.cleanup()
+
+    # Régimen estable: nada retenido por frame y ningún pico del tamaño de una imagen
+    frame_bytes = 640 * 480 * 3
+    if net / done > args.max_bytes_per_frame or peak - base_current >= frame_bytes // 2:
+        print("[BENCH] FALLO: el camino caliente sigue asignando memoria por frame.")
+        sys.exit(1)
+    print("[BENCH] OK")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Benchmark: latencia movimiento -> salida del motor de vuelo (RustEngine), sin HUD ni tracker.
+
+Crea un mouse virtual con uinput, arranca RustEngine.start() sobre él (igual que
+JoystickBackend.run), inyecta movimientos relativos con marca de tiempo y lee el joystick
+virtual que emite el motor. Reporta la distribución de latencia y el jitter.
+
+Requiere permisos sobre /dev/uinput y /dev/input (root o grupo input). No necesita display.
+
+Uso:
+    sudo .venv/bin/python src/benchmarks/bench_engine_latency.py --samples 2000 --report bench.json
+"""
+import sys
+import os
+import time
+import json
+import select
+import argparse
+import platform
+import random
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.native import HAS_RUST, rust_motor
+from evdev import UInput, InputDevice, list_devices, ecodes
+
+OUTPUT_NAME = "Thrustmaster T.16000M (Rust Thread)"
+SCREEN_W, SCREEN_H = 1920.0, 1080.0
+
+# Config fija: respuesta lineal, sin zona muerta ni magnetismo -> cada paso cambia ABS_X
+BENCH_CONFIG = {'radius': 320.0, 'curve': 1.0, 'deadzone': 0.0, 't_snap_axis': 0.0, 'snap': 0.0, 'outer': 0.0}
+
+def create_probe_mouse():
+    caps = {
+        ecodes.EV_REL: [ecodes.REL_X, ecodes.REL_Y, ecodes.REL_WHEEL, ecodes.REL_HWHEEL],
+        ecodes.EV_KEY: [ecodes.BTN_LEFT, ecodes.BTN_RIGHT, ecodes.BTN_MIDDLE],
+    }
+    return UInput(caps, name="latency-probe mouse")
+
+def find_output_device(timeout=3.0):
+    """El joystick virtual aparece cuando el hilo Rust arranca; tomamos el más reciente."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        found = []
+        for path in list_devices():
+            try:
+                dev = InputDevice(path)
+                if dev.name == OUTPUT_NAME: found.append(dev)
+                else: dev.close()
+            except OSError:
+                continue
+        if found:
+            found.sort(key=lambda d: int(d.path.rsplit('event', 1)[-1]))
+            for d in found[:-1]: d.close()
+            return found[-1]
+        time.sleep(0.05)
+    return None
+
+def wait_abs_x(dev, timeout):
+    """Primer ABS_X emitido por el motor; devuelve su timestamp de kernel o None."""
+    deadline = time.time() + timeout
+    while True:
+        remaining = deadline - time.time()
+        if remaining <= 0: return None
+        r, _, _ = select.select([dev.fd], [], [], remaining)
+        if not r: return None
+        for ev in dev.read():
+            if ev.type == ecodes.EV_ABS and ev.code == ecodes.ABS_X:
+                return ev.timestamp()
+
+def drain(dev):
+    try:
+        while select.select([dev.fd], [], [], 0)[0]:
+            for _ in dev.read(): pass
+    except BlockingIOError:
+        pass
+
+def summarize(lat_ms):
+    a = np.asarray(lat_ms, dtype=np.float64)
+    if a.size == 0: return {}
+    return {
+        'n': int(a.size),
+        'mean_ms': float(a.mean()),
+        'p50_ms': float(np.percentile(a, 50)),
+        'p95_ms': float(np.percentile(a, 95)),
+        'p99_ms': float(np.percentile(a, 99)),
+        'max_ms': float(a.max()),
+        'min_ms': float(a.min()),
+        # Jitter: dispersión de la latencia y variación entre muestras consecutivas
+        'jitter_std_ms': float(a.std()),
+        'jitter_succ_ms': float(np.abs(np.diff(a)).mean()) if a.size > 1 else 0.0,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Latencia mouse -> joystick virtual del RustEngine")
+    parser.add_argument('--samples', type=int, default=1000)
+    parser.add_argument('--warmup', type=int, default=50)
+    parser.add_argument('--step', type=int, default=40, help="Píxeles por movimiento inyectado")
+    parser.add_argument('--interval-ms', type=float, default=8.0, help="Pausa base entre movimientos")
+    parser.add_argument('--timeout-ms', type=float, default=100.0)
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--report', help="Ruta del reporte JSON")
+    args = parser.parse_args()
+    if not HAS_RUST:
+        # RustEngine no tiene equivalente en la referencia NumPy: no hay nada que medir
+        print("[BENCH] rust_motor no disponible: se omite la medición de latencia del motor")
+        return
+
+    rng = random.Random(args.seed)
+    probe = create_probe_mouse()
+    time.sleep(0.3)  # udev crea el nodo
+
+    engine = rust_motor.RustEngine()
+    c = BENCH_CONFIG
+    engine.update_config(c['radius'], c['curve'], c['deadzone'], c['t_snap_axis'], c['snap'], c['outer'])
+    engine.start(str(probe.device.path), SCREEN_W, SCREEN_H)
+
+    out = find_output_device()
+    if out is None:
+        print("[BENCH] No apareció el joystick virtual del motor.")
+        engine.stop(); probe.close()
+        sys.exit(2)
+    print(f"[BENCH] Entrada: {probe.device.path} -> Salida: {out.path}", flush=True)
+
+    latencies = []
+    lost = 0
+    direction = 1
+    try:
+        for i in range(args.warmup + args.samples):
+            drain(out)
+            t_inj = time.time()
+            probe.write(ecodes.EV_REL, ecodes.REL_X, direction * args.step)
+            probe.syn()
+            t_out = wait_abs_x(out, args.timeout_ms / 1000.0)
+            direction = -direction  # ida y vuelta al centro: ABS_X siempre cambia
+
+            if i >= args.warmup:
+                if t_out is None: lost += 1
+                else: latencies.append((t_out - t_inj) * 1000.0)
+
+            # Pausa con jitter sembrado: evita sincronizarnos con el período del motor
+            time.sleep(args.interval_ms / 1000.0 * (1.0 + 0.5 * rng.random()))
+    finally:
+        engine.stop()
+        out.close()
+        probe.close()
+
+    report = {
+        'benchmark': 'engine_motion_to_output',
+        'samples': args.samples, 'warmup': args.warmup, 'lost': lost,
+        'step_px': args.step, 'interval_ms': args.interval_ms, 'seed': args.seed,
+        'config': BENCH_CONFIG,
+        'host': {'python': platform.python_version(), 'kernel': platform.release(),
+                 'machine': platform.machine()},
+        'latency': summarize(latencies),
+    }
+    lat = report['latency']
+    if lat:
+        print(f"[BENCH] n={lat['n']} perdidos={lost}")
+        print(f"[BENCH] p50={lat['p50_ms']:.3f} ms  p95={lat['p95_ms']:.3f} ms  p99={lat['p99_ms']:.3f} ms  "
+              f"max={lat['max_ms']:.3f} ms")
+        print(f"[BENCH] jitter std={lat['jitter_std_ms']:.3f} ms  sucesivo={lat['jitter_succ_ms']:.3f} ms")
+    else:
+        print(f"[BENCH] Sin muestras válidas (perdidos={lost}).")
+
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report, f, indent=4)
+        print(f"[BENCH] Reporte: {args.report}")
+    sys.exit(0 if lat else 1)
+
+if __name__ == "__main__":
+    main()
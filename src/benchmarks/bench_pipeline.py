@@ -0,0 +1,56 @@
+"""
+Benchmark: frames por segundo máximos que procesa el pipeline completo del HeadTracker
+(captura -> conversión -> inferencia -> pose) sin cámara, sobre un video, un directorio
+de imágenes o un pipeline GStreamer.
+
+Uso:
+    python src/benchmarks/bench_pipeline.py --source vuelo.mp4
+    python src/benchmarks/bench_pipeline.py --source frames/ --realtime
+    python src/benchmarks/bench_pipeline.py --source "videotestsrc num-buffers=600"
+"""
+import sys
+import os
+import time
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.tracker import HeadTracker
+from backend.sources import open_source
+from backend.stats import format_stats
+from utils.config import load_config
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput del pipeline del tracker")
+    parser.add_argument('--source', required=True, help="Video, directorio o pipeline GStreamer")
+    parser.add_argument('--realtime', action='store_true', help="Respetar el ritmo del medio")
+    parser.add_argument('--mode', default='video', choices=('video', 'live_stream'))
+    parser.add_argument('--roi', action='store_true')
+    args = parser.parse_args()
+
+    config = load_config()
+    config['t_mode'] = args.mode
+    config['t_roi'] = args.roi
+
+    source = open_source(args.source, config, realtime=args.realtime)
+    if not source.isOpened():
+        print(f"[BENCH] No se pudo abrir la fuente: {args.source}")
+        sys.exit(2)
+
+    t0 = time.perf_counter()
+    tracker = HeadTracker(source=source, config=config, show_debug=False, realtime=args.realtime)
+    if not tracker.running:
+        print("[BENCH] El tracker no arrancó (¿MediaPipe/modelo?).")
+        sys.exit(2)
+    tracker.wait()
+    elapsed = time.perf_counter() - t0
+    tracker.stop()
+
+    stats = tracker.get_stats()
+    done = stats['frames']
+    print(f"[BENCH] fuente={args.source} realtime={args.realtime} modo={args.mode} roi={args.roi}")
+    print(format_stats(stats))
+    print(f"[BENCH] {elapsed:.2f}s -> {done / elapsed:.1f} fps procesados")
+
+if __name__ == "__main__":
+    main()
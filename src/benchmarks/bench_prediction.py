@@ -0,0 +1,132 @@
+"""
+Evaluación offline de la predicción de pose (t_predict, backend/predictor.py).
+
+Pasa una sesión grabada (o una sintética con miradas rápidas a los lados) por la etapa
+referencia/drag/filtros de HeadTracker con y sin predicción, y compara cada salida con
+la pose cruda (misma etapa sin One-Euro) como referencia:
+- retraso: desplazamiento temporal que mejor alinea la salida con la pose cruda
+- jitter: RMS de la segunda diferencia por frame (ruido de alta frecuencia)
+- sobrepaso: cuánto se pasa la salida del rango de la pose cruda en las miradas
+
+Uso:
+    python src/benchmarks/bench_prediction.py --session grabaciones/20250101_200000
+    python src/benchmarks/bench_prediction.py --minutes 10 --horizons 20 40 60 80
+"""
+import sys
+import os
+import argparse
+import tempfile
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.recording import POSE_POINTS, write_session, replay
+from backend.tracker import HeadTracker
+from utils.config import load_config
+
+MAX_SHIFT_MS = 200.0
+
+class Passthrough:
+    """Sustituto del filtro One-Euro para obtener la pose cruda."""
+    beta = 0.0
+    def filter(self, t, x): return x
+
+def make_glance_session(path, minutes, fps=60.0, seed=0):
+    """Miradas rápidas (~250 ms) a posiciones al azar, sostenidas 1-3 s, más ruido de landmarks."""
+    n = int(minutes * 60 * fps)
+    rng = np.random.default_rng(seed)
+    t = np.arange(n) / fps
+    target = np.zeros((n, 2))
+    i = 0
+    pos = np.zeros(2)
+    while i < n:
+        hold = int(rng.uniform(1.0, 3.0) * fps)
+        nxt = rng.uniform(-0.06, 0.06, 2)
+        ramp = min(int(0.25 * fps), n - i)
+        # Transición suave (coseno) y luego quieto
+        w = 0.5 - 0.5 * np.cos(np.linspace(0, np.pi, ramp))[:, None]
+        target[i:i + ramp] = pos + (nxt - pos) * w
+        target[i + ramp:i + hold] = nxt
+        pos = nxt
+        i += hold
+
+    pts = np.zeros((n, len(POSE_POINTS), 2))
+    pts[:, 0, 0] = 0.5 + target[:, 0] + rng.normal(0, 0.0015, n)
+    pts[:, 0, 1] = 0.7 + target[:, 1] + rng.normal(0, 0.0015, n)
+    pts[:, 1] = (0.42, 0.45)
+    pts[:, 2] = (0.58, 0.45)
+    return write_session(path, 1000.0 + t, pts)
+
+def run(path, config, passthrough=False):
+    tracker = HeadTracker(source=None, config=dict(config), model=False)
+    if passthrough:
+        tracker.filter_yaw = Passthrough(); tracker.filter_pitch = Passthrough()
+    out = replay(path, tracker=tracker)
+    return out['t'], out['face'], np.column_stack((out['yaw'], out['pitch'])).astype(np.float64)
+
+def estimate_lag(out, ref, mask, frame_s):
+    """Retraso (s) de out respecto de ref: mínimo del MSE sobre desplazamientos, con refinado parabólico."""
+    max_shift = max(2, int(MAX_SHIFT_MS / 1000.0 / frame_s))
+    errs = []
+    for s in range(-max_shift, max_shift + 1):
+        a = out[max(s, 0):len(out) + min(s, 0)]
+        b = ref[max(-s, 0):len(ref) + min(-s, 0)]
+        m = mask[max(s, 0):len(mask) + min(s, 0)] & mask[max(-s, 0):len(mask) + min(-s, 0)]
+        errs.append(np.mean((a[m] - b[m]) ** 2))
+    errs = np.array(errs)
+    k = int(np.argmin(errs))
+    frac = 0.0
+    if 0 < k < len(errs) - 1:
+        den = errs[k - 1] - 2 * errs[k] + errs[k + 1]
+        if den > 0: frac = 0.5 * (errs[k - 1] - errs[k + 1]) / den
+    return (k - max_shift + frac) * frame_s
+
+def metrics(out, ref, mask, frame_s):
+    lag = np.mean([estimate_lag(out[:, c], ref[:, c], mask, frame_s) for c in range(2)])
+    jitter = np.sqrt(np.mean(np.diff(out[mask], n=2, axis=0) ** 2))
+    lo, hi = ref[mask].min(axis=0), ref[mask].max(axis=0)
+    overshoot = np.max(np.maximum(out[mask] - hi, lo - out[mask]).clip(min=0.0))
+    rmse = np.sqrt(np.mean((out[mask] - ref[mask]) ** 2))
+    return lag, jitter, overshoot, rmse
+
+def main():
+    parser = argparse.ArgumentParser(description="Retraso vs jitter de la predicción de pose")
+    parser.add_argument('--session', help="Carpeta de una sesión grabada")
+    parser.add_argument('--minutes', type=float, default=5.0, help="Duración de la sesión sintética")
+    parser.add_argument('--horizons', type=float, nargs='+', default=[20.0, 40.0, 60.0, 80.0])
+    parser.add_argument('--max', type=float, default=None, help="t_predict_max (por defecto el de la config)")
+    args = parser.parse_args()
+
+    tmp = None
+    path = args.session
+    if not path:
+        tmp = tempfile.TemporaryDirectory()
+        path = tmp.name
+        n = make_glance_session(path, args.minutes)
+        print(f"[BENCH] Sesión sintética: {n} frames ({args.minutes:g} min a 60 fps, miradas rápidas)")
+
+    config = load_config()
+    if args.max is not None: config['t_predict_max'] = args.max
+
+    t, face, ref = run(path, {**config, 't_predict': False}, passthrough=True)
+    frame_s = float(np.median(np.diff(t))) if len(t) > 1 else 1.0 / 60.0
+    # Sin cara la salida se congela: sólo comparamos frames con cara
+    mask = face
+
+    rows = [("sin predicción", {**config, 't_predict': False})]
+    rows += [(f"predicción {h:g} ms", {**config, 't_predict': True, 't_predict_horizon_ms': h}) for h in args.horizons]
+
+    print(f"\n {'':<18} {'retraso':>10} {'jitter':>10} {'sobrepaso':>10} {'RMSE':>8}")
+    base = None
+    for name, cfg in rows:
+        _, _, out = run(path, cfg)
+        lag, jitter, overshoot, rmse = metrics(out, ref, mask, frame_s)
+        if base is None: base = (lag, jitter)
+        extra = "" if name == rows[0][0] else \
+            f"  (retraso {(lag - base[0]) * 1000:+.1f} ms, jitter x{jitter / max(base[1], 1e-12):.2f})"
+        print(f" {name:<18} {lag * 1000:8.1f} ms {jitter:10.5f} {overshoot:10.4f} {rmse:8.4f}{extra}")
+    print(f"\n Referencia (pose cruda sin One-Euro): jitter {metrics(ref, ref, mask, frame_s)[1]:.5f}")
+    if tmp: tmp.cleanup()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Paridad y velocidad: implementación de referencia NumPy (backend.reference) vs binding Rust.
+
+Comprueba que OneEuroFilter/OneEuroBank y StickPhysics (escalar y por lotes) calculan lo
+mismo que RustFilter/RustPhysics sobre datos sembrados, y mide cada variante. Sin la
+extensión compilada sólo compara la referencia consigo misma (escalar vs lotes).
+Sale con código 1 si alguna comparación supera la tolerancia.
+
+Uso:
+    python src/benchmarks/bench_reference.py --points 200000 --samples 20000
+"""
+import sys
+import os
+import time
+import argparse
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.reference import OneEuroFilter, OneEuroBank, StickPhysics
+from backend.native import HAS_RUST, rust_motor
+from backend.response import evaluate
+
+# (radius, curve, deadzone, snap_axis, snap_threshold, outer)
+PHYSICS_CASES = [
+    (320.0, 2.0, 0.05, 0.25, 0.08, 60.0),
+    (300.0, 1.0, 0.0, 0.0, 0.0, 0.0),
+    (500.0, 3.5, 0.2, 0.5, 0.15, 200.0),
+]
+FILTER_CASES = [(0.05, 0.5, 1.0), (1.0, 0.01, 1.0), (0.05, 1.0, 2.0)]
+
+# Rust calcula en f32; la referencia escalar en f64
+FILTER_ATOL = 1e-4
+AXIS_ATOL = 1e-4
+# Flags en el borde exacto de un umbral pueden diferir entre f32 y f64
+FLAG_MISMATCH_MAX = 1e-3
+
+failures = []
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - t0
+
+def check(name, ok, detail):
+    print(f"  {'OK  ' if ok else 'FAIL'} {name}: {detail}")
+    if not ok: failures.append(name)
+
+def random_walk(rng, n, fps=60.0):
+    t = np.arange(n) / fps
+    x = np.cumsum(rng.normal(0.0, 0.01, n)) + 0.5 * (rng.random(n) < 0.01) * rng.normal(0.0, 1.0, n)
+    return t.astype(np.float32), x.astype(np.float32)
+
+def run_filter(params, t, x, cls):
+    f = cls(*params)
+    return np.array([f.filter(float(ti), float(xi)) for ti, xi in zip(t, x)])
+
+def bench_filters(rng, samples):
+    print("\n[FILTRO One-Euro]")
+    for params in FILTER_CASES:
+        t, x = random_walk(rng, samples)
+        ref, t_ref = timed(run_filter, params, t, x, OneEuroFilter)
+
+        # Banco de 2 canales (yaw/pitch) contra dos filtros escalares
+        x2 = np.column_stack((x, x[::-1]))
+        bank, t_bank = timed(OneEuroBank(2, *params).filter_series, t, x2)
+        ref2 = run_filter(params, t, x2[:, 1], OneEuroFilter)
+        err = max(np.abs(bank[:, 0] - ref).max(), np.abs(bank[:, 1] - ref2).max())
+        check(f"banco vs escalar {params}", err <= 1e-12, f"max|err|={err:.2e}")
+
+        line = f"  tiempos: referencia {t_ref / samples * 1e6:.2f} us/muestra, banco x2 {t_bank / samples * 1e6:.2f} us/paso"
+        if HAS_RUST:
+            rust, t_rust = timed(run_filter, params, t, x, rust_motor.RustFilter)
+            err = np.abs(rust - ref).max()
+            check(f"Rust vs referencia {params}", err <= FILTER_ATOL, f"max|err|={err:.2e}")
+            line += f", Rust {t_rust / samples * 1e6:.2f} us/muestra"
+        print(line)
+
+def compare_physics(name, a, b):
+    err = max(np.abs(np.asarray(a[0]) - b[0]).max(), np.abs(np.asarray(a[1]) - b[1]).max())
+    flags = (np.count_nonzero(np.asarray(a[2]) != b[2]) + np.count_nonzero(np.asarray(a[3]) != b[3])) / len(b[0])
+    check(name, err <= AXIS_ATOL and flags <= FLAG_MISMATCH_MAX, f"max|err|={err:.2e}, flags distintos={flags:.2e}")
+
+def bench_physics(rng, points):
+    print("\n[FÍSICA del stick]")
+    for params in PHYSICS_CASES:
+        span = (params[0] + params[5]) * 1.2
+        dx = rng.uniform(-span, span, points).astype(np.float32)
+        dy = rng.uniform(-span, span, points).astype(np.float32)
+        # Incluimos los ejes exactos y el centro (casos borde del magnetismo)
+        dx[:3] = (0.0, 10.0, 0.0); dy[:3] = (0.0, 0.0, -10.0)
+
+        ref = StickPhysics(*params)
+        n_scalar = min(points, 20000)
+        scalar, t_scalar = timed(lambda: list(zip(*[ref.calculate(float(a), float(b)) for a, b in zip(dx[:n_scalar], dy[:n_scalar])])))
+        batch, t_batch = timed(ref.calculate_batch, dx, dy)
+        compare_physics(f"lotes vs escalar {params}", [np.asarray(v) for v in scalar], [v[:n_scalar] for v in batch])
+
+        line = (f"  tiempos: referencia escalar {t_scalar / n_scalar * 1e6:.2f} us/punto, "
+                f"lotes NumPy {t_batch / points * 1e9:.1f} ns/punto")
+        if HAS_RUST:
+            rp = rust_motor.RustPhysics(*params)
+            rust_scalar, t_rs = timed(lambda: list(zip(*[rp.calculate(float(a), float(b)) for a, b in zip(dx[:n_scalar], dy[:n_scalar])])))
+            compare_physics(f"Rust escalar vs referencia {params}", rust_scalar, [v[:n_scalar] for v in batch])
+            line += f", Rust escalar {t_rs / n_scalar * 1e6:.2f} us/punto"
+            if hasattr(rp, 'calculate_batch'):
+                rust_batch, t_rb = timed(evaluate, rp, dx, dy)
+                compare_physics(f"Rust lotes vs referencia {params}", rust_batch, batch)
+                line += f", Rust lotes {t_rb / points * 1e9:.1f} ns/punto"
+        print(line)
+
+def main():
+    parser = argparse.ArgumentParser(description="Paridad y velocidad: referencia NumPy vs rust_motor")
+    parser.add_argument('--points', type=int, default=200000, help="Offsets por caso de física")
+    parser.add_argument('--samples', type=int, default=20000, help="Muestras por caso de filtro")
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"[BENCH] rust_motor: {'disponible' if HAS_RUST else 'NO disponible (sólo referencia)'}")
+    bench_filters(rng, args.samples)
+    bench_physics(rng, args.points)
+
+    if failures:
+        print(f"\n[BENCH] {len(failures)} comparaciones fuera de tolerancia.")
+        sys.exit(1)
+    print("\n[BENCH] Paridad OK.")
+
+if __name__ == "__main__":
+    main()
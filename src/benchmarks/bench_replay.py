@@ -0,0 +1,57 @@
+"""
+Benchmark: velocidad del replay de sesiones grabadas (backend.recording) a través de la
+etapa referencia/drag/filtros, sin MediaPipe ni cámara.
+
+Uso:
+    python src/benchmarks/bench_replay.py --session grabaciones/20250101_200000
+    python src/benchmarks/bench_replay.py --synthetic-hours 2
+"""
+import sys
+import os
+import time
+import argparse
+import tempfile
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.recording import POSE_POINTS, write_session, replay
+from utils.config import load_config
+
+def make_synthetic_session(path, hours, fps=60.0):
+    """Movimiento de cabeza sinusoidal + ruido, con ~1% de frames sin cara."""
+    n = int(hours * 3600 * fps)
+    rng = np.random.default_rng(0)
+    t = np.arange(n) / fps
+    face = rng.random(n) > 0.01
+    pts = np.zeros((n, len(POSE_POINTS), 2))
+    pts[:, 0, 0] = 0.5 + 0.08 * np.sin(t * 0.7) + rng.normal(0, 0.002, n)
+    pts[:, 0, 1] = 0.7 + 0.04 * np.sin(t * 0.3) + rng.normal(0, 0.002, n)
+    pts[:, 1] = (0.42, 0.45)
+    pts[:, 2] = (0.58, 0.45)
+    return write_session(path, 1000.0 + t, pts, face)
+
+def main():
+    parser = argparse.ArgumentParser(description="Velocidad de replay de landmarks")
+    parser.add_argument('--session', help="Carpeta de una sesión grabada")
+    parser.add_argument('--synthetic-hours', type=float, default=1.0)
+    args = parser.parse_args()
+
+    tmp = None
+    path = args.session
+    if not path:
+        tmp = tempfile.TemporaryDirectory()
+        path = tmp.name
+        n = make_synthetic_session(path, args.synthetic_hours)
+        print(f"[BENCH] Sesión sintética: {n} frames ({args.synthetic_hours:g} h a 60 fps)")
+
+    t0 = time.perf_counter()
+    out = replay(path, config=load_config())
+    elapsed = time.perf_counter() - t0
+    n = len(out['t'])
+    span_h = (out['t'][-1] - out['t'][0]) / 3600.0 if n else 0.0
+    print(f"[BENCH] {n} frames ({span_h:.2f} h) en {elapsed:.2f}s -> {n / max(elapsed, 1e-9):,.0f} frames/s")
+    if tmp: tmp.cleanup()
+
+if __name__ == "__main__":
+    main()
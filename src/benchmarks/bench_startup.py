@@ -0,0 +1,128 @@
+"""
+Benchmark: arranque en frío de la GUI y del motor.
+
+1. Perfil de importación (-X importtime) de los módulos de entrada: tiempo total y las
+   dependencias directas más pesadas.
+2. Tiempo hasta la primera ventana de la GUI (y hasta tener el tracker listo).
+3. Con --flight: tiempo hasta que el motor está listo para volar (RustEngine arrancado).
+   Necesita mouse/uinput (root o grupo input) y toma el mouse mientras dura.
+
+Los tiempos 2 y 3 se leen de las marcas '[STARTUP] etapa: X ms' (utils/startup.py),
+medidas desde el lanzamiento del proceso (AERO_T0).
+
+Uso:
+    python src/benchmarks/bench_startup.py --runs 3
+    sudo .venv/bin/python src/benchmarks/bench_startup.py --flight
+"""
+import sys
+import os
+import re
+import time
+import queue
+import signal
+import threading
+import argparse
+import subprocess
+import statistics
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(SRC_DIR)
+
+IMPORT_TARGETS = ('gui_app', 'backend.motor', 'backend.tracker')
+MARK_RE = re.compile(r'\[STARTUP\] (\S+): ([\d.]+) ms')
+IMPORT_RE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+def import_profile(module, top=8):
+    """(total_ms, [(ms, dependencia directa)], ok) según -X importtime."""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                          cwd=SRC_DIR, capture_output=True, text=True)
+    total, deps = None, []
+    for line in proc.stderr.splitlines():
+        m = IMPORT_RE.match(line)
+        if not m: continue
+        cumulative_ms = int(m.group(2)) / 1000.0
+        depth = (len(m.group(3)) - 1) // 2
+        if m.group(4) == module and depth == 0: total = cumulative_ms
+        elif depth == 1: deps.append((cumulative_ms, m.group(4)))
+    if proc.returncode != 0:
+        err = proc.stderr.strip().splitlines()
+        print(f"[BENCH] import {module} falló: {err[-1] if err else proc.returncode}")
+    deps.sort(reverse=True)
+    return total, deps[:top], proc.returncode == 0
+
+def time_to_marks(script, marks, timeout, stop_signal=signal.SIGTERM):
+    """Lanza el script y espera sus marcas de arranque. Devuelve {marca: ms}."""
+    env = dict(os.environ, AERO_T0=repr(time.time()))
+    proc = subprocess.Popen([sys.executable, '-u', script], cwd=SRC_DIR, env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    # readline() bloquea: un hilo lee las líneas y aquí se esperan con el tiempo restante
+    lines = queue.Queue()
+    def pump():
+        for line in proc.stdout: lines.put(line)
+        lines.put(None)
+    threading.Thread(target=pump, daemon=True).start()
+
+    found = {}
+    deadline = time.time() + timeout
+    try:
+        while len(found) < len(marks):
+            left = deadline - time.time()
+            if left <= 0:
+                print(f"[BENCH] {os.path.basename(script)}: {timeout:g} s sin ver {', '.join(m for m in marks if m not in found)}")
+                break
+            try: line = lines.get(timeout=left)
+            except queue.Empty: continue
+            if line is None:
+                print(f"[BENCH] {os.path.basename(script)} terminó (código {proc.wait()}) "
+                      f"sin ver {', '.join(m for m in marks if m not in found)}")
+                break
+            m = MARK_RE.search(line)
+            if m and m.group(1) in marks: found[m.group(1)] = float(m.group(2))
+    finally:
+        # Colgado o ya medido: se le pide salir y, si no responde, se mata
+        if proc.poll() is None:
+            proc.send_signal(stop_signal)
+            try: proc.wait(timeout=5)
+            except subprocess.TimeoutExpired: proc.kill(); proc.wait()
+    return found
+
+def report_runs(name, marks, runs):
+    for mark in marks:
+        vals = [r[mark] for r in runs if mark in r]
+        if not vals:
+            print(f" {name:<8} {mark:<20} sin marca (¿falló el arranque?)")
+            continue
+        print(f" {name:<8} {mark:<20} mediana {statistics.median(vals):8.1f} ms  "
+              f"min {min(vals):8.1f}  max {max(vals):8.1f}  (n={len(vals)})")
+
+def main():
+    parser = argparse.ArgumentParser(description="Arranque en frío: importaciones, primera ventana y vuelo listo")
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--timeout', type=float, default=30.0)
+    parser.add_argument('--no-gui', action='store_true', help="No lanzar la GUI (sin display)")
+    parser.add_argument('--flight', action='store_true', help="Medir también el motor (requiere hardware)")
+    args = parser.parse_args()
+
+    print("[BENCH] Perfil de importación (-X importtime)")
+    for module in IMPORT_TARGETS:
+        total, deps, ok = import_profile(module)
+        if total is None: continue
+        print(f"\n {module}: {total:.1f} ms{'' if ok else ' (incompleto)'}")
+        for ms, dep in deps:
+            print(f"    {ms:8.1f} ms  {dep}")
+
+    print()
+    if not args.no_gui:
+        marks = ('gui_window', 'gui_tracker')
+        runs = [time_to_marks(os.path.join(SRC_DIR, 'gui_app.py'), marks, args.timeout) for _ in range(args.runs)]
+        report_runs('GUI', marks, runs)
+
+    if args.flight:
+        # SIGINT -> KeyboardInterrupt: el motor suelta el mouse y limpia antes de salir
+        marks = ('motor_flight_ready', 'motor_tracker')
+        runs = [time_to_marks(os.path.join(SRC_DIR, 'motor_app.py'), marks, args.timeout, signal.SIGINT)
+                for _ in range(args.runs)]
+        report_runs('MOTOR', marks, runs)
+
+if __name__ == "__main__":
+    main()
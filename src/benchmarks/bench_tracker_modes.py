@@ -0,0 +1,71 @@
+"""
+Benchmark: latencia extremo a extremo (captura -> pose filtrada) del HeadTracker
+en modo VIDEO (detect_for_video bloqueante) vs LIVE_STREAM (detect_async).
+
+Uso:
+    python src/benchmarks/bench_tracker_modes.py --seconds 20 --source 0
+"""
+import sys
+import os
+import time
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.tracker import HeadTracker
+from backend.stats import format_stats
+from utils.config import load_config
+
+def run_mode(mode, source, seconds):
+    config = load_config()
+    config['t_mode'] = mode
+    tracker = HeadTracker(source=source, config=config, show_debug=False)
+    if not tracker.running:
+        print(f"[BENCH] No se pudo iniciar el tracker en modo {mode}")
+        return None
+
+    # Descartamos el arranque (carga del modelo, autoexposición de la cámara)
+    time.sleep(2.0)
+    tracker.reset_stats()
+
+    time.sleep(seconds)
+    stats = tracker.get_stats()
+    tracker.stop()
+
+    lat = stats['stages']['latency']
+    if lat['n'] == 0:
+        print(f"[BENCH] {mode}: sin poses (¿hay una cara frente a la cámara?)")
+        return None
+    print(format_stats(stats))
+    return {
+        'mode': mode,
+        'poses': lat['n'],
+        'captured': stats['captured'],
+        'dropped': stats['dropped'],
+        'p50': lat['p50'],
+        'p95': lat['p95'],
+        'p99': lat['p99'],
+        'max': lat['max'],
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Latencia de pose: VIDEO vs LIVE_STREAM")
+    parser.add_argument('--source', default=0, help="Índice de cámara")
+    parser.add_argument('--seconds', type=float, default=15.0)
+    args = parser.parse_args()
+    source = int(args.source) if str(args.source).isdigit() else args.source
+
+    results = []
+    for mode in ('video', 'live_stream'):
+        print(f"[BENCH] Midiendo modo {mode} durante {args.seconds:.0f}s...", flush=True)
+        r = run_mode(mode, source, args.seconds)
+        if r: results.append(r)
+
+    # 'poses' es la ventana móvil de latencias (máx. 2048 muestras)
+    print("\n MODO          POSES  CAPT  DROP   p50(ms)  p95(ms)  p99(ms)  max(ms)")
+    for r in results:
+        print(f" {r['mode']:<12} {r['poses']:>6} {r['captured']:>5} {r['dropped']:>5} "
+              f"{r['p50']:>9.1f} {r['p95']:>8.1f} {r['p99']:>8.1f} {r['max']:>8.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,11 @@ import pyautogui
 
 class JoystickHUD:
     def __init__(self, radius_px):
+        # Último estado dibujado por elemento: sólo se habla con Tk/X11 si cambia
+        self._drawn = {}
+        self.redraws = 0
+        self.skipped = 0
+
         # Obtener dimensiones de pantalla
         self.screen_w, self.screen_h = pyautogui.size()
         
@@ -91,19 +96,28 @@ class JoystickHUD:
     def draw_circle(self, canvas, x, y, r, **kwargs):
         return canvas.create_oval(x-r, y-r, x+r, y+r, **kwargs)
 
-    def update(self, x_norm, y_norm, throttle_val, rudder_val, head_yaw, head_pitch, is_deadzone, is_snapped):
+    def _set(self, canvas, item, coords, color=None):
+        """coords redondeadas a píxel; True si hubo que emitir algún comando a Tk."""
+        coords = tuple(int(round(c)) for c in coords)
+        last = self._drawn.get(item)
+        if last is not None and last[0] == coords and last[1] == color: return False
+        if last is None or last[0] != coords: canvas.coords(item, *coords)
+        if color is not None and (last is None or last[1] != color): canvas.itemconfig(item, fill=color)
+        self._drawn[item] = (coords, color)
+        return True
+
+    def update(self, x_norm, y_norm, throttle_val, rudder_val, head_yaw, head_pitch, is_deadzone, is_snapped, refresh=True):
         """
         Actualiza ambos HUDs.
         x_norm, y_norm: -1.0 a 1.0 (Stick)
         head_yaw, head_pitch: -1.0 a 1.0 (Cabeza)
+        refresh: False cuando corre dentro de su propio mainloop (HudProcess)
+        El tope de fps lo pone quien llama (HudProcess: tick a hud_fps).
         """
-        
         # --- 1. ACTUALIZAR STICK (DERECHA) ---
         vis_x = self.center + (x_norm * self.radius_vis)
         vis_y = self.center + (y_norm * self.radius_vis)
         
-        self.canvas.coords(self.stick_dot, vis_x-6, vis_y-6, vis_x+6, vis_y+6)
-        
         # Cambio de color según estado
         if is_deadzone: color = '#555'
         elif is_snapped: color = '#00ffff' # Cyan si está pegado al eje
@@ -112,25 +126,24 @@ class JoystickHUD:
             if abs(x_norm) > 0.99 or abs(y_norm) > 0.99: color = '#ff0000'
             else: color = '#ff8800' # Naranja normal
             
-        self.canvas.itemconfig(self.stick_dot, fill=color)
+        changed = self._set(self.canvas, self.stick_dot, (vis_x-6, vis_y-6, vis_x+6, vis_y+6), color)
 
         # --- 2. ACTUALIZAR THROTTLE ---
         # Mapeo de -1..1 a coordenadas Y (Invirtiendo eje Y de pantalla)
         # Base: 218, Tope: 40. Rango: 178px
         normalized_throttle = (throttle_val + 1.0) / 2.0
         bar_top_y = 218 - (normalized_throttle * 178)
-        self.canvas.coords(self.throttle_bar, 12, 218, 23, bar_top_y)
         
         # Color dinámico (WEP / Reverso)
         t_color = "#00ffff"
         if throttle_val > 0.95: t_color = "#ff0000" # WEP
         elif throttle_val < 0: t_color = "#ff5555" # Reverso
-        self.canvas.itemconfig(self.throttle_bar, fill=t_color)
+        changed |= self._set(self.canvas, self.throttle_bar, (12, 218, 23, bar_top_y), t_color)
 
         # --- 3. ACTUALIZAR RUDDER ---
         # Centro: 130. Ancho max: 90px por lado.
         r_len = rudder_val * 90
-        self.canvas.coords(self.rudder_bar, 130, 237, 130 + r_len, 248)
+        changed |= self._set(self.canvas, self.rudder_bar, (130, 237, 130 + r_len, 248))
 
         # --- 4. ACTUALIZAR TRACKER (IZQUIERDA) ---
         # Escala visual: 50px de desplazamiento máximo
@@ -138,10 +151,16 @@ class JoystickHUD:
         hx = self.track_center + (head_yaw * track_scale)
         hy = self.track_center + (head_pitch * track_scale)
         
-        self.cv_tracker.coords(self.head_dot, hx-4, hy-4, hx+4, hy+4)
+        changed |= self._set(self.cv_tracker, self.head_dot, (hx-4, hy-4, hx+4, hy+4))
+
+        if changed: self.redraws += 1
+        else: self.skipped += 1
+
+        # Refrescar ventanas (con mainloop propio Tk ya repinta solo)
+        if refresh: self.root.update()
 
-        # Refrescar ventanas
-        self.root.update()
+    def stats(self):
+        return {'redraws': self.redraws, 'skipped': self.skipped}
         
     def close(self):
         try: 
@@ -0,0 +1,114 @@
+import os
+import struct
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+from utils.shm import attach_shared_memory
+
+# Bloque compartido: seq | stick x, y | throttle | rudder | head yaw, pitch | deadzone | snap | cerrado
+# seq es un seqlock: impar mientras el motor escribe, par cuando el estado es consistente.
+HUD_FORMAT = '<I6f3B'
+HUD_SIZE = struct.calcsize(HUD_FORMAT)
+_SEQ = struct.Struct('<I')
+_BODY = struct.Struct('<6f2B')
+_CLOSED_OFFSET = HUD_SIZE - 1
+
+class HudState:
+    """Estado del HUD en memoria compartida. Un solo escritor (motor), lectores sin bloqueo."""
+    def __init__(self, name=None):
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=HUD_SIZE)
+            self.shm.buf[:HUD_SIZE] = bytes(HUD_SIZE)
+            self.owner = True
+        else:
+            self.shm = attach_shared_memory(name)
+            self.owner = False
+        self.name = self.shm.name
+        self.seq = 0
+
+    def write(self, lx, ly, lt, lr, hy, hp, dead, snap):
+        buf = self.shm.buf
+        self.seq += 1
+        _SEQ.pack_into(buf, 0, self.seq)  # impar: escritura en curso
+        _BODY.pack_into(buf, 4, lx, ly, lt, lr, hy, hp, bool(dead), bool(snap))
+        self.seq += 1
+        _SEQ.pack_into(buf, 0, self.seq)
+
+    def read(self, retries=4):
+        """(seq, valores) o None si el escritor estaba a mitad de escritura en todos los intentos."""
+        buf = self.shm.buf
+        for _ in range(retries):
+            s1 = _SEQ.unpack_from(buf, 0)[0]
+            if s1 & 1: continue
+            values = _BODY.unpack_from(buf, 4)
+            if _SEQ.unpack_from(buf, 0)[0] == s1:
+                return s1, values
+        return None
+
+    @property
+    def closed(self):
+        return bool(self.shm.buf[_CLOSED_OFFSET])
+
+    def mark_closed(self):
+        self.shm.buf[_CLOSED_OFFSET] = 1
+
+    def close(self):
+        try: self.shm.close()
+        except: pass
+        if self.owner:
+            try: self.shm.unlink()
+            except: pass
+
+def _hud_main(shm_name, radius, fps, parent_pid):
+    """Proceso del HUD: su propio mainloop de Tk, refrescando a 'fps' desde la memoria compartida."""
+    from frontend.hud import JoystickHUD
+    state = HudState(shm_name)
+    # El tope de fps lo impone tick(); JoystickHUD sólo filtra lo que no se movió
+    hud = JoystickHUD(radius)
+    period_ms = max(1, int(1000 / max(1.0, fps)))
+    last_seq = -1
+
+    def tick():
+        nonlocal last_seq
+        # Motor cerrado o muerto (huérfanos: el ppid cambia) -> cerramos
+        if state.closed or os.getppid() != parent_pid:
+            st = hud.stats()
+            print(f"[HUD] Redibujados: {st['redraws']} | sin cambios: {st['skipped']}", flush=True)
+            hud.close()
+            return
+        got = state.read()
+        if got and got[0] != last_seq:
+            last_seq = got[0]
+            lx, ly, lt, lr, hy, hp, dead, snap = got[1]
+            hud.update(lx, ly, lt, lr, hy, hp, dead, snap, refresh=False)
+        hud.root.after(period_ms, tick)
+
+    hud.root.after(period_ms, tick)
+    try: hud.root.mainloop()
+    finally: state.close()
+
+class HudProcess:
+    """
+    Misma interfaz que JoystickHUD (update/close) pero el dibujado vive en otro proceso:
+    update() sólo escribe en memoria compartida y nunca bloquea al motor.
+    """
+    def __init__(self, radius_px, fps=60):
+        self.state = HudState()
+        ctx = mp.get_context('spawn')
+        self.proc = ctx.Process(target=_hud_main, args=(self.state.name, float(radius_px), float(fps), os.getpid()),
+                                name="hud", daemon=True)
+        self.proc.start()
+        print(f"[HUD] Proceso iniciado (pid {self.proc.pid}, {fps:.0f} Hz)", flush=True)
+
+    @property
+    def alive(self):
+        return self.proc.is_alive()
+
+    def update(self, x_norm, y_norm, throttle_val, rudder_val, head_yaw, head_pitch, is_deadzone, is_snapped):
+        self.state.write(x_norm, y_norm, throttle_val, rudder_val, head_yaw, head_pitch, is_deadzone, is_snapped)
+
+    def close(self):
+        self.state.mark_closed()
+        self.proc.join(timeout=1.0)
+        if self.proc.is_alive(): self.proc.terminate()
+        self.state.close()
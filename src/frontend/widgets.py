@@ -4,9 +4,11 @@ from frontend.theme import COLOR_PANEL, COLOR_TEXT, COLOR_ACCENT, FONT_BOLD
 
 class ModernSlider(tk.Frame):
     """Widget compuesto: Etiqueta + Slider + Caja Numérica"""
-    def __init__(self, parent, text, from_, to, resolution, initial, command=None):
+    def __init__(self, parent, text, from_, to, resolution, initial, command=None, on_value=None):
         super().__init__(parent, bg=COLOR_PANEL)
         self.command = command
+        # on_value: avisa de cualquier cambio de valor (arrastre, caja numérica o set())
+        self.on_value = on_value
         
         # Aseguramos float
         val = float(initial) if initial is not None else from_
@@ -37,14 +39,18 @@ class ModernSlider(tk.Frame):
 
     def _on_change(self, val):
         if self.command: self.command()
+        if self.on_value: self.on_value()
         
     def _on_entry(self, event):
         try:
             val = float(self.entry.get())
             self.scale.set(val)
             if self.command: self.command()
+            if self.on_value: self.on_value()
         except ValueError: pass
         self.focus_set() 
 
     def get(self): return self.var.get()
-    def set(self, val): self.var.set(val)
\ No newline at end of file
+    def set(self, val):
+        self.var.set(val)
+        if self.on_value: self.on_value()
\ No newline at end of file
@@ -1,19 +1,21 @@
 import sys
 import os
 import json
-import math
+import threading
+import time
+import numpy as np
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import pyautogui
-from pynput import mouse as pynput_mouse
 
 # --- IMPORTS DE LÓGICA ---
-# YA NO IMPORTAMOS backend.inputs.InputPhysics
-# Ahora usamos el poder de Rust directamente:
-import rust_motor 
+# Física en Rust; si la extensión no carga, la referencia NumPy (backend.reference)
+from backend.native import RustPhysics, HAS_RUST
 
-from backend.tracker import HeadTracker
-from utils.config import load_config, save_config
+# backend.tracker (cv2 + mediapipe) se importa en segundo plano, ya con la ventana visible
+from backend.response import response_curve, response_grid
+from utils.config import load_config, save_config, normalize, default_config, ConfigError
+from utils.startup import mark
 
 # --- IMPORTS DE VISUALIZACIÓN ---
 from frontend.theme import apply_theme, COLOR_BG, COLOR_PANEL, COLOR_ACCENT, COLOR_WARN, FONT_BOLD, FONT_HEADER
@@ -22,49 +24,119 @@ from frontend.tooltips import create_help_icon
 
 pyautogui.FAILSAFE = False
 
+# Claves que afectan a la física del stick (el resto sólo interesa al tracker)
+PHYSICS_KEYS = ('radius', 'curve', 'deadzone', 't_snap_axis', 'snap', 'outer')
+# Espera tras el último cambio de slider antes de empujar la configuración
+CONFIG_DEBOUNCE_MS = 50
+# Mapa de respuesta 2D: celdas por lado y zoom en pantalla
+HEATMAP_N = 80
+HEATMAP_ZOOM = 2
+# Presupuesto de la previsualización (curva + mapa): un frame a 60 Hz
+PREVIEW_BUDGET_MS = 1000.0 / 60.0
+
+def _ramp(c0, c1):
+    """Tabla de 256 colores '#rrggbb' interpolando c0 -> c1 (para PhotoImage.put)."""
+    t = np.linspace(0.0, 1.0, 256)[:, None]
+    rgb = (np.array(c0) * (1 - t) + np.array(c1) * t).astype(int)
+    return np.array(['#%02x%02x%02x' % tuple(c) for c in rgb])
+
+HEAT_LUT = _ramp((17, 17, 17), (255, 136, 0))
+
 class ConfigLauncher:
-    def __init__(self):
-        self.current_config = load_config()
+    def __init__(self, tracker=None, embedded=False):
+        """
+        tracker: HeadTracker ya cargado (worker caliente); si es None se crea en segundo plano.
+        embedded: dentro del worker run() devuelve 'fly'/'close' en lugar de sys.exit, y el
+        tracker sigue vivo al cerrar la ventana (se recupera con take_tracker()).
+        """
+        self.embedded = embedded
+        self.result = None
+        try:
+            self.current_config = load_config()
+            self._config_error = None
+        except ConfigError as e:
+            # Nada de caer en silencio a los defaults: se avisa al abrir la ventana
+            print(f"[GUI] {e}", flush=True)
+            self.current_config = default_config()
+            self._config_error = str(e)
         self.running_preview = True
         self.live_throttle = 0.0
         self.live_rudder = 0.0
         self.pressed_buttons = set()
         self.after_id = None
         self.tracker = None
+        self._tracker_ready = tracker  # lo deja el hilo de arranque; lo adopta update_ui
+        self._tracker_thread = None
+        self._closing = False
+        # Modelo de configuración con claves sucias: clave -> (slider, tipo)
+        self.sliders = {}
+        self._dirty = set()
+        self._flush_id = None
         
-        # --- INICIALIZAR FÍSICA RUST ---
+        # --- INICIALIZAR FÍSICA ---
         # Creamos una instancia "dummy" inicial. Se actualizará en tiempo real.
-        try:
-            self.rust_physics = rust_motor.RustPhysics(
-                300.0, 1.0, 0.05, 0.1, 0.05, 50.0
-            )
-            print("[GUI] Motor físico Rust cargado para previsualización.")
-        except Exception as e:
-            print(f"[GUI CRITICAL] No se pudo cargar libreria Rust: {e}")
-            sys.exit(1)
+        # Sin la extensión Rust la previsualización usa la referencia NumPy (mismo modelo).
+        self.rust_physics = RustPhysics(300.0, 1.0, 0.05, 0.1, 0.05, 50.0)
+        print(f"[GUI] Física para previsualización: {'Rust' if HAS_RUST else 'referencia NumPy'}")
 
         self.root = tk.Tk()
-        self.root.title("AeroController // Pro Configurator (RUST NATIVE)")
+        self.root.title(f"AeroController // Pro Configurator ({'RUST NATIVE' if HAS_RUST else 'NUMPY FALLBACK'})")
         self.root.geometry("1200x780")
         self.root.configure(bg=COLOR_BG)
         self.root.protocol("WM_DELETE_WINDOW", self.on_close_window)
 
         apply_theme()
         self._build_layout()
-        self._init_hardware()
         
         self.screen_w, self.screen_h = pyautogui.size()
+        # Primer envío completo: la física arrancó con valores dummy
+        self._dirty.update(self.sliders)
+        self._flush_config()
         self.update_ui()
+        # Arranque por etapas: primero la ventana, luego el hardware
+        self.root.after(0, self._init_hardware)
+        if self._config_error:
+            self.root.after(100, lambda: messagebox.showwarning(
+                "Configuración inválida",
+                f"{self._config_error}\n\nSe cargaron los valores por defecto; al volar se sobrescribirá el archivo."))
 
     def _init_hardware(self):
-        print("[GUI] Iniciando Tracker en modo Debug...")
+        mark("gui_window")
+        from pynput import mouse as pynput_mouse
+        self.mouse_listener = pynput_mouse.Listener(on_scroll=self.on_scroll, on_click=self.on_click)
+        self.mouse_listener.start()
+
+        # Tracker caliente del worker (update_ui puede haberlo adoptado ya en el constructor)
+        if self.tracker or self._tracker_ready: return
+        # Modelo y cámara tardan segundos: los levantamos en un hilo para no congelar la ventana
+        print("[GUI] Iniciando Tracker en modo Debug (segundo plano)...")
+        self._tracker_thread = threading.Thread(target=self._start_tracker, daemon=True)
+        self._tracker_thread.start()
+
+    def _start_tracker(self):
         try:
-            self.tracker = HeadTracker(config=self.current_config, show_debug=True)
+            # Con t_service se conecta al servicio (cámara ya abierta); si no, tracker local
+            from backend.tracker_service import open_tracker
+            tracker = open_tracker(dict(self.current_config), show_debug=True)
         except Exception as e:
             print(f"[GUI ERROR] Fallo Tracker: {e}")
-            
-        self.mouse_listener = pynput_mouse.Listener(on_scroll=self.on_scroll, on_click=self.on_click)
-        self.mouse_listener.start()
+            return
+        # En modo embebido el worker se queda con el tracker aunque la ventana ya cerró
+        if self._closing and not self.embedded: tracker.stop()
+        else: self._tracker_ready = tracker
+
+    def _adopt_tracker(self):
+        """En el hilo de Tk: el tracker recién listo recibe la configuración actual de los sliders."""
+        tracker, self._tracker_ready = self._tracker_ready, None
+        if self.tracker is not None and self.tracker is not tracker:
+            # Nunca dos trackers a la vez: el sobrante soltaría la cámara sólo al morir el proceso
+            print("[GUI] Ya hay un tracker activo; se descarta el nuevo.")
+            tracker.stop()
+            return
+        tracker.update_config(self._get_current_config())
+        tracker.set_debug(True)
+        self.tracker = tracker
+        mark("gui_tracker")
 
     def _build_layout(self):
         main_container = tk.Frame(self.root, bg=COLOR_BG)
@@ -92,11 +164,15 @@ class ConfigLauncher:
         right_panel.pack(side='right', fill='both', expand=True)
         self._build_visualization_panel(right_panel)
 
-    def _add_slider_row(self, parent, text, min_v, max_v, step, val, key, cmd=None):
+    def _add_slider_row(self, parent, text, min_v, max_v, step, val, key, cmd=None, cfg_key=None, cast=float):
+        """key: clave de ayuda; cfg_key: clave de configuración (por defecto la misma)."""
+        cfg_key = cfg_key or key
         container = tk.Frame(parent, bg=COLOR_PANEL)
         container.pack(fill='x', padx=15, pady=2)
-        slider = ModernSlider(container, text, min_v, max_v, step, val, cmd)
+        slider = ModernSlider(container, text, min_v, max_v, step, val, cmd,
+                              on_value=lambda: self._mark_dirty(cfg_key))
         slider.pack(side='left', fill='x', expand=True)
+        self.sliders[cfg_key] = (slider, cast)
         icon = create_help_icon(container, key)
         icon.pack(side='right', padx=(10, 0), anchor='n', pady=5)
         return slider
@@ -108,20 +184,28 @@ class ConfigLauncher:
         pad = 15
         tk.Label(tab, text="GEOMETRÍA", bg=COLOR_PANEL, fg=COLOR_ACCENT, font=FONT_HEADER).pack(anchor='w', padx=pad, pady=(pad, 5))
         
-        self.s_radius = self._add_slider_row(tab, "Radio Máximo (px)", 100, 800, 10, self.current_config.get('radius', 300), "radius", self._update_curve_graph)
-        self.s_outer  = self._add_slider_row(tab, "Zona Saturación Extra (px)", 0, 200, 5, self.current_config.get('outer', 50), "outer")
+        self.s_radius = self._add_slider_row(tab, "Radio Máximo (px)", 100, 800, 10, self.current_config['radius'], "radius", cast=int)
+        self.s_outer  = self._add_slider_row(tab, "Zona Saturación Extra (px)", 0, 200, 5, self.current_config['outer'], "outer", cast=int)
 
         tk.Frame(tab, bg="#444", height=1).pack(fill='x', padx=pad, pady=10) 
 
         tk.Label(tab, text="RESPUESTA", bg=COLOR_PANEL, fg=COLOR_ACCENT, font=FONT_HEADER).pack(anchor='w', padx=pad, pady=(5, 5))
         
-        self.s_curve    = self._add_slider_row(tab, "Linealidad (Curva)", 1.0, 4.0, 0.1, self.current_config.get('curve', 1.0), "curve", self._update_curve_graph)
-        self.s_deadzone = self._add_slider_row(tab, "Zona Muerta (%)", 0.0, 0.30, 0.01, self.current_config.get('deadzone', 0.05), "deadzone")
-        self.s_snap     = self._add_slider_row(tab, "Magnetismo Ejes (%)", 0.0, 0.20, 0.01, self.current_config.get('snap', 0.05), "snap")
+        self.s_curve    = self._add_slider_row(tab, "Linealidad (Curva)", 1.0, 4.0, 0.1, self.current_config['curve'], "curve")
+        self.s_deadzone = self._add_slider_row(tab, "Zona Muerta (%)", 0.0, 0.30, 0.01, self.current_config['deadzone'], "deadzone")
+        self.s_snap     = self._add_slider_row(tab, "Magnetismo Ejes (%)", 0.0, 0.20, 0.01, self.current_config['snap'], "snap")
 
+        # Respuesta real del modelo (deadzone, magnetismo y saturación incluidos): se
+        # redibuja desde _flush_config cuando cambia alguna clave de física
         self.curve_canvas = tk.Canvas(tab, height=100, bg="#222", highlightthickness=0)
-        self.curve_canvas.pack(fill='x', padx=pad, pady=10)
-        self._update_curve_graph()
+        self.curve_canvas.pack(fill='x', padx=pad, pady=(10, 5))
+        size = HEATMAP_N * HEATMAP_ZOOM
+        self.heat_canvas = tk.Canvas(tab, width=size, height=size, bg="#111", highlightthickness=0)
+        self.heat_canvas.pack(padx=pad, pady=(0, 10))
+        self.heat_src = tk.PhotoImage(width=HEATMAP_N, height=HEATMAP_N)
+        self.heat_img = self.heat_src.zoom(HEATMAP_ZOOM)
+        self.heat_item = self.heat_canvas.create_image(0, 0, anchor='nw', image=self.heat_img)
+        self.preview_ms = 0.0
 
     def _build_tab_tracker(self):
         tab = tk.Frame(self.notebook, bg=COLOR_PANEL)
@@ -130,23 +214,23 @@ class ConfigLauncher:
         pad = 15
         tk.Label(tab, text="SENSIBILIDAD", bg=COLOR_PANEL, fg=COLOR_ACCENT, font=FONT_HEADER).pack(anchor='w', padx=pad, pady=(pad, 5))
         
-        self.t_sens_x = self._add_slider_row(tab, "Yaw (X)", 1.0, 20.0, 0.5, self.current_config.get('t_sens_x', 10.0), "t_sens_x")
-        self.t_sens_y = self._add_slider_row(tab, "Pitch (Y)", 1.0, 20.0, 0.5, self.current_config.get('t_sens_y', 10.0), "t_sens_y")
+        self.t_sens_x = self._add_slider_row(tab, "Yaw (X)", 1.0, 20.0, 0.5, self.current_config['t_sens_x'], "t_sens_x")
+        self.t_sens_y = self._add_slider_row(tab, "Pitch (Y)", 1.0, 20.0, 0.5, self.current_config['t_sens_y'], "t_sens_y")
 
         tk.Frame(tab, bg="#444", height=1).pack(fill='x', padx=pad, pady=10)
 
         tk.Label(tab, text="COMPORTAMIENTO", bg=COLOR_PANEL, fg=COLOR_ACCENT, font=FONT_HEADER).pack(anchor='w', padx=pad, pady=(5, 5))
         
-        self.t_center_drag = self._add_slider_row(tab, "Auto-Centrado (Peso)", 0.0, 0.02, 0.001, self.current_config.get('t_center_drag', 0.005), "t_center_drag")
-        self.t_smooth      = self._add_slider_row(tab, "Suavizado (Filtro)", 0.01, 1.0, 0.05, self.current_config.get('t_smooth', 0.5), "t_smooth")
-        self.t_deadzone    = self._add_slider_row(tab, "Deadzone Central", 0.0, 0.1, 0.005, self.current_config.get('t_deadzone', 0.02), "t_deadzone_t")
+        self.t_center_drag = self._add_slider_row(tab, "Auto-Centrado (Peso)", 0.0, 0.02, 0.001, self.current_config['t_center_drag'], "t_center_drag")
+        self.t_smooth      = self._add_slider_row(tab, "Suavizado (Filtro)", 0.01, 1.0, 0.05, self.current_config['t_smooth'], "t_smooth")
+        self.t_deadzone    = self._add_slider_row(tab, "Deadzone Central", 0.0, 0.1, 0.005, self.current_config['t_deadzone'], "t_deadzone_t", cfg_key="t_deadzone")
         
         tk.Frame(tab, bg="#444", height=1).pack(fill='x', padx=pad, pady=10)
         
         tk.Label(tab, text="MAGNETISMO (Snap)", bg=COLOR_PANEL, fg=COLOR_ACCENT, font=FONT_HEADER).pack(anchor='w', padx=pad, pady=(5, 5))
         
-        self.t_snap_axis  = self._add_slider_row(tab, "Fuerza Ejes", 0.0, 0.5, 0.05, self.current_config.get('t_snap_axis', 0.25), "t_snap_axis")
-        self.t_snap_outer = self._add_slider_row(tab, "Fuerza Bordes", 0.0, 0.3, 0.01, self.current_config.get('t_snap_outer', 0.10), "t_snap_outer")
+        self.t_snap_axis  = self._add_slider_row(tab, "Fuerza Ejes", 0.0, 0.5, 0.05, self.current_config['t_snap_axis'], "t_snap_axis")
+        self.t_snap_outer = self._add_slider_row(tab, "Fuerza Bordes", 0.0, 0.3, 0.01, self.current_config['t_snap_outer'], "t_snap_outer")
 
     def _build_tab_system(self):
         tab = tk.Frame(self.notebook, bg=COLOR_PANEL)
@@ -156,8 +240,10 @@ class ConfigLauncher:
         tk.Button(tab, text="Guardar Perfil Como...", bg="#444", fg="white", command=self._save_profile_dialog).pack(fill='x', padx=pad, pady=5)
         tk.Button(tab, text="Cargar Perfil...", bg="#444", fg="white", command=self._load_profile_dialog).pack(fill='x', padx=pad, pady=5)
         tk.Label(tab, text="Atajos:", bg=COLOR_PANEL, fg="gray").pack(anchor='w', padx=pad, pady=(20,5))
-        tk.Label(tab, text="• ALT+P: Pausar/Configurar", bg=COLOR_PANEL, fg="white").pack(anchor='w', padx=pad)
-        tk.Label(tab, text="• ALT/WIN + < : Recentrar", bg=COLOR_PANEL, fg="white").pack(anchor='w', padx=pad)
+        hk_exit = self.current_config['hk_exit'].upper()
+        hk_recenter = self.current_config['hk_recenter'].upper()
+        tk.Label(tab, text=f"• {hk_exit}: Pausar/Configurar", bg=COLOR_PANEL, fg="white").pack(anchor='w', padx=pad)
+        tk.Label(tab, text=f"• {hk_recenter} : Recentrar", bg=COLOR_PANEL, fg="white").pack(anchor='w', padx=pad)
 
     def _build_visualization_panel(self, parent):
         frame_stick = tk.Frame(parent, bg=COLOR_BG)
@@ -205,61 +291,86 @@ class ConfigLauncher:
         if self.tracker: self.tracker.recenter()
 
     def _update_curve_graph(self, val=None):
+        """Curva 1D y mapa 2D calculados en un solo lote por el modelo de física."""
+        t0 = time.perf_counter()
         w = self.curve_canvas.winfo_width()
         if w < 10: w = 350
         h = 100
+        radius = max(1.0, float(self.s_radius.get()))
+        outer = float(self.s_outer.get())
+        span = radius + outer
+
+        # --- 1D: eje X de 0 a radio + saturación ---
+        dx, fx, dead, snap = response_curve(self.rust_physics, radius, outer, n=max(2, w // 3))
+        xs = dx / span * (w - 1)
+        ys = h - 4 - fx * (h - 8)
+        points = np.column_stack((xs, ys)).ravel().tolist()
         self.curve_canvas.delete("all")
-        curve = self.s_curve.get()
-        points = []
-        for i in range(0, w, 5):
-            x_norm = i / w
-            y_norm = math.pow(x_norm, curve)
-            points.extend([i, h - (y_norm * h)])
+        rx = radius / span * (w - 1)
+        self.curve_canvas.create_line(rx, 0, rx, h, fill="#444", dash=(2, 4))
+        if dead.any():
+            self.curve_canvas.create_rectangle(0, 0, xs[dead].max(), h, fill="#555", outline="", stipple="gray25")
         self.curve_canvas.create_line(points, fill=COLOR_ACCENT, width=2)
 
-    def _get_current_config(self):
-        return {
-            'radius': int(self.s_radius.get()),
-            'curve': self.s_curve.get(),
-            'deadzone': self.s_deadzone.get(),
-            'snap': self.s_snap.get(),
-            'outer': int(self.s_outer.get()),
-            't_sens_x': self.t_sens_x.get(),
-            't_sens_y': self.t_sens_y.get(),
-            't_smooth': self.t_smooth.get(),
-            't_deadzone': self.t_deadzone.get(),
-            't_snap_axis': self.t_snap_axis.get(),
-            't_snap_outer': self.t_snap_outer.get(),
-            't_center_drag': self.t_center_drag.get()
-        }
+        # --- 2D: magnitud de salida en [-span, span]^2 ---
+        mag, dead2, _ = response_grid(self.rust_physics, span, n=HEATMAP_N)
+        level = (mag * 255).astype(np.intp)
+        colors = HEAT_LUT[level]
+        colors[dead2] = "#333333"
+        self.heat_src.put(" ".join("{" + " ".join(row) + "}" for row in colors), to=(0, 0))
+        self.heat_img = self.heat_src.zoom(HEATMAP_ZOOM)
+        self.heat_canvas.itemconfig(self.heat_item, image=self.heat_img)
+        self.preview_ms = (time.perf_counter() - t0) * 1000.0
+        if self.preview_ms > PREVIEW_BUDGET_MS:
+            print(f"[GUI] Previsualización del stick: {self.preview_ms:.1f} ms "
+                  f"(presupuesto {PREVIEW_BUDGET_MS:.1f} ms por frame)", flush=True)
+
+    def _get_current_config(self, keys=None):
+        keys = self.sliders if keys is None else keys
+        return {k: self.sliders[k][1](self.sliders[k][0].get()) for k in keys}
+
+    def _mark_dirty(self, key):
+        """Marca una clave como cambiada y agenda un único envío (debounce)."""
+        self._dirty.add(key)
+        if self._flush_id is None:
+            self._flush_id = self.root.after(CONFIG_DEBOUNCE_MS, self._flush_config)
+
+    def _flush_config(self):
+        """Envía sólo lo que cambió: al tracker sus claves, a la física sólo si tocó alguna suya."""
+        self._flush_id = None
+        if not self._dirty: return
+        try:
+            changes = self._get_current_config(self._dirty)
+        except (tk.TclError, ValueError):
+            # Caja numérica a medio escribir: reintentamos en el siguiente cambio
+            return
+        self._dirty.clear()
+
+        # Sólo las claves t_*: con t_service cada envío es una ida y vuelta por socket en el hilo de Tk
+        tracker_changes = {k: v for k, v in changes.items() if k.startswith('t_')}
+        if self.tracker and tracker_changes: self.tracker.update_config(tracker_changes)
+        if any(k in changes for k in PHYSICS_KEYS):
+            cfg = self._get_current_config(PHYSICS_KEYS)
+            self.rust_physics.update_config(*(float(cfg[k]) for k in PHYSICS_KEYS))
+            self._update_curve_graph()
 
     def update_ui(self):
         if not self.running_preview: return
+        if self._tracker_ready: self._adopt_tracker()
         try:
-            cfg = self._get_current_config()
-            if self.tracker: self.tracker.update_config(cfg)
-
             # --- PREVISUALIZACIÓN USANDO RUST ---
-            # 1. Actualizamos los parámetros de la física Rust en tiempo real
-            self.rust_physics.update_config(
-                float(cfg['radius']),
-                float(cfg['curve']),
-                float(cfg['deadzone']),
-                float(cfg.get('t_snap_axis', 0.25)), # Mapeo de nombre de config a Rust
-                float(cfg['snap']),
-                float(cfg['outer'])
-            )
-
-            # 2. Obtenemos posición mouse
+            # La configuración ya no se reenvía aquí: la empuja _flush_config cuando cambia.
+
+            # 1. Obtenemos posición mouse
             mx, my = pyautogui.position()
             dx = mx - (self.screen_w // 2)
             dy = my - (self.screen_h // 2)
 
-            # 3. CALCULAMOS (¡En Rust!)
+            # 2. CALCULAMOS (¡En Rust!)
             # Rust devuelve: (final_x, final_y, in_deadzone, is_snapped)
             fx, fy, in_deadzone, is_snapped = self.rust_physics.calculate(float(dx), float(dy))
 
-            # 4. Dibujar
+            # 3. Dibujar
             vs = self.vis_scale
             self.canvas.coords(self.dot, 
                                self.center_pt + (fx * vs) - 6, self.center_pt + (fy * vs) - 6,
@@ -301,20 +412,9 @@ class ConfigLauncher:
         fn = filedialog.askopenfilename(filetypes=[("JSON", "*.json")])
         if fn:
             try:
-                with open(fn, 'r') as f: cfg = json.load(f)
-                self.s_radius.set(cfg.get('radius', 300))
-                self.s_curve.set(cfg.get('curve', 1.0))
-                self.s_deadzone.set(cfg.get('deadzone', 0.05))
-                self.s_snap.set(cfg.get('snap', 0.05))
-                self.s_outer.set(cfg.get('outer', 50))
-                self.t_sens_x.set(cfg.get('t_sens_x', 10.0))
-                self.t_sens_y.set(cfg.get('t_sens_y', 10.0))
-                self.t_smooth.set(cfg.get('t_smooth', 0.5))
-                self.t_deadzone.set(cfg.get('t_deadzone', 0.02))
-                self.t_snap_axis.set(cfg.get('t_snap_axis', 0.25))
-                self.t_snap_outer.set(cfg.get('t_snap_outer', 0.10))
-                self.t_center_drag.set(cfg.get('t_center_drag', 0.005))
-                self._update_curve_graph()
+                with open(fn, 'r') as f: cfg = normalize(json.load(f), os.path.basename(fn))
+                for key, (slider, _) in self.sliders.items():
+                    slider.set(cfg[key])
             except Exception as e: messagebox.showerror("Error", str(e))
 
     def on_scroll(self, x, y, dx, dy):
@@ -327,26 +427,46 @@ class ConfigLauncher:
         else: self.pressed_buttons.discard(s)
 
     def _cleanup_before_exit(self):
+        self._closing = True
         self.running_preview = False
         if self.after_id: self.root.after_cancel(self.after_id)
+        if self._flush_id: self.root.after_cancel(self._flush_id)
         if hasattr(self, 'mouse_listener'): self.mouse_listener.stop()
+        if self.embedded: return  # el tracker lo conserva el worker
         if self.tracker: self.tracker.stop()
+        if self._tracker_ready: self._tracker_ready.stop()
+
+    def take_tracker(self, timeout=10.0):
+        """Modo embebido: entrega el tracker (esperando si aún carga) para reutilizarlo en vuelo."""
+        if self._tracker_thread and self._tracker_thread.is_alive():
+            self._tracker_thread.join(timeout=timeout)
+        tracker = self.tracker or self._tracker_ready
+        self.tracker = self._tracker_ready = None
+        return tracker
 
     def start_simulation(self):
         print("[GUI] Guardando configuración y arrancando motor...")
-        save_config(self._get_current_config())
+        # Conservamos las claves sin slider (atajos, cámara, modo del tracker...)
+        save_config({**self.current_config, **self._get_current_config()})
         self._cleanup_before_exit()
         self.root.destroy()
+        if self.embedded:
+            self.result = 'fly'
+            return
         print("[GUI] Saliendo con código 10...", flush=True)
         sys.exit(10)
 
     def on_close_window(self):
         self._cleanup_before_exit()
         self.root.destroy()
+        if self.embedded:
+            self.result = 'close'
+            return
         sys.exit(0)
 
     def run(self):
         self.root.mainloop()
+        return self.result
 
 if __name__ == "__main__":
     app = ConfigLauncher()
@@ -1,17 +1,73 @@
 import subprocess
 import sys
+import os
 import time
-from utils.utils import GUI_SCRIPT, MOTOR_SCRIPT
+from utils.utils import GUI_SCRIPT, MOTOR_SCRIPT, WORKER_SCRIPT, TRACKER_SCRIPT
+from utils.config import load_config, ConfigError
 
 PYTHON_EXEC = sys.executable 
 
-def main():
-    print("==========================================")
-    print("   SUPERVISOR DE PROCESOS - INICIANDO     ")
-    print("==========================================")
-    print(f"[INFO] Python: {PYTHON_EXEC}")
+class TrackerServiceKeeper:
+    """
+    Con t_service activo mantiene vivo el servicio de tracking (tracker_app.py): la cámara
+    y el modelo se abren una vez y GUI y motor se conectan como clientes.
+    """
+    READY_TIMEOUT_S = 15.0
+
+    def __init__(self):
+        try:
+            config = load_config()
+        except ConfigError as e:
+            # La GUI muestra el error y deja corregirlo; sin config válida no hay servicio
+            print(f"[SUPERVISOR] {e}")
+            config = {}
+        self.enabled = bool(config.get('t_service', False))
+        self.proc = None
+        if self.enabled:
+            from backend.tracker_service import socket_path
+            self.path = socket_path(config)
 
+    def ensure(self):
+        if not self.enabled or (self.proc and self.proc.poll() is None): return
+        if self.proc: print(f"[SUPERVISOR] Servicio de tracking caído (Código {self.proc.returncode}). Relanzando...")
+        else: print("\n>>> [SUPERVISOR] Lanzando servicio de tracking...")
+        if os.path.exists(self.path): os.unlink(self.path)
+        self.proc = subprocess.Popen([PYTHON_EXEC, "-u", str(TRACKER_SCRIPT)])
+        # Esperamos al socket: si la GUI llega antes, abriría su propio tracker local
+        deadline = time.time() + self.READY_TIMEOUT_S
+        while time.time() < deadline and self.proc.poll() is None and not os.path.exists(self.path):
+            time.sleep(0.05)
+
+    def stop(self):
+        if self.proc and self.proc.poll() is None:
+            self.proc.terminate()
+            try: self.proc.wait(timeout=5)
+            except subprocess.TimeoutExpired: self.proc.kill()
+
+def run_warm(service):
+    """
+    Modo --warm: un solo worker mantiene el modelo, la cámara y los dispositivos abiertos
+    y alterna GUI/vuelo internamente. Sólo se relanza si el worker falla.
+    """
+    print("[SUPERVISOR] Modo caliente: un worker persistente para GUI y vuelo.")
     while True:
+        service.ensure()
+        print("\n>>> [SUPERVISOR] Lanzando WORKER...")
+        try:
+            code = subprocess.run([PYTHON_EXEC, "-u", str(WORKER_SCRIPT)]).returncode
+        except KeyboardInterrupt:
+            print("\n[SUPERVISOR] Detenido por usuario.")
+            break
+
+        if code == 0:
+            print("[SUPERVISOR] Salida manual (Código 0). Apagando.")
+            break
+        print(f"[SUPERVISOR] Worker crasheó (Código {code}). Reiniciando en 2s...")
+        time.sleep(2)
+
+def run_classic(service):
+    while True:
+        service.ensure()
         # ---------------------------------------------------------
         # FASE 1: EJECUTAR GUI
         # ---------------------------------------------------------
@@ -42,6 +98,7 @@ def main():
         # ---------------------------------------------------------
         # FASE 3: EJECUTAR MOTOR
         # ---------------------------------------------------------
+        service.ensure()
         print("\n>>> [SUPERVISOR] Lanzando MOTOR...")
         try:
             # Agregamos "-u" aquí también
@@ -62,5 +119,18 @@ def main():
         
         time.sleep(0.5)
 
+def main():
+    print("==========================================")
+    print("   SUPERVISOR DE PROCESOS - INICIANDO     ")
+    print("==========================================")
+    print(f"[INFO] Python: {PYTHON_EXEC}")
+
+    service = TrackerServiceKeeper()
+    try:
+        if "--warm" in sys.argv[1:]: run_warm(service)
+        else: run_classic(service)
+    finally:
+        service.stop()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
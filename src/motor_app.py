@@ -10,7 +10,7 @@ from backend.motor import JoystickBackend
 
 # IMPORTACIÓN DE CONFIGURACIÓN
 try:
-    from utils.config import load_config
+    from utils.config import load_config, ConfigError
 except ImportError as e:
     print(f"[MOTOR APP ERROR] No se pudo importar utils.config: {e}")
     sys.exit(1)
@@ -20,6 +20,10 @@ def main():
     #    Esto es crucial: lee el JSON que la GUI acaba de guardar.
     try:
         config = load_config()
+    except ConfigError as e:
+        print(f"[MOTOR APP] Configuración inválida, no se vuela: {e}", flush=True)
+        print("[MOTOR APP] Corrige el archivo o guárdalo de nuevo desde la GUI.", flush=True)
+        sys.exit(1)
     except Exception as e:
         print(f"[MOTOR APP CRITICAL] Error cargando config: {e}", flush=True)
         sys.exit(1)
@@ -0,0 +1,24 @@
+import sys
+import os
+
+# Aseguramos que Python encuentre los módulos en src/
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from backend.tracker_service import TrackerService
+from utils.config import load_config
+
+def main():
+    # Servicio de tracking: dueño de la cámara y del modelo mientras viva el supervisor
+    try:
+        service = TrackerService(load_config())
+    except Exception as e:
+        print(f"[SERVICE] No se pudo iniciar: {e}", flush=True)
+        sys.exit(1)
+    try:
+        service.serve()
+    except KeyboardInterrupt:
+        pass
+    sys.exit(0)
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,159 @@
 import json
+import math
 import os
 # Importamos la ruta absoluta desde paths.py
-from utils.utils import CONFIG_FILE 
+from utils.utils import CONFIG_FILE
 
-DEFAULT_CONFIG = {
-    'radius': 320, 'curve': 2.0, 'deadzone': 0.05, 'snap': 0.08, 'outer': 60,
-    't_sens_x': 7.0, 't_sens_y': 5.0, 't_smooth': 0.5, 't_deadzone': 0.02,
-    't_snap_axis': 0.25, 't_snap_diag': 0.15
+class ConfigError(ValueError):
+    """config1.json ilegible, con tipos inválidos o valores fuera de rango."""
+
+# Esquema único: clave -> (tipo, valor por defecto, mínimo, máximo). None = sin límite.
+# Es la única fuente de defaults: tracker, GUI y motor leen de aquí.
+SCHEMA = {
+    # Stick (RustEngine / RustPhysics)
+    'radius': (int, 320, 10, 5000), 'curve': (float, 2.0, 0.1, 10.0), 'deadzone': (float, 0.05, 0.0, 0.95),
+    'snap': (float, 0.08, 0.0, 1.0), 'outer': (int, 60, 0, 5000),
+    # Head tracking
+    't_sens_x': (float, 7.0, 0.0, 100.0), 't_sens_y': (float, 5.0, 0.0, 100.0),
+    't_smooth': (float, 0.5, 0.0, 100.0), 't_deadzone': (float, 0.02, 0.0, 1.0),
+    't_snap_axis': (float, 0.25, 0.0, 1.0), 't_snap_outer': (float, 0.10, 0.0, 1.0),
+    't_center_drag': (float, 0.01, 0.0, 1.0),
+    # Predicción: adelanto (ms) y desplazamiento máximo extrapolado (unidades de yaw/pitch)
+    't_predict': (bool, False, None, None), 't_predict_horizon_ms': (float, 40.0, 0.0, 200.0),
+    't_predict_max': (float, 0.15, 0.0, 2.0),
+    't_mode': (str, 'video', None, None), 't_roi': (bool, False, None, None),
+    't_roi_size': (int, 192, 32, 1024), 't_roi_margin': (float, 0.35, 0.0, 2.0),
+    # Cámara y fuentes
+    'cam_fourcc': (str, 'MJPG', None, None), 'cam_width': (int, 640, 16, 8192), 'cam_height': (int, 480, 16, 8192),
+    'cam_fps': (float, 60, 1, 1000), 'cam_buffersize': (int, 1, 1, 64), 'cam_auto_mode': (bool, False, None, None),
+    'src_fps': (float, 30.0, 1, 1000),
+    't_record': (str, '', None, None), 't_record_full': (bool, False, None, None),
+    # Procesos y runtime
+    't_push_pose': (bool, True, None, None), 'rt_tracker_hz': (float, 250, 1, 10000),
+    'hud_fps': (float, 60, 1, 1000), 'live_reload': (bool, True, None, None),
+    't_service': (bool, False, None, None), 't_service_socket': (str, '', None, None),
+    'hk_exit': (str, 'alt+p', None, None), 'hk_recenter': (str, 'alt+<, win+<, alt+backslash, win+backslash', None, None),
+}
+
+# Claves de texto que sólo admiten ciertos valores
+CHOICES = {
+    't_mode': ('video', 'live_stream'),
 }
 
+# v1: sin campo 'version'; la fuerza de bordes se llamaba 't_snap_diag'
+CONFIG_VERSION = 2
+
+DEFAULT_CONFIG = {'version': CONFIG_VERSION, **{k: spec[1] for k, spec in SCHEMA.items()}}
+
+def _v1_to_v2(cfg):
+    if 't_snap_diag' in cfg:
+        cfg.setdefault('t_snap_outer', cfg['t_snap_diag'])
+        del cfg['t_snap_diag']
+
+# versión origen -> función que la lleva a la siguiente (modifica el dict en sitio)
+MIGRATIONS = {1: _v1_to_v2}
+
+def migrate(raw):
+    cfg = dict(raw)
+    version = cfg.get('version', 1)
+    if isinstance(version, bool) or not isinstance(version, int) or not 1 <= version <= CONFIG_VERSION:
+        raise ConfigError(f"versión de config desconocida: {version!r} (esta versión entiende hasta {CONFIG_VERSION})")
+    while version < CONFIG_VERSION:
+        MIGRATIONS[version](cfg)
+        version += 1
+    cfg['version'] = CONFIG_VERSION
+    return cfg
+
+def validate_config(config):
+    """Lista de errores (vacía si la config es válida) según SCHEMA. Las claves desconocidas se ignoran."""
+    errors = []
+    for key, (kind, _, lo, hi) in SCHEMA.items():
+        if key not in config: continue
+        value = config[key]
+        if kind is bool:
+            if not isinstance(value, bool): errors.append(f"{key} debe ser true/false")
+        elif kind is str:
+            if not isinstance(value, str): errors.append(f"{key} debe ser texto")
+            elif key in CHOICES and value not in CHOICES[key]:
+                errors.append(f"{key}={value!r} no es uno de {', '.join(CHOICES[key])}")
+        elif isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            errors.append(f"{key} debe ser un número")
+        elif kind is int and value != int(value):
+            errors.append(f"{key} debe ser entero")
+        elif lo is not None and not lo <= value <= hi:
+            errors.append(f"{key}={value} fuera de [{lo}, {hi}]")
+    return errors
+
+def normalize(raw, source="config"):
+    """Migra, completa con los defaults y valida. Lanza ConfigError con todos los problemas."""
+    if not isinstance(raw, dict):
+        raise ConfigError(f"{source}: se esperaba un objeto JSON")
+    cfg = {**DEFAULT_CONFIG, **migrate(raw)}
+    errors = validate_config(cfg)
+    if errors:
+        raise ConfigError(f"{source}: " + "; ".join(errors))
+    return cfg
+
+class Config:
+    """
+    Snapshot inmutable y tipado de la config: atributos planos (sin dict ni defaults)
+    para los bucles calientes. Para cambiarla se crea otro con replace() y se intercambia
+    la referencia, que es atómico.
+    """
+    __slots__ = tuple(SCHEMA)
+
+    def __init__(self, values=None):
+        values = {} if values is None else values
+        errors = validate_config(values)
+        if errors: raise ConfigError("; ".join(errors))
+        for key, (kind, default, _, _) in SCHEMA.items():
+            object.__setattr__(self, key, kind(values.get(key, default)))
+
+    def __setattr__(self, key, value):
+        raise AttributeError("Config es inmutable: usa replace()")
+
+    def __delattr__(self, key):
+        raise AttributeError("Config es inmutable")
+
+    def replace(self, changes):
+        return Config({**self.as_dict(), **changes})
+
+    def as_dict(self):
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    def __repr__(self):
+        return f"Config({self.as_dict()})"
+
+def as_config(config):
+    """Config tal cual; un dict (o None) se completa con los defaults de SCHEMA y se valida."""
+    return config if isinstance(config, Config) else Config(config)
+
+def default_config():
+    return DEFAULT_CONFIG.copy()
+
 def load_config():
+    """Config del disco migrada y completa. Un archivo corrupto o inválido lanza ConfigError."""
     # Usamos CONFIG_FILE (Path object)
     if not CONFIG_FILE.exists():
-        return DEFAULT_CONFIG.copy()
+        return default_config()
     try:
         with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    except:
-        return DEFAULT_CONFIG.copy()
+            raw = json.load(f)
+    except json.JSONDecodeError as e:
+        raise ConfigError(f"{CONFIG_FILE}: JSON inválido (línea {e.lineno}, columna {e.colno}): {e.msg}") from e
+    except OSError as e:
+        raise ConfigError(f"{CONFIG_FILE}: no se pudo leer ({e})") from e
+    return normalize(raw, str(CONFIG_FILE))
 
 def save_config(config):
+    # Escritura atómica (temporal + os.replace): quien vigila el archivo nunca lee un JSON a medias
+    tmp = CONFIG_FILE.with_name(CONFIG_FILE.name + '.tmp')
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=4)
+        with open(tmp, 'w') as f:
+            json.dump({**config, 'version': CONFIG_VERSION}, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, CONFIG_FILE)
         print(f"[CONFIG] Guardada en: {CONFIG_FILE}")
     except Exception as e:
-        print(f"[CONFIG] Error guardando: {e}")
\ No newline at end of file
+        print(f"[CONFIG] Error guardando: {e}")
@@ -0,0 +1,22 @@
+from multiprocessing import shared_memory, resource_tracker
+
+def attach_shared_memory(name):
+    """
+    Abre un bloque de memoria compartida ajeno sin registrarlo en el resource_tracker de
+    este proceso (equivalente a track=False de Python 3.13). Si se registrara, al salir
+    este proceso su tracker haría unlink del bloque y lo borraría para el dueño y el
+    resto de los clientes.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+    # Python < 3.13: SharedMemory registra siempre; lo anulamos sólo durante la apertura.
+    # No usamos unregister(): un hijo spawn comparte el tracker del padre y le borraría
+    # el registro del bloque que el padre sí es dueño.
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
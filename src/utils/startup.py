@@ -0,0 +1,13 @@
+import os
+import time
+
+# Origen de los tiempos de arranque. El supervisor o bench_startup.py lo fijan en AERO_T0
+# (epoch, justo antes de lanzar el proceso); si no, se cuenta desde que se importa este módulo.
+T0 = float(os.environ.get('AERO_T0', 0) or 0) or time.time()
+
+def elapsed_ms():
+    return (time.time() - T0) * 1000.0
+
+def mark(stage):
+    """Marca de arranque en consola: '[STARTUP] etapa: 123.4 ms' (bench_startup.py las lee)."""
+    print(f"[STARTUP] {stage}: {elapsed_ms():.1f} ms", flush=True)
@@ -15,6 +15,8 @@ if str(SRC_DIR) not in sys.path:
 # 3. Rutas a los Scripts Ejecutables (Para el Supervisor)
 GUI_SCRIPT = SRC_DIR / "gui_app.py"
 MOTOR_SCRIPT = SRC_DIR / "motor_app.py"
+WORKER_SCRIPT = SRC_DIR / "worker.py"
+TRACKER_SCRIPT = SRC_DIR / "tracker_app.py"
 
 # 4. Rutas de Datos y Modelos
 # Asumimos que models está en src/models/
@@ -23,6 +25,8 @@ MODEL_PATH = MODELS_DIR / "face_landmarker.task"
 
 # 5. Ruta del archivo de configuración (JSON)
 CONFIG_FILE = SRC_DIR / "config" / "config1.json"
+# Identidad del mouse/teclado elegidos (backend/devices.py)
+DEVICES_FILE = SRC_DIR / "config" / "devices.json"
 
 # --- Debug (Opcional, se ejecuta solo si corres este archivo directamente) ---
 if __name__ == "__main__":
@@ -0,0 +1,81 @@
+import sys
+import os
+import traceback
+
+# Aseguramos que Python encuentre los módulos en src/
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.config import load_config
+
+# Códigos de salida hacia el supervisor (main.py --warm)
+EXIT_CLOSE = 0    # el usuario cerró la GUI: apagar
+EXIT_CRASH = 1    # algo reventó: el supervisor relanza el worker
+
+class WarmWorker:
+    """
+    Proceso caliente: GUI y vuelo son estados de este mismo proceso. El tracker (modelo de
+    MediaPipe cargado y cámara abierta) y el escaneo de dispositivos evdev sobreviven a
+    cada cambio de modo, así ALT+P no vuelve a pagar el arranque en frío.
+    """
+    def __init__(self):
+        self.tracker = None
+        self.devices = None
+
+    def run_gui(self):
+        from gui_app import ConfigLauncher
+        app = ConfigLauncher(tracker=self.tracker, embedded=True)
+        self.tracker = None
+        result = app.run()
+        self.tracker = app.take_tracker()
+        return result
+
+    def run_flight(self):
+        from backend.motor import JoystickBackend
+        config = load_config()  # la GUI acaba de guardarla
+        backend = None
+        try:
+            # Un motor que no arranca (sin Rust, dispositivo ocupado...) vuelve a la GUI, no
+            # revienta el worker: el supervisor lo relanzaría en bucle
+            backend = JoystickBackend(config, tracker=self.tracker, devices=self.devices)
+            status = backend.run()
+        except Exception:
+            print("[WORKER] Error en el vuelo:", flush=True)
+            traceback.print_exc()
+            status = "EXIT"
+        finally:
+            # run() ya limpia al salir del runtime; cleanup() es idempotente y cubre los
+            # retornos tempranos y las excepciones
+            if backend: backend.cleanup()
+        if backend: self.devices = backend.devices
+        if status != "RESTART":
+            # Mismo comportamiento que el supervisor clásico: error del motor -> volvemos a la GUI
+            print(f"[WORKER] El vuelo terminó con estado {status}. Volviendo a la GUI...", flush=True)
+        # Si el tracker murió durante el vuelo, la GUI levantará uno nuevo
+        if self.tracker and not self.tracker.running:
+            self.tracker.stop()
+            self.tracker = None
+
+    def run(self):
+        try:
+            while True:
+                print("\n>>> [WORKER] Estado: GUI", flush=True)
+                if self.run_gui() != 'fly':
+                    return EXIT_CLOSE
+                print("\n>>> [WORKER] Estado: VUELO", flush=True)
+                self.run_flight()
+        finally:
+            if self.tracker: self.tracker.stop()
+
+def main():
+    try:
+        code = WarmWorker().run()
+    except KeyboardInterrupt:
+        code = EXIT_CLOSE
+    except Exception:
+        print("[WORKER] Error fatal:", flush=True)
+        traceback.print_exc()
+        code = EXIT_CRASH
+    sys.exit(code)
+
+if __name__ == "__main__":
+    main()